@@ -0,0 +1,5 @@
+from systems.balance_sweep import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""기존 선형 충돌 루프와 CollisionGrid 브로드페이즈를 엔티티 수별로 비교하는 벤치마크.
+
+    python -m benchmarks.bench_collision [--ticks 600]
+"""
+
+import argparse
+import random
+import time
+
+from config import DISPLAY
+from core.collision import CollisionGrid
+from core.simulation import CAR_SIZE, ENEMY_SIZE
+
+ENTITY_COUNTS = (3, 30, 300)
+
+
+def make_frames(count: int, ticks: int, seed: int = 0) -> list[list[tuple[float, float]]]:
+    """틱별 엔티티 위치를 미리 만들어 두어 이동 비용이 측정에 섞이지 않게 한다."""
+    rng = random.Random(seed)
+    xs = [rng.uniform(50, DISPLAY.width - 100) for _ in range(count)]
+    ys = [rng.uniform(-DISPLAY.height, DISPLAY.height) for _ in range(count)]
+    speeds = [rng.uniform(3.0, 9.0) for _ in range(count)]
+    frames = []
+    for _ in range(ticks):
+        for idx in range(count):
+            ys[idx] += speeds[idx]
+            if ys[idx] > DISPLAY.height + 100:
+                ys[idx] = rng.uniform(-360, -80)
+        frames.append(list(zip(xs, ys)))
+    return frames
+
+
+def car_box():
+    return (DISPLAY.width // 2 - 25, DISPLAY.height - 110, *CAR_SIZE)
+
+
+# 세 방식 모두 틱마다 엔티티 저장소에 새 위치를 쓰는 비용을 포함한다(게임에서도 이동 코드가 쓴다).
+
+
+def run_pygame_rect_loop(frames) -> int:
+    """기존 handle_collisions: 틱마다 적별 pygame.Rect를 새로 만들어 선형 검사."""
+    import pygame
+
+    enemies = [{"x": 0.0, "y": 0.0} for _ in frames[0]]
+    hits = 0
+    for positions in frames:
+        for enemy, (x, y) in zip(enemies, positions):
+            enemy["x"] = x
+            enemy["y"] = y
+        car_rect = pygame.Rect(*car_box())
+        for enemy in enemies:
+            if car_rect.colliderect(pygame.Rect(enemy["x"], enemy["y"], *ENEMY_SIZE)):
+                hits += 1
+    return hits
+
+
+def run_linear_scan(frames) -> int:
+    """pygame 없이 같은 선형 검사."""
+    enemies = [{"x": 0.0, "y": 0.0} for _ in frames[0]]
+    car_x, car_y, car_w, car_h = car_box()
+    enemy_w, enemy_h = ENEMY_SIZE
+    hits = 0
+    for positions in frames:
+        for enemy, (x, y) in zip(enemies, positions):
+            enemy["x"] = x
+            enemy["y"] = y
+        for enemy in enemies:
+            x, y = int(enemy["x"]), int(enemy["y"])
+            if x < car_x + car_w and car_x < x + enemy_w and y < car_y + car_h and car_y < y + enemy_h:
+                hits += 1
+    return hits
+
+
+def run_collision_grid(frames) -> int:
+    grid = CollisionGrid()
+    colliders = [grid.add("enemy", x, y, *ENEMY_SIZE) for x, y in frames[0]]
+    box = car_box()
+    hits = 0
+    for positions in frames:
+        for collider, (x, y) in zip(colliders, positions):
+            collider.x = x
+            collider.y = y
+        grid.refresh()
+        hits += len(grid.query(*box))
+    return hits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="충돌 브로드페이즈 벤치마크")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 중 최솟값을 보고")
+    args = parser.parse_args(argv)
+
+    methods = {"linear_scan": run_linear_scan, "collision_grid": run_collision_grid}
+    try:
+        import pygame  # noqa: F401
+
+        methods = {"pygame_rect_loop": run_pygame_rect_loop, **methods}
+    except ImportError:
+        pass
+
+    print(f"{'entities':>8}  " + "  ".join(f"{name:>18}" for name in methods) + "   (us/tick)")
+    for count in ENTITY_COUNTS:
+        frames = make_frames(count, args.ticks)
+        timings = []
+        expected_hits = None
+        for run in methods.values():
+            best = float("inf")
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                hits = run(frames)
+                best = min(best, time.perf_counter() - started)
+            timings.append(best / args.ticks * 1e6)
+            if expected_hits is not None and hits != expected_hits:
+                raise RuntimeError(f"충돌 결과 불일치: {hits} != {expected_hits}")
+            expected_hits = hits
+        print(f"{count:>8}  " + "  ".join(f"{timing:>18.2f}" for timing in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""적 엔티티 저장 방식(기존 dict vs 슬롯 Enemy)의 메모리와 틱당 갱신 비용 비교.
+
+    python -m benchmarks.bench_entities
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from config import BalanceConfig
+from core.entities import Enemy
+from core.simulation import ENEMY_SIZE, RaceSimulation
+
+ENTITY_COUNTS = (3, 30, 300)
+
+
+def make_dict_enemy(rng: random.Random) -> dict:
+    return {
+        "lane": 1,
+        "target_lane": 1,
+        "x": 175.0,
+        "y": -80.0,
+        "speed_mul": rng.uniform(0.92, 1.15),
+        "ai_timer": rng.randint(25, 110),
+    }
+
+
+def make_slot_enemy(rng: random.Random) -> Enemy:
+    return Enemy(1, 175.0, -80.0, ENEMY_SIZE, rng.uniform(0.92, 1.15), rng.randint(25, 110))
+
+
+def bytes_per_entity(factory, count: int = 10_000) -> float:
+    rng = random.Random(0)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [factory(rng) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+
+def update_dict_enemies(sim: RaceSimulation, enemies: list[dict]):
+    """user-007 이전 RaceSimulation.update_enemies(문자열 키 dict)."""
+    player_lane = sim.player_lane()
+    rng = sim.rng
+    for enemy in enemies:
+        enemy["ai_timer"] -= 1
+        if enemy["ai_timer"] <= 0:
+            enemy["ai_timer"] = rng.randint(30, 100)
+            close_to_player = abs(enemy["y"] - sim.car_y) < 180
+            if close_to_player and rng.random() < 0.65:
+                enemy["target_lane"] = player_lane
+            else:
+                delta = rng.choice([-1, 0, 1])
+                enemy["target_lane"] = max(0, min(len(sim.lane_x) - 1, enemy["lane"] + delta))
+
+        enemy["x"] += (sim.lane_x[enemy["target_lane"]] - enemy["x"]) * 0.13
+        if abs(enemy["x"] - sim.lane_x[enemy["target_lane"]]) < 3:
+            enemy["lane"] = enemy["target_lane"]
+
+        enemy["y"] += sim.enemy_speed * enemy["speed_mul"]
+
+        if enemy["y"] > 700:
+            enemy["y"] = rng.randint(-360, -80)
+            enemy["lane"] = rng.randint(0, len(sim.lane_x) - 1)
+            enemy["target_lane"] = enemy["lane"]
+            enemy["x"] = sim.lane_x[enemy["lane"]]
+            sim.score += 2
+
+
+def time_updates(count: int, ticks: int, repeat: int) -> tuple[float, float]:
+    balance = BalanceConfig(enemy_count=count)
+    best_dict = best_slots = float("inf")
+    for _ in range(repeat):
+        sim = RaceSimulation(0, balance=balance)
+        enemies = [make_dict_enemy(sim.rng) for _ in range(count)]
+        started = time.perf_counter()
+        for _ in range(ticks):
+            update_dict_enemies(sim, enemies)
+        best_dict = min(best_dict, time.perf_counter() - started)
+
+        sim = RaceSimulation(0, balance=balance)
+        started = time.perf_counter()
+        for _ in range(ticks):
+            sim.update_enemies()
+        best_slots = min(best_slots, time.perf_counter() - started)
+    return best_dict / ticks * 1e6, best_slots / ticks * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="엔티티 저장 방식 벤치마크")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 중 최솟값을 보고")
+    args = parser.parse_args(argv)
+
+    print(f"bytes/enemy: dict {bytes_per_entity(make_dict_enemy):.0f}  slots {bytes_per_entity(make_slot_enemy):.0f}")
+    print(f"{'entities':>8}  {'dict':>10}  {'slots':>10}   (us/tick, update_enemies)")
+    for count in ENTITY_COUNTS:
+        dict_us, slot_us = time_updates(count, args.ticks, args.repeat)
+        print(f"{count:>8}  {dict_us:>10.2f}  {slot_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""고스트 레이스 서버 부하 테스트: 로컬호스트에서 시뮬레이션 클라이언트 여러 개를 붙여 틱 시간과 대역폭을 잰다.
+
+    python -m benchmarks.bench_netplay [--clients 32] [--seconds 10] [--client-procs 2]
+
+클라이언트는 서버 틱 측정이 흐려지지 않도록 별도 프로세스에서 돈다. 델타 스냅샷과 전체 스냅샷을 차례로 잰다.
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+from typing import Optional
+
+from core.simulation import TICK_RATE, RaceSimulation, TickInput, dodge_policy
+from systems.netplay import RaceClient, RaceServer
+
+
+class PredictedPolicy:
+    """클라이언트 하나의 자동 조종. 같은 시드의 시뮬레이션을 자기 입력으로 함께 돌려 서버가 보는 적 상태
+    (목표 차선, 판단 타이머, 속도)를 예측하고, 차 상태는 스냅샷으로 보정된 예측기 값으로 맞춘 뒤
+    공용 기준 자동 조종(dodge_policy)에 맡긴다. 입력이 늦어 서버와 어긋나도 차는 스냅샷을 따라간다.
+    """
+
+    def __init__(self, client: RaceClient):
+        self.sim = RaceSimulation(client.seed, client.vehicle_idx)
+        self.last_input: Optional[TickInput] = None
+
+    def __call__(self, client: RaceClient) -> TickInput:
+        sim, car = self.sim, client.predictor.sim
+        if self.last_input is not None:
+            sim.step(self.last_input)
+        sim.car_x, sim.car_velocity_x, sim.player_target_x = car.car_x, car.car_velocity_x, car.player_target_x
+        sim.boost_timer, sim.boost_cooldown = car.boost_timer, car.boost_cooldown
+        self.last_input = dodge_policy(sim)
+        return self.last_input
+
+
+async def run_clients(port: int, seeds: list[int]) -> list[dict]:
+    clients = [RaceClient(seed % 3) for seed in seeds]
+    await asyncio.gather(*(client.connect("127.0.0.1", port) for client in clients))
+    await asyncio.gather(*(client.play(PredictedPolicy(client)) for client in clients))
+    return [
+        {
+            "bytes": client.bytes_received,
+            "snapshots": client.snapshots,
+            "latencies": client.latencies,
+            "corrections": client.predictor.corrections,
+        }
+        for client in clients
+    ]
+
+
+def client_worker(port: int, seeds: list[int], results):
+    results.put(asyncio.run(run_clients(port, seeds)))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] if ordered else 0.0
+
+
+async def run_round(args, seed: int, delta: bool) -> dict:
+    server = RaceServer(
+        args.clients, seed, args.input_delay, args.snapshot_interval, max_ticks=int(args.seconds * TICK_RATE), delta=delta
+    )
+    port = await server.start()
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    client_seeds = [seed * args.clients + idx for idx in range(args.clients)]
+    workers = [
+        context.Process(target=client_worker, args=(port, client_seeds[idx :: args.client_procs], results))
+        for idx in range(args.client_procs)
+    ]
+    for worker in workers:
+        worker.start()
+    await server.finished.wait()
+    loop = asyncio.get_running_loop()
+    clients = []
+    for _ in workers:
+        clients += await loop.run_in_executor(None, results.get)
+    for worker in workers:
+        worker.join()
+    return {
+        "ticks": server.tick,
+        "tick_times": server.tick_times,
+        "bytes": sum(client["bytes"] for client in clients),
+        "snapshots": sum(client["snapshots"] for client in clients),
+        "latencies": [latency for client in clients for latency in client["latencies"]],
+        "corrections": sum(client["corrections"] for client in clients),
+        "late_inputs": sum(player.late_inputs for player in server.players),
+    }
+
+
+def measure(args, delta: bool) -> dict:
+    """라운드는 모두 충돌하면 일찍 끝나므로 --seconds만큼 틱이 쌓일 때까지 시드를 바꿔 이어 돈다."""
+    total = {"ticks": 0, "tick_times": [], "bytes": 0, "snapshots": 0, "latencies": [], "corrections": 0, "late_inputs": 0}
+    seed = args.seed
+    while total["ticks"] < args.seconds * TICK_RATE:
+        for key, value in asyncio.run(run_round(args, seed, delta)).items():
+            total[key] += value
+        seed += 1
+    seconds = total["ticks"] / TICK_RATE
+    return {
+        "rounds": seed - args.seed,
+        "ticks": total["ticks"],
+        "tick_p50": percentile(total["tick_times"], 0.5) * 1e3,
+        "tick_p99": percentile(total["tick_times"], 0.99) * 1e3,
+        "down_bps": total["bytes"] / args.clients / seconds,
+        "snapshot_bytes": total["bytes"] / max(1, total["snapshots"]),
+        "latency_p50": percentile(total["latencies"], 0.5) * 1e3,
+        "latency_p99": percentile(total["latencies"], 0.99) * 1e3,
+        "corrections": total["corrections"],
+        "late_inputs": total["late_inputs"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="고스트 레이스 서버 부하 테스트")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=10.0, help="측정할 게임 시간(초)")
+    parser.add_argument("--client-procs", type=int, default=2, help="클라이언트를 나눠 돌릴 프로세스 수")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--input-delay", type=int, default=3)
+    parser.add_argument("--snapshot-interval", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"clients={args.clients} seconds={args.seconds} input_delay={args.input_delay}")
+    for label, delta in (("delta", True), ("full", False)):
+        stats = measure(args, delta)
+        print(
+            f"{label:>5}: {stats['rounds']}라운드 {stats['ticks']}틱  server tick p50 {stats['tick_p50']:.3f}ms p99 {stats['tick_p99']:.3f}ms  "
+            f"down {stats['down_bps'] / 1024:.2f}KiB/s/client ({stats['snapshot_bytes']:.1f}B/snapshot)  "
+            f"input->snapshot p50 {stats['latency_p50']:.1f}ms p99 {stats['latency_p99']:.1f}ms  "
+            f"corrections {stats['corrections']}  late inputs {stats['late_inputs']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""시작 시 에셋 로딩 시간 비교 (즉시 로드 vs 디스크 캐시 콜드/웜 + 지연 효과음).
+
+    SDL_VIDEODRIVER=dummy SDL_AUDIODRIVER=dummy python -m benchmarks.bench_startup
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+
+import pygame
+
+from config import ASSETS, DISPLAY
+from systems.resource_loader import ResourceLoader
+
+
+def load_assets(loader: ResourceLoader, lazy: bool, audio: bool) -> float:
+    started = time.perf_counter()
+    loader.load_image(ASSETS.car_image, (50, 90), (30, 180, 255))
+    loader.load_image(ASSETS.obstacle_image, (50, 80), (220, 100, 20))
+    if audio:
+        loader.load_sound(ASSETS.crash_sfx, volume=0.8, lazy=lazy)
+        loader.load_bgm(ASSETS.bgm, volume=0.5)
+    return (time.perf_counter() - started) * 1e3
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="에셋 로딩 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 측정 중 최솟값을 보고")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    pygame.init()
+    try:
+        pygame.mixer.init()
+        audio = True
+    except pygame.error:  # 오디오 장치가 없으면 AudioManager처럼 소리 없이 진행한다.
+        audio = False
+    pygame.display.set_mode((DISPLAY.width, DISPLAY.height))
+    print(f"pygame init + set_mode: {(time.perf_counter() - started) * 1e3:.1f} ms")
+    if not audio:
+        print("mixer를 열 수 없어 효과음/배경음 로딩은 빼고 잽니다")
+
+    cache_dir = tempfile.mkdtemp(prefix="asset-cache-")
+    try:
+        eager = min(load_assets(ResourceLoader(), lazy=False, audio=audio) for _ in range(args.repeat))
+        cold = []
+        for _ in range(args.repeat):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(load_assets(ResourceLoader(cache_dir=cache_dir), lazy=True, audio=audio))
+        warm = min(load_assets(ResourceLoader(cache_dir=cache_dir), lazy=True, audio=audio) for _ in range(args.repeat))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    print(f"assets, eager (기존):        {eager:.2f} ms")
+    print(f"assets, cache cold + lazy:  {min(cold):.2f} ms")
+    print(f"assets, cache warm + lazy:  {warm:.2f} ms")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""SDL 더미 드라이버로 게임 루프 주요 경로를 재고 JSON으로 저장/비교하는 벤치마크 스위트.
+
+    python -m benchmarks.suite --output benchmarks/results/HEAD.json
+    python -m benchmarks.suite --baseline benchmarks/results/main.json --threshold 0.15
+
+--baseline을 주면 지표마다 기준 대비 변화율을 출력하고, threshold보다 나빠진 지표가 있으면
+종료 코드 1로 끝난다(CI에서 회귀 검사용).
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from config import BalanceConfig
+from core.simulation import TRACK_THEMES, RaceSimulation, dodge_policy
+
+ENEMY_COUNTS = (3, 30, 300)
+WINDOW_SIZES = ((720, 1280), (1080, 1920))
+
+
+class Results:
+    def __init__(self):
+        self.metrics: dict[str, dict] = {}
+
+    def add(self, name: str, value: float, unit: str, higher_is_better: bool):
+        self.metrics[name] = {"value": round(value, 4), "unit": unit, "higher_is_better": higher_is_better}
+        print(f"  {name:<40} {value:>14,.3f} {unit}", file=sys.stderr)
+
+
+def best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_simulation(results: Results, scale: float, repeat: int):
+    ticks = int(20_000 * scale)
+
+    def run():
+        seed = 0
+        done = 0
+        while done < ticks:
+            sim = RaceSimulation(seed)
+            while not sim.game_over and done < ticks:
+                sim.step(dodge_policy(sim))
+                done += 1
+            seed += 1
+
+    results.add("sim.ticks_per_s", ticks / best_of(repeat, run), "ticks/s", True)
+
+    try:
+        from core.batch import dodge_policy as batch_policy, simulate_batch
+    except ImportError:
+        return  # NumPy가 없으면 배치 엔진 지표는 건너뛴다.
+
+    rounds = int(2000 * scale)
+    round_ticks = 0
+
+    def run_batch():
+        nonlocal round_ticks
+        round_ticks = sum(result.ticks for result in simulate_batch(range(rounds), 0, batch_policy))
+
+    elapsed = best_of(repeat, run_batch)
+    results.add("batch.round_ticks_per_s", round_ticks / elapsed, "ticks/s", True)
+
+
+def bench_collisions(results: Results, scale: float, repeat: int):
+    ticks = int(2000 * scale)
+    for count in ENEMY_COUNTS:
+        sim = RaceSimulation(0, balance=BalanceConfig(enemy_count=count))
+        elapsed = 0.0
+        for _ in range(repeat):
+            total = 0.0
+            for _ in range(ticks):
+                sim.update_enemies()
+                started = time.perf_counter()
+                sim.handle_collisions()
+                total += time.perf_counter() - started
+            elapsed = total if not elapsed else min(elapsed, total)
+        results.add(f"collision.handle_us.enemies_{count}", elapsed / ticks * 1e6, "us/tick", False)
+
+
+def make_game(save_dir: str, window_size=None):
+    """벤치마크용 게임 인스턴스. 세션 리플레이와 텔레메트리를 남기지 않고 점수는 임시 디렉터리에 저장한다."""
+    from core.game import CarRaceGame
+    from systems.save_system import SaveSystem
+
+    return CarRaceGame(
+        window_size=window_size,
+        record_replays=False,
+        telemetry=False,
+        save_system=SaveSystem(os.path.join(save_dir, "highscore.json")),
+    )
+
+
+STARTUP_PROBE = """
+import sys, time
+started = time.perf_counter()
+from benchmarks.suite import make_game
+game = make_game(sys.argv[1])
+print((time.perf_counter() - started) * 1e3)
+game.save_system.close()
+"""
+
+
+def bench_startup(results: Results, save_dir: str, repeat: int):
+    """새 프로세스에서 import + CarRaceGame.__init__까지 걸린 시간(pygame 초기화 포함)."""
+    best = float("inf")
+    for _ in range(repeat):
+        probe = subprocess.run(
+            [sys.executable, "-c", STARTUP_PROBE, save_dir], capture_output=True, text=True, check=True
+        )
+        best = min(best, float(probe.stdout.strip().splitlines()[-1]))
+    results.add("startup.game_init_ms", best, "ms", False)
+
+
+def bench_rendering(results: Results, save_dir: str, scale: float, repeat: int):
+    from core.scenes import PlayingScene
+
+    game = make_game(save_dir)
+    game.show_frame_time = False
+    game.update_profiling()
+    scene = game.scenes.replace(PlayingScene(game))
+    frames = int(300 * scale)
+
+    for theme in TRACK_THEMES:
+        for mode, render in (("full", scene.render_full), ("dirty", scene.render_dirty)):
+            game.reset_round(0)
+            game.sim.theme = theme
+            scene.render_full()
+
+            def run():
+                sim = game.sim
+                for _ in range(frames):
+                    if sim.step(dodge_policy(sim)):
+                        sim.reset(sim.seed)
+                        sim.theme = theme
+                    render()
+
+            results.add(f"render.{mode}_fps.{theme.name}", frames / best_of(repeat, run), "frames/s", True)
+
+    draws = int(2000 * scale)
+    for count in ENEMY_COUNTS:
+        game.sim = RaceSimulation(0, balance=BalanceConfig(enemy_count=count))
+        game.sim.shield_active = True
+        game.snapshot_positions()
+
+        def draw_sprites():
+            for _ in range(draws):
+                scene.draw_dynamic_layers()
+
+        results.add(f"render.sprites_us.enemies_{count}", best_of(repeat, draw_sprites) / draws * 1e6, "us", False)
+
+    def draw_hud():
+        for _ in range(draws):
+            game.draw_hud()
+
+    results.add("hud.draw_ms", best_of(repeat, draw_hud) / draws * 1e3, "ms", False)
+    game.scenes.clear()
+    game.save_system.close()
+
+
+def bench_resolutions(results: Results, save_dir: str, scale: float, repeat: int):
+    """창 해상도별 더티 렌더 속도. 정적 레이어/스프라이트를 창 해상도로 구워 두므로 크게 떨어지지 않아야 한다."""
+    from core.scenes import PlayingScene
+
+    frames = int(300 * scale)
+    for size in WINDOW_SIZES:
+        game = make_game(save_dir, size)
+        game.show_frame_time = False
+        scene = game.scenes.replace(PlayingScene(game))
+        game.reset_round(0)
+        scene.render_full()
+
+        def run():
+            sim = game.sim
+            for _ in range(frames):
+                if sim.step(dodge_policy(sim)):
+                    sim.reset(sim.seed)
+                scene.render_dirty()
+
+        results.add(f"render.dirty_fps.{size[0]}x{size[1]}", frames / best_of(repeat, run), "frames/s", True)
+        game.scenes.clear()
+        game.save_system.close()
+
+
+def bench_save(results: Results, save_dir: str, repeat: int):
+    from systems.save_system import SaveSystem
+
+    submit_best = flush_best = float("inf")
+    for attempt in range(repeat):
+        save_system = SaveSystem(os.path.join(save_dir, f"save-{attempt}.json"))
+        started = time.perf_counter()
+        save_system.submit_score(100 + attempt, "Sprint", TRACK_THEMES[0].name)
+        submitted = time.perf_counter()
+        save_system.close()
+        flushed = time.perf_counter()
+        submit_best = min(submit_best, submitted - started)
+        flush_best = min(flush_best, flushed - started)
+    results.add("save.submit_us", submit_best * 1e6, "us", False)
+    results.add("save.durable_ms", flush_best * 1e3, "ms", False)
+
+
+def bench_telemetry(results: Results, save_dir: str, scale: float, repeat: int):
+    """게임 스레드가 내는 비용(emit 한 번)과, 이벤트를 켠 채 도는 시뮬레이션 속도."""
+    from core.events import EVENT_LANE_CHANGE
+    from systems.telemetry import TelemetryLog
+
+    telemetry = TelemetryLog(os.path.join(save_dir, "telemetry"), capacity=1 << 16, flush_seconds=0.05)
+    emits = int(50_000 * scale)
+
+    emit = telemetry.emit
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for tick in range(emits):
+            emit(EVENT_LANE_CHANGE, tick, 1, 240)
+        best = min(best, time.perf_counter() - started)
+        while telemetry.ring.head != telemetry.ring.tail:
+            time.sleep(0.001)  # 다음 측정 전에 기록 스레드가 버퍼를 비우게 둔다.
+    results.add("telemetry.emit_ns", best / emits * 1e9, "ns", False)
+
+    ticks = int(20_000 * scale)
+
+    def run_sim():
+        seed = 0
+        done = 0
+        while done < ticks:
+            sim = RaceSimulation(seed)
+            sim.telemetry = telemetry
+            telemetry.begin_round(seed, 0)
+            while not sim.game_over and done < ticks:
+                sim.step(dodge_policy(sim))
+                done += 1
+            telemetry.end_round(sim.frame_counter, sim.score, sim.game_over)
+            seed += 1
+
+    results.add("telemetry.sim_ticks_per_s", ticks / best_of(repeat, run_sim), "ticks/s", True)
+    telemetry.close()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_suite(scale: float, repeat: int) -> dict:
+    results = Results()
+    with tempfile.TemporaryDirectory(prefix="bench-") as save_dir:
+        bench_simulation(results, scale, repeat)
+        bench_collisions(results, scale, repeat)
+        bench_startup(results, save_dir, repeat)
+        bench_rendering(results, save_dir, scale, repeat)
+        bench_resolutions(results, save_dir, scale, repeat)
+        bench_save(results, save_dir, repeat)
+        bench_telemetry(results, save_dir, scale, repeat)
+
+    import pygame
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "scale": scale,
+        "metrics": results.metrics,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """threshold(비율)보다 나빠진 지표 이름 목록. 기준에 없는 지표는 비교하지 않는다."""
+    regressions = []
+    print(f"\n기준 {baseline.get('revision', '?')} 대비 (허용 {threshold:.0%})")
+    if baseline.get("scale") != current["scale"]:
+        print("  주의: 기준과 측정 규모(--quick)가 달라 배치/렌더 지표는 직접 비교하기 어렵습니다.")
+    for name, metric in current["metrics"].items():
+        base = baseline.get("metrics", {}).get(name)
+        if not base or not base["value"]:
+            continue
+        change = metric["value"] / base["value"] - 1
+        worse = -change if metric["higher_is_better"] else change
+        status = "REGRESSION" if worse > threshold else ""
+        if status:
+            regressions.append(name)
+        print(f"  {name:<40} {base['value']:>14,.3f} -> {metric['value']:>14,.3f}  {change:+7.1%} {status}")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="게임 루프 벤치마크 스위트")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀로 볼 악화 비율")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 중 최솟값을 보고")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수를 줄여 빠르게 실행")
+    args = parser.parse_args(argv)
+
+    current = run_suite(scale=0.2 if args.quick else 1.0, repeat=args.repeat)
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            regressions = compare(current, json.load(file), args.threshold)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
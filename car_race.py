@@ -1,5 +1,45 @@
+import argparse
+
+from config import SAVE, TELEMETRY
 from core.game import CarRaceGame
+from systems.viewport import parse_size
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="자동차 경주")
+    parser.add_argument("--replay", metavar="PATH", help="기록된 리플레이(.crr) 재생")
+    parser.add_argument("--rate", type=float, default=1.0, help="리플레이 재생 배속")
+    parser.add_argument("--headless", action="store_true", help="창 없이 최대 속도로 리플레이를 재시뮬레이션")
+    parser.add_argument("--trace", metavar="PATH", help="프레임별 구간 시간을 JSONL로 기록")
+    parser.add_argument("--profile", metavar="PATH", help="설정 프로필(TOML/JSON). 실행 중 파일을 고치면 다음 라운드부터 적용")
+    parser.add_argument("--record", action="store_true", default=SAVE.record_replays, help="플레이 세션을 replays/에 리플레이로 기록")
+    parser.add_argument("--telemetry", action="store_true", default=TELEMETRY.enabled, help="라운드 이벤트를 telemetry/에 기록")
+    parser.add_argument("--window", metavar="WxH", help="창 해상도 (예: 1080x1920). 레이아웃은 논리 해상도 기준으로 확대")
+    args = parser.parse_args()
+    try:
+        args.window = parse_size(args.window) if args.window else None
+    except ValueError as error:
+        parser.error(str(error))
+    return args
 
 
 if __name__ == "__main__":
-    CarRaceGame().run()
+    args = parse_args()
+    if args.replay and args.headless:
+        from systems.config_profile import DEFAULT_PROFILE, load_profile
+        from systems.replay import replay_headless
+
+        profile = load_profile(args.profile) if args.profile else DEFAULT_PROFILE
+        for idx, check in enumerate(replay_headless(args.replay, profile), start=1):
+            status = "OK" if check.matches else f"MISMATCH (기록 {check.expected_ticks}틱/{check.expected_score}점)"
+            print(f"라운드 {idx}: seed={check.result.seed} {check.result.ticks}틱 {check.result.score}점 {status}")
+    else:
+        CarRaceGame(
+            replay_path=args.replay,
+            playback_rate=args.rate,
+            trace_path=args.trace,
+            profile_path=args.profile,
+            window_size=args.window,
+            record_replays=args.record,
+            telemetry=args.telemetry,
+        ).run()
@@ -5,10 +5,20 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class DisplayConfig:
-    width: int = 400
+    width: int = 400  # 논리 해상도. 시뮬레이션과 레이아웃은 이 좌표로 계산한다.
     height: int = 600
-    fps: int = 60
+    window_width: int = 0  # 창(물리) 해상도. 0이면 논리 해상도와 같고, 다르면 종횡비를 지켜 확대/레터박스한다.
+    window_height: int = 0
+    fps: int = 60  # 시뮬레이션 틱 속도(고정)
+    max_render_fps: int = 120  # 0이면 제한 없음
+    idle_render_fps: int = 20  # 메뉴/일시정지/게임오버처럼 화면이 거의 멈춘 씬의 렌더 상한
+    max_catch_up_ticks: int = 5  # 렌더 프레임 하나당 따라잡을 최대 틱 수
+    interpolate_rendering: bool = True
     title: str = "🚗 자동차 경주 (Advanced Edition)"
+    dirty_rect_rendering: bool = True
+    show_frame_time: bool = False
+    text_cache_size: int = 128
+    profile_trace_dir: str = "profiles"
 
 
 @dataclass(frozen=True)
@@ -34,9 +44,62 @@ class ItemConfig:
     shield_size: tuple[int, int] = (28, 28)
 
 
+@dataclass(frozen=True)
+class TrackConfig:
+    streaming: bool = False  # 켜면 게임/리플레이/내보내기가 절차적 트랙을 쓴다. 밸런스 스윕/학습 환경은 항상 고정 도로라 기본은 끔.
+    min_segment_length: int = 1500  # 스크롤 거리(px)
+    max_segment_length: int = 3000
+    chunk_segments: int = 8
+    theme_run_segments: int = 4
+    lane_counts: tuple[int, ...] = (2, 3, 3, 4)
+    max_curve: float = 0.35
+    hazard_chance: float = 0.45
+    max_hazards_per_segment: int = 2
+    hazard_size: tuple[int, int] = (60, 18)
+
+
+@dataclass(frozen=True)
+class AIConfig:
+    difficulty: str = "normal"  # core.enemy_ai.AI_PROFILES의 키
+
+
+@dataclass(frozen=True)
+class ProfileConfig:
+    path: str = ""  # 설정 프로필(TOML/JSON). 비워 두면 이 파일의 기본값으로 돈다(car_race.py --profile로도 지정).
+    hot_reload: bool = True  # 파일이 바뀌면 다음 라운드부터 새 프로필을 쓴다.
+    poll_seconds: float = 1.0
+
+
 @dataclass(frozen=True)
 class SaveConfig:
     highscore_file: str = "highscore.json"
+    leaderboard_size: int = 10
+    record_replays: bool = False  # 플레이 세션을 replays/에 기록한다(car_race.py --record로도 켠다).
+    replay_dir: str = "replays"
+
+
+@dataclass(frozen=True)
+class TelemetryConfig:
+    enabled: bool = False  # 라운드 이벤트를 압축 로그로 남긴다(car_race.py --telemetry로도 켠다, telemetry_report.py로 집계). 리플레이 재생 중에는 끈다.
+    directory: str = "telemetry"
+    capacity: int = 8192  # 링 버퍼 칸 수(2의 거듭제곱). 기록이 밀려 가득 차면 새 이벤트를 버린다.
+    flush_seconds: float = 1.0
+    rotate_bytes: int = 1 << 20  # 압축 전 바이트 기준
+    max_files: int = 50
+    cabinet: str = ""  # 로그에 남길 기기 이름. 비우면 호스트 이름
+
+
+@dataclass(frozen=True)
+class ExportConfig:
+    fps: int = 30  # 내보내는 영상 프레임 수(시뮬레이션은 DisplayConfig.fps 틱으로 돈다)
+    slots: int = 8  # 작업 프로세스와 공유하는 프레임 버퍼 수
+    png_workers: int = 2  # PNG 시퀀스를 저장하는 작업 프로세스 수(동영상은 항상 1)
+
+
+@dataclass(frozen=True)
+class AudioConfig:
+    channels: int = 8
+    threaded: bool = True
 
 
 @dataclass(frozen=True)
@@ -45,13 +108,22 @@ class AssetConfig:
     obstacle_image: str = "obstacle.png"
     bgm: str = "bgm.mp3"
     crash_sfx: str = "crash.wav"
+    boost_sfx: str = "boost.wav"  # 파일이 없으면 해당 효과음은 울리지 않는다.
+    shield_sfx: str = "shield.wav"
+    cache_dir: str = ".asset_cache"
 
 
 DISPLAY = DisplayConfig()
 BALANCE = BalanceConfig()
 ITEMS = ItemConfig()
+TRACK = TrackConfig()
+AI = AIConfig()
+PROFILE = ProfileConfig()
 SAVE = SaveConfig()
+TELEMETRY = TelemetryConfig()
+EXPORT = ExportConfig()
 ASSETS = AssetConfig()
+AUDIO = AudioConfig()
 
 WHITE = (255, 255, 255)
 GRAY = (60, 60, 60)
@@ -0,0 +1,487 @@
+"""NumPy 기반 배치 시뮬레이터: 라운드 N개를 구조체-배열(SoA)로 한꺼번에 진행한다."""
+
+from typing import Callable, Optional, Sequence, Union
+
+import numpy as np
+
+from config import AI, BALANCE, DISPLAY, ITEMS, BalanceConfig, ItemConfig
+from core.enemy_ai import AI_PROFILES, AIProfile, choose_lane
+from core.simulation import (
+    AUTOPILOT_CUT_IN_TICKS,
+    AUTOPILOT_HORIZON,
+    AUTOPILOT_INNER_BONUS,
+    AUTOPILOT_STAY_BONUS,
+    AUTOPILOT_TRANSIT_TICKS,
+    AUTOPILOT_TRIM,
+    CAR_MAX_X,
+    CAR_MIN_X,
+    CAR_SIZE,
+    ENEMY_LANE_DECAY,
+    ENEMY_LANE_SNAP,
+    ENEMY_SIZE,
+    SWIPE_DISTANCE,
+    TICK_RATE,
+    TRACK_THEMES,
+    VEHICLES,
+    RaceSimulation,
+    RoundResult,
+)
+
+BatchPolicy = Callable[["BatchSimulation"], dict]
+
+
+class BatchSimulation:
+    """RaceSimulation과 같은 시드/입력이면 같은 결과를 내는 벡터화 엔진.
+
+    산술은 라운드 축으로 벡터화하고, 적 슬롯은 원본과 같은 순서로 열 단위로 돈다
+    (앞 적의 리스폰이 같은 틱 뒤 적의 속도에 영향을 주기 때문). 드물게 일어나는
+    난수 이벤트(AI 타이머 만료, 리스폰, 실드 생성)만 해당 라운드의 random.Random으로
+    뽑으므로 난수열이 RaceSimulation과 정확히 같다. 끝난 라운드는 결과를 기록한 뒤
+    활성 배열에서 제거한다.
+    """
+
+    ROUND_FIELDS = (
+        "round_ids",
+        "theme_idx",
+        "frame_counter",
+        "score",
+        "car_x",
+        "car_velocity_x",
+        "player_target_x",
+        "enemy_speed",
+        "line_speed",
+        "line_ys",
+        "enemy_x",
+        "enemy_y",
+        "enemy_lane",
+        "enemy_target_lane",
+        "enemy_speed_mul",
+        "enemy_ai_timer",
+        "enemy_blocking",
+        "enemy_tracked_lane",
+        "traffic",
+        "blockers",
+        "shield_active",
+        "has_shield_item",
+        "shield_x",
+        "shield_y",
+        "next_shield_spawn",
+        "boost_timer",
+        "boost_cooldown",
+        "boost_used_in_round",
+        "mission_no_boost",
+        "mission_target",
+        "mission_completed",
+        "mission_failed",
+        "accel",
+        "max_speed",
+        "snap_factor",
+    )
+
+    def __init__(
+        self,
+        seeds: Sequence[int],
+        vehicle_idx: Union[int, Sequence[int]] = 0,
+        vehicles=VEHICLES,
+        track_themes=TRACK_THEMES,
+        balance: BalanceConfig = BALANCE,
+        items: ItemConfig = ITEMS,
+        ai_profile: Optional[AIProfile] = None,
+    ):
+        self.vehicles = vehicles
+        self.track_themes = track_themes
+        self.balance = balance
+        self.items = items
+        self.ai_profile = ai_profile or AI_PROFILES[AI.difficulty]
+        self.reset(seeds, vehicle_idx)
+
+    @property
+    def active_count(self) -> int:
+        return len(self.round_ids)
+
+    def reset(self, seeds: Sequence[int], vehicle_idx: Union[int, Sequence[int]] = 0):
+        self.seeds: list[int] = []
+        self.vehicle_idx: list[int] = []
+        self.results: list[Optional[RoundResult]] = []
+        self.rngs = []
+
+        template = RaceSimulation(0, 0, self.vehicles, self.track_themes, self.balance, self.items, ai_profile=self.ai_profile)
+        self.lane_x = np.array(template.lane_x, dtype=np.int64)
+        self.car_y = template.car_y
+        for name, values in self._round_arrays([template]).items():
+            setattr(self, name, values[:0])
+        self.add_rounds(seeds, vehicle_idx)
+
+    def add_rounds(
+        self,
+        seeds: Sequence[int],
+        vehicle_idx: Union[int, Sequence[int]] = 0,
+        round_ids: Optional[Sequence[int]] = None,
+    ) -> np.ndarray:
+        """새 라운드를 활성 배열 끝에 붙이고 부여한 라운드 번호(results 인덱스)를 반환한다.
+
+        round_ids를 주면 이미 끝난(결과를 읽은) 라운드 번호를 재사용해 그 자리의 seeds/vehicle_idx/results를
+        덮어쓴다. 끝없이 라운드를 이어 붙이는 쪽(VectorRaceEnv)은 이렇게 해야 기록이 늘어나지 않는다.
+        """
+        seeds = [int(seed) for seed in seeds]
+        if isinstance(vehicle_idx, (int, np.integer)):
+            vehicle_idx = [vehicle_idx] * len(seeds)
+        vehicle_idx = [int(idx) for idx in vehicle_idx]
+
+        # 초기 상태(난수 소비 순서 포함)는 RaceSimulation.reset을 그대로 재사용한다.
+        sims = [
+            RaceSimulation(seed, veh, self.vehicles, self.track_themes, self.balance, self.items, ai_profile=self.ai_profile)
+            for seed, veh in zip(seeds, vehicle_idx)
+        ]
+        if round_ids is None:
+            new_ids = np.arange(len(self.seeds), len(self.seeds) + len(sims), dtype=np.int64)
+            self.seeds += seeds
+            self.vehicle_idx += vehicle_idx
+            self.results += [None] * len(sims)
+        else:
+            new_ids = np.asarray(round_ids, dtype=np.int64)
+            if len(new_ids) != len(sims):
+                raise ValueError(f"round_ids 수({len(new_ids)})가 시드 수({len(sims)})와 다릅니다")
+            for round_id, seed, veh in zip(new_ids.tolist(), seeds, vehicle_idx):
+                if self.results[round_id] is None:
+                    raise ValueError(f"아직 끝나지 않은 라운드 번호는 재사용할 수 없습니다: {round_id}")
+                self.seeds[round_id], self.vehicle_idx[round_id], self.results[round_id] = seed, veh, None
+        self.rngs += [sim.rng for sim in sims]
+
+        arrays = self._round_arrays(sims)
+        arrays["round_ids"] = new_ids
+        for name in self.ROUND_FIELDS:
+            setattr(self, name, np.concatenate([getattr(self, name), arrays[name]]))
+        return new_ids
+
+    def _round_arrays(self, sims: list[RaceSimulation]) -> dict[str, np.ndarray]:
+        count = len(sims)
+        enemy_count = self.balance.enemy_count
+
+        def column(values, dtype):
+            return np.array(values, dtype=dtype).reshape(count, enemy_count)
+
+        stats = [sim.vehicle for sim in sims]
+        return {
+            "round_ids": np.zeros(count, dtype=np.int64),
+            "theme_idx": np.array([self.track_themes.index(sim.theme) for sim in sims], dtype=np.int64),
+            "frame_counter": np.zeros(count, dtype=np.int64),
+            "score": np.zeros(count, dtype=np.int64),
+            "car_x": np.array([sim.car_x for sim in sims], dtype=np.float64),
+            "car_velocity_x": np.zeros(count, dtype=np.float64),
+            "player_target_x": np.array([sim.player_target_x for sim in sims], dtype=np.int64),
+            "enemy_speed": np.full(count, self.balance.initial_enemy_speed, dtype=np.float64),
+            "line_speed": np.full(count, self.balance.initial_line_speed, dtype=np.float64),
+            "line_ys": np.array([sim.line_ys for sim in sims], dtype=np.int64).reshape(count, -1),
+            "enemy_x": column([enemy.x for sim in sims for enemy in sim.enemies], np.float64),
+            "enemy_y": column([enemy.y for sim in sims for enemy in sim.enemies], np.float64),
+            "enemy_lane": column([enemy.lane for sim in sims for enemy in sim.enemies], np.int64),
+            "enemy_target_lane": column([enemy.target_lane for sim in sims for enemy in sim.enemies], np.int64),
+            "enemy_speed_mul": column([enemy.speed_mul for sim in sims for enemy in sim.enemies], np.float64),
+            "enemy_ai_timer": column([enemy.ai_timer for sim in sims for enemy in sim.enemies], np.int64),
+            "enemy_blocking": column([enemy.blocking for sim in sims for enemy in sim.enemies], bool),
+            "enemy_tracked_lane": column([enemy.tracked_lane for sim in sims for enemy in sim.enemies], np.int64),
+            "traffic": np.array([sim.ai.traffic for sim in sims], dtype=np.int64).reshape(count, -1),
+            "blockers": np.array([sim.ai.blockers for sim in sims], dtype=np.int64),
+            "shield_active": np.zeros(count, dtype=bool),
+            "has_shield_item": np.zeros(count, dtype=bool),
+            "shield_x": np.zeros(count, dtype=np.int64),
+            "shield_y": np.zeros(count, dtype=np.int64),
+            "next_shield_spawn": np.full(count, self.items.shield_spawn_interval_frames, dtype=np.int64),
+            "boost_timer": np.zeros(count, dtype=np.int64),
+            "boost_cooldown": np.zeros(count, dtype=np.int64),
+            "boost_used_in_round": np.zeros(count, dtype=bool),
+            "mission_no_boost": np.array([sim.mission["type"] == "no_boost" for sim in sims], dtype=bool),
+            "mission_target": np.array([sim.mission["target_frames"] for sim in sims], dtype=np.int64),
+            "mission_completed": np.zeros(count, dtype=bool),
+            "mission_failed": np.zeros(count, dtype=bool),
+            "accel": np.array([stat.acceleration for stat in stats], dtype=np.float64),
+            "max_speed": np.array([min(stat.max_speed, self.balance.max_player_speed) for stat in stats], dtype=np.float64),
+            "snap_factor": np.array([self.balance.lane_change_speed + stat.handling for stat in stats], dtype=np.float64),
+        }
+
+    def step(self, left=None, right=None, boost=None, swipe=None) -> np.ndarray:
+        """활성 라운드 전체를 한 틱 진행한다.
+
+        입력 배열은 활성 라운드 순서(round_ids)를 따르며 None이면 모두 미입력이다.
+        이번 틱에 충돌로 끝난 라운드의 원래 인덱스를 반환한다.
+        """
+        if self.active_count == 0:
+            return np.zeros(0, dtype=np.int64)
+        balance = self.balance
+
+        if boost is not None:
+            self.activate_boost(np.asarray(boost, dtype=bool))
+        if swipe is not None:
+            swipe = np.asarray(swipe)
+            shifted_right = np.minimum(self.player_target_x + SWIPE_DISTANCE, self.lane_x[-1])
+            shifted_left = np.maximum(self.player_target_x - SWIPE_DISTANCE, self.lane_x[0])
+            self.player_target_x = np.where(swipe > 0, shifted_right, np.where(swipe < 0, shifted_left, self.player_target_x))
+
+        self.frame_counter += 1
+
+        max_speed = self.max_speed + np.where(self.boost_timer > 0, balance.boost_extra_speed, 0.0)
+        velocity = self.car_velocity_x * 0.85
+        if right is not None:
+            velocity = np.where(np.asarray(right, dtype=bool), self.car_velocity_x + self.accel, velocity)
+        if left is not None:
+            velocity = np.where(np.asarray(left, dtype=bool), self.car_velocity_x - self.accel, velocity)
+        self.car_velocity_x = np.maximum(-max_speed, np.minimum(max_speed, velocity))
+        self.car_x = self.car_x + self.car_velocity_x
+        self.car_x = self.car_x + (self.player_target_x - self.car_x) * self.snap_factor
+        self.car_x = np.maximum(CAR_MIN_X, np.minimum(CAR_MAX_X, self.car_x))
+
+        self.boost_timer -= self.boost_timer > 0
+        self.boost_cooldown -= self.boost_cooldown > 0
+
+        self.update_enemies()
+        self.update_shield_item()
+        self.update_mission_state()
+        crashed = self.handle_collisions()
+        self.move_lines()
+
+        self.score += self.frame_counter % balance.score_tick_frames == 0
+
+        finished = self.round_ids[crashed]
+        if crashed.any():
+            self.retire(crashed, game_over=True)
+        return finished
+
+    def activate_boost(self, pressed: np.ndarray):
+        fire = pressed & (self.boost_cooldown == 0)
+        self.boost_timer[fire] = self.balance.boost_duration_frames
+        self.boost_cooldown[fire] = self.balance.boost_cooldown_frames
+        self.boost_used_in_round |= fire
+        self.mission_failed |= fire & self.mission_no_boost & ~self.mission_completed
+
+    def player_lane(self) -> np.ndarray:
+        return np.argmin(np.abs(self.lane_x[None, :] - self.car_x[:, None]), axis=1)
+
+    def update_enemies(self):
+        player_lane = self.player_lane()
+        last_lane = len(self.lane_x) - 1
+        rngs = self.rngs
+        profile = self.ai_profile
+
+        for col in range(self.enemy_x.shape[1]):
+            x = self.enemy_x[:, col]
+            y = self.enemy_y[:, col]
+            lane = self.enemy_lane[:, col]
+            target_lane = self.enemy_target_lane[:, col]
+            ai_timer = self.enemy_ai_timer[:, col]
+            blocking = self.enemy_blocking[:, col]
+            tracked_lane = self.enemy_tracked_lane[:, col]
+
+            ai_timer -= 1
+            for row in np.flatnonzero(ai_timer <= 0).tolist():
+                # EnemyAI.decide와 같은 순서로 난수를 뽑는다.
+                rng = rngs[row]
+                ai_timer[row] = rng.randint(*profile.decision_frames)
+                if blocking[row]:
+                    blocking[row] = False
+                    self.blockers[row] -= 1
+                close_to_player = abs(y[row] - self.car_y) < profile.block_range
+                target_lane[row], blocking[row] = choose_lane(
+                    rng,
+                    profile,
+                    self.traffic[row],
+                    int(self.blockers[row]),
+                    int(tracked_lane[row]),
+                    int(lane[row]),
+                    close_to_player,
+                    int(player_lane[row]),
+                    last_lane,
+                )
+                self.blockers[row] += blocking[row]
+
+            target_x = self.lane_x[target_lane]
+            x += (target_x - x) * ENEMY_LANE_SNAP
+            arrived = np.abs(x - target_x) < 3
+            lane[arrived] = target_lane[arrived]
+
+            y += self.enemy_speed * self.enemy_speed_mul[:, col]
+
+            respawned = np.flatnonzero(y > DISPLAY.height + 100)
+            self.blockers[respawned] -= blocking[respawned]
+            blocking[respawned] = False
+            for row in respawned.tolist():
+                rng = rngs[row]
+                y[row] = rng.randint(-360, -80)
+                lane[row] = rng.randint(0, last_lane)
+                target_lane[row] = lane[row]
+                x[row] = self.lane_x[lane[row]]
+            if len(respawned):
+                self.score[respawned] += 2
+                self.enemy_speed[respawned] += self.balance.enemy_speed_increase
+                self.line_speed[respawned] += self.balance.line_speed_increase
+            if profile.uses_index:
+                self.track_traffic(y, target_lane, tracked_lane)
+
+    def track_traffic(self, y: np.ndarray, target_lane: np.ndarray, tracked_lane: np.ndarray):
+        """EnemyAI.track의 열 단위 버전. 세던 차선이 바뀐 행만 교통량을 고친다."""
+        lane = np.where((y >= -self.ai_profile.lookahead) & (y <= DISPLAY.height), target_lane, -1)
+        changed = np.flatnonzero(lane != tracked_lane)
+        if not len(changed):
+            return
+        old, new = tracked_lane[changed], lane[changed]
+        np.subtract.at(self.traffic, (changed[old >= 0], old[old >= 0]), 1)
+        np.add.at(self.traffic, (changed[new >= 0], new[new >= 0]), 1)
+        tracked_lane[changed] = new
+
+    def update_shield_item(self):
+        items = self.items
+        has_item = self.has_shield_item
+        self.shield_y = np.where(has_item, np.trunc(self.shield_y + items.shield_fall_speed), self.shield_y).astype(np.int64)
+        has_item &= ~(self.shield_y > DISPLAY.height)
+
+        waiting = ~self.shield_active & ~has_item
+        self.next_shield_spawn -= waiting
+        w, h = items.shield_size
+        for row in np.flatnonzero(waiting & (self.next_shield_spawn <= 0)).tolist():
+            self.shield_x[row] = self.rngs[row].randint(60, DISPLAY.width - 90)
+            self.shield_y[row] = -h
+            has_item[row] = True
+            self.next_shield_spawn[row] = items.shield_spawn_interval_frames
+
+    def update_mission_state(self):
+        reached = ~self.mission_completed & ~self.mission_failed & (self.frame_counter >= self.mission_target)
+        self.mission_completed |= reached
+        self.score += 30 * reached
+
+    def handle_collisions(self) -> np.ndarray:
+        car_w, car_h = CAR_SIZE
+        enemy_w, enemy_h = ENEMY_SIZE
+        item_w, item_h = self.items.shield_size
+        car_x = np.trunc(self.car_x).astype(np.int64)
+        car_y = int(self.car_y)
+
+        picked = self.has_shield_item & _overlap(car_x, car_y, car_w, car_h, self.shield_x, self.shield_y, item_w, item_h)
+        self.shield_active |= picked
+        self.has_shield_item &= ~picked
+
+        enemy_x = np.trunc(self.enemy_x).astype(np.int64)
+        enemy_y = np.trunc(self.enemy_y).astype(np.int64)
+        hits = _overlap(car_x[:, None], car_y, car_w, car_h, enemy_x, enemy_y, enemy_w, enemy_h)
+        hit_rows = hits.any(axis=1)
+        crashed = hit_rows & ~self.shield_active
+
+        absorbed = np.flatnonzero(hit_rows & self.shield_active)
+        if len(absorbed):
+            first_hit = hits[absorbed].argmax(axis=1)
+            self.shield_active[absorbed] = False
+            for row, col in zip(absorbed.tolist(), first_hit.tolist()):
+                self.enemy_y[row, col] = self.rngs[row].randint(-220, -80)
+        return crashed
+
+    def move_lines(self):
+        line_ys = np.trunc(self.line_ys + self.line_speed[:, None]).astype(np.int64)
+        self.line_ys = np.where(line_ys > DISPLAY.height, -90, line_ys)
+
+    def retire(self, mask: np.ndarray, game_over: bool):
+        for row in np.flatnonzero(mask).tolist():
+            round_id = int(self.round_ids[row])
+            self.results[round_id] = RoundResult(
+                seed=self.seeds[round_id],
+                vehicle_idx=self.vehicle_idx[round_id],
+                ticks=int(self.frame_counter[row]),
+                score=int(self.score[row]),
+                mission_type="no_boost" if self.mission_no_boost[row] else "survive",
+                mission_completed=bool(self.mission_completed[row]),
+                mission_failed=bool(self.mission_failed[row]),
+                game_over=game_over,
+            )
+
+        keep = ~mask
+        self.rngs = [rng for rng, alive in zip(self.rngs, keep.tolist()) if alive]
+        for name in self.ROUND_FIELDS:
+            setattr(self, name, getattr(self, name)[keep])
+
+    def run(self, policy: Optional[BatchPolicy] = None, max_ticks: int = TICK_RATE * 600) -> list[RoundResult]:
+        """모든 라운드가 끝나거나 max_ticks에 닿을 때까지 진행하고 라운드별 결과를 반환한다.
+
+        policy는 배치를 받아 step 키워드 인자(left/right/boost/swipe 배열) dict를 돌려준다.
+        """
+        ticks = 0
+        while self.active_count and ticks < max_ticks:
+            self.step(**(policy(self) if policy else {}))
+            ticks += 1
+        if self.active_count:
+            self.retire(np.ones(self.active_count, dtype=bool), game_over=False)
+        return self.results
+
+
+def _overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    return (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+
+
+def lane_threats(batch: BatchSimulation) -> np.ndarray:
+    """core.simulation.lane_threats의 벡터화 버전. (활성 라운드, 차선) 배열."""
+    lane_x = batch.lane_x
+    last_lane = len(lane_x) - 1
+    car_y = batch.car_y
+    enemy_y = batch.enemy_y
+    ahead = enemy_y < car_y + CAR_SIZE[1]
+    speed = batch.enemy_speed[:, None] * batch.enemy_speed_mul
+    arrive = np.clip(((car_y - ENEMY_SIZE[1] - enemy_y) / speed).astype(np.int64), 0, AUTOPILOT_HORIZON)
+    leave = np.clip(((car_y + CAR_SIZE[1] - enemy_y) / speed).astype(np.int64), 0, AUTOPILOT_HORIZON)
+    target_x = lane_x[batch.enemy_target_lane]
+    decay = np.array(ENEMY_LANE_DECAY)
+    to_arrive = (target_x + (batch.enemy_x - target_x) * decay[arrive])[:, :, None] - lane_x
+    to_leave = (target_x + (batch.enemy_x - target_x) * decay[leave])[:, :, None] - lane_x
+    hit = (np.abs(to_arrive) < CAR_SIZE[0]) | (np.abs(to_leave) < CAR_SIZE[0]) | (to_arrive * to_leave < 0)
+    hit &= ahead[:, :, None]
+    threats = np.where(hit, arrive[:, :, None], AUTOPILOT_HORIZON).min(axis=1, initial=AUTOPILOT_HORIZON)
+
+    if last_lane > 0:
+        decide = batch.enemy_ai_timer
+        cut_in = ahead & (decide < leave) & (np.abs(enemy_y + speed * decide - car_y) < batch.ai_profile.block_range)
+        for lane in (0, last_lane):
+            lanes_away = np.abs(batch.enemy_target_lane - lane)
+            hit_tick = np.maximum(arrive, decide + AUTOPILOT_CUT_IN_TICKS * lanes_away)
+            earliest = np.where(cut_in & (lanes_away > 0), hit_tick, AUTOPILOT_HORIZON).min(axis=1, initial=AUTOPILOT_HORIZON)
+            threats[:, lane] = np.minimum(threats[:, lane], earliest)
+    return threats
+
+
+def dodge_policy(batch: BatchSimulation) -> dict:
+    """core.simulation.dodge_policy의 벡터화 버전."""
+    lane_x = batch.lane_x
+    lanes = np.arange(len(lane_x))
+    threats = lane_threats(batch)
+    current = batch.player_lane()
+
+    distance = np.abs(lanes[None, :] - current[:, None])
+    clear = threats > AUTOPILOT_TRANSIT_TICKS * distance
+    reachable = np.ones_like(clear)
+    for lane in lanes.tolist():
+        for idx in lanes.tolist():
+            on_path = ((current < idx) & (idx <= lane)) | ((lane <= idx) & (idx < current))
+            reachable[:, lane] &= ~on_path | clear[:, idx]
+    score = threats + AUTOPILOT_STAY_BONUS * (lanes[None, :] == current[:, None])
+    score[:, 1:-1] += AUTOPILOT_INNER_BONUS
+    best_lane = np.where(reachable, score, -1).argmax(axis=1)
+
+    goal = lane_x[best_lane]
+    target = batch.player_target_x
+    error = np.abs(target - goal)
+    swipe = np.where(
+        np.abs(np.minimum(target + SWIPE_DISTANCE, lane_x[-1]) - goal) < error,
+        1,
+        np.where(np.abs(np.maximum(target - SWIPE_DISTANCE, lane_x[0]) - goal) < error, -1, 0),
+    )
+    offset = goal - batch.car_x
+    saving_mission = batch.mission_no_boost & ~batch.mission_completed
+    boost = (best_lane != current) & (batch.boost_cooldown == 0) & ~saving_mission
+    return {"left": offset < -AUTOPILOT_TRIM, "right": offset > AUTOPILOT_TRIM, "boost": boost, "swipe": swipe}
+
+
+def simulate_batch(
+    seeds: Sequence[int],
+    vehicle_idx: Union[int, Sequence[int]] = 0,
+    policy: Optional[BatchPolicy] = None,
+    max_ticks: int = TICK_RATE * 600,
+    balance: BalanceConfig = BALANCE,
+    items: ItemConfig = ITEMS,
+    ai_profile: Optional[AIProfile] = None,
+) -> list[RoundResult]:
+    return BatchSimulation(seeds, vehicle_idx, balance=balance, items=items, ai_profile=ai_profile).run(policy, max_ticks)
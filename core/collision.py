@@ -0,0 +1,129 @@
+"""y축 균일 그리드 브로드페이즈 충돌 시스템 (적/실드/향후 픽업 공용)."""
+
+from typing import Any, Optional
+
+
+class Collider:
+    """위치를 제자리에서 갱신하며 재사용하는 충돌 박스. x/y는 실수여도 되며 판정 시 정수로 자른다."""
+
+    __slots__ = ("id", "kind", "x", "y", "w", "h", "band", "payload")
+
+    def __init__(self, collider_id: Optional[int], kind: str, x: float, y: float, w: int, h: int, payload: Any = None):
+        self.id = collider_id
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.band = None
+        self.payload = payload
+
+
+class CollisionGrid:
+    """콜라이더를 윗변 기준 가로 띠(cell_size 높이)에 담아 두는 브로드페이즈.
+
+    화면이 좁고 세로로 길어서 y축 띠만으로 후보가 충분히 줄어든다. 소유자가 콜라이더의
+    x/y를 직접 고친 뒤 틱마다 refresh를 한 번 호출하면, 띠가 바뀐 콜라이더만 버킷을 옮긴다.
+    query는 pygame.Rect.collidelistall처럼 겹치는 콜라이더를 등록 순서(id)대로 모두 돌려주며
+    후보 띠만 검사하므로 한 틱에 여러 번 질의해도 비용이 엔티티 수에 거의 비례하지 않는다.
+
+    콜라이더가 linear_limit개 이하면 띠 관리 비용이 검사보다 커서 띠를 두지 않고 전부 선형 검사한다.
+    모드는 refresh에서만 바뀐다.
+    """
+
+    def __init__(self, cell_size: int = 128, linear_limit: int = 64):
+        self.cell_size = cell_size
+        self.linear_limit = linear_limit
+        self.colliders: dict[int, Collider] = {}
+        self.bands: dict[int, dict[int, Collider]] = {}
+        self.banded = False
+        self.max_height = 0
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.colliders)
+
+    def add(self, kind: str, x: float, y: float, w: int, h: int, payload: Any = None) -> Collider:
+        return self.insert(Collider(None, kind, x, y, w, h, payload))
+
+    def insert(self, collider: Collider) -> Collider:
+        """이미 만든 콜라이더(또는 그 하위 엔티티)를 등록한다. remove한 객체를 다시 넣어 재사용할 수 있다."""
+        if collider.id is None:
+            collider.id = self._next_id
+            self._next_id += 1
+        self.colliders[collider.id] = collider
+        self.max_height = max(self.max_height, collider.h)
+        if self.banded:
+            self._rebucket(collider, collider.y // self.cell_size)
+        return collider
+
+    def remove(self, collider: Collider):
+        if self.colliders.pop(collider.id, None) is not None and collider.band is not None:
+            del self.bands[collider.band][collider.id]
+            collider.band = None
+
+    def clear(self):
+        self._drop_bands()
+        self.colliders.clear()
+        self.max_height = 0
+
+    def _drop_bands(self):
+        for collider in self.colliders.values():
+            collider.band = None
+        self.bands.clear()
+        self.banded = False
+
+    def _rebucket(self, collider: Collider, band: int):
+        if collider.band is not None:
+            del self.bands[collider.band][collider.id]
+        collider.band = band
+        bucket = self.bands.get(band)
+        if bucket is None:
+            bucket = self.bands[band] = {}
+        bucket[collider.id] = collider
+
+    def refresh(self):
+        """x/y가 바뀐 콜라이더 중 띠를 넘어간 것만 다시 담는다.
+
+        띠는 실수 y의 내림으로 정하므로 (-1, 0) 구간처럼 정수로 자른 값보다 한 띠 위에 담길 수
+        있고, query는 그만큼 한 띠 더 위부터 찾는다.
+        """
+        if len(self.colliders) <= self.linear_limit:
+            if self.banded:
+                self._drop_bands()
+            return
+        self.banded = True
+        cell_size = self.cell_size
+        for collider in self.colliders.values():
+            band = collider.y // cell_size
+            if band != collider.band:
+                self._rebucket(collider, band)
+
+    def query(self, x: int, y: int, w: int, h: int, kind: Optional[str] = None) -> list[Collider]:
+        """(x, y, w, h)와 겹치는(경계 접촉 제외) 콜라이더 목록."""
+        right = x + w
+        bottom = y + h
+        hits = []
+        if not self.banded:
+            for collider in self.colliders.values():
+                other_x = int(collider.x)
+                if other_x < right and x < other_x + collider.w:
+                    other_y = int(collider.y)
+                    if other_y < bottom and y < other_y + collider.h and (kind is None or collider.kind == kind):
+                        hits.append(collider)
+            if len(hits) > 1:
+                hits.sort(key=lambda collider: collider.id)
+            return hits
+        for band in range((y - self.max_height) // self.cell_size - 1, bottom // self.cell_size + 1):
+            bucket = self.bands.get(band)
+            if not bucket:
+                continue
+            for collider in bucket.values():
+                other_x = int(collider.x)
+                if other_x < right and x < other_x + collider.w:
+                    other_y = int(collider.y)
+                    if other_y < bottom and y < other_y + collider.h and (kind is None or collider.kind == kind):
+                        hits.append(collider)
+        if len(hits) > 1:
+            hits.sort(key=lambda collider: collider.id)
+        return hits
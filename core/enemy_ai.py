@@ -0,0 +1,128 @@
+"""적 AI: 난이도별 행동 프로파일과 틱마다 증분 갱신되는 차선 교통량 인덱스 (pygame 비의존)."""
+
+import random
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class AIProfile:
+    name: str
+    decision_frames: tuple[int, int] = (30, 100)  # 다음 판단까지 틱 수 범위
+    block_range: int = 180  # 플레이어와 세로 거리가 이보다 가까우면 블로킹을 시도한다
+    block_chance: float = 0.65
+    max_blockers: int = 0  # 동시에 플레이어 차선을 막는 적 수 상한(0이면 제한 없음)
+    avoid_traffic: bool = False  # 배회할 때 교통량이 가장 적은 이웃 차선을 고른다
+    lookahead: int = 240  # 화면 위쪽 이 거리(px)부터 내려오는 적을 교통량에 센다
+
+    @property
+    def uses_index(self) -> bool:
+        return self.avoid_traffic or self.max_blockers > 0
+
+
+AI_PROFILES = {
+    "easy": AIProfile("easy", decision_frames=(50, 130), block_range=140, block_chance=0.35, max_blockers=1, avoid_traffic=True),
+    # 기존 AI와 난수 소비까지 같다(리플레이/배치 엔진 호환).
+    "normal": AIProfile("normal"),
+    "hard": AIProfile("hard", decision_frames=(20, 70), block_range=240, block_chance=0.8, max_blockers=2, avoid_traffic=True),
+}
+
+
+def nearest_lane(lane_x: Sequence[int], x: float) -> int:
+    """x에 가장 가까운 차선(같으면 왼쪽). 차선 간격이 거의 고르므로 추정값 주변 세 칸만 비교한다."""
+    last_lane = len(lane_x) - 1
+    if last_lane == 0:
+        return 0
+    guess = int((x - lane_x[0]) * last_lane / (lane_x[-1] - lane_x[0]) + 0.5)
+    guess = max(0, min(last_lane, guess))
+    best = max(0, guess - 1)
+    for lane in range(best + 1, min(last_lane, guess + 1) + 1):
+        if abs(lane_x[lane] - x) < abs(lane_x[best] - x):
+            best = lane
+    return best
+
+
+def choose_lane(
+    rng: random.Random,
+    profile: AIProfile,
+    traffic: Sequence[int],
+    blockers: int,
+    own_lane: int,
+    lane: int,
+    close_to_player: bool,
+    player_lane: int,
+    last_lane: int,
+) -> tuple[int, bool]:
+    """판단 한 번. (목표 차선, 블로킹 여부)를 돌려준다.
+
+    traffic은 차선별 교통량, own_lane은 판단하는 적이 지금 세어져 있는 차선(-1이면 없음)이다.
+    후보가 최대 세 개라 적 수와 관계없이 O(1)이다.
+    """
+    if close_to_player and rng.random() < profile.block_chance:
+        if not profile.max_blockers or blockers < profile.max_blockers:
+            return player_lane, True
+        # 막는 적이 이미 충분하면 플레이어 옆 차선으로 퇴로를 좁힌다.
+        flanks = [flank for flank in (player_lane - 1, player_lane + 1) if 0 <= flank <= last_lane]
+        return _least_traffic(rng, traffic, own_lane, flanks or [player_lane]), False
+    candidates = [max(0, min(last_lane, lane + delta)) for delta in (-1, 0, 1)]
+    if profile.avoid_traffic:
+        return _least_traffic(rng, traffic, own_lane, candidates), False
+    return rng.choice(candidates), False
+
+
+def _least_traffic(rng: random.Random, traffic: Sequence[int], own_lane: int, candidates: list[int]) -> int:
+    loads = [traffic[lane] - (lane == own_lane) for lane in candidates]
+    lowest = min(loads)
+    quiet = [lane for lane, load in zip(candidates, loads) if load == lowest]
+    return quiet[0] if len(quiet) == 1 else rng.choice(quiet)
+
+
+class EnemyAI:
+    """RaceSimulation의 적 판단을 맡는다. 교통량은 lookahead 구간 안 적을 목표 차선별로 센 값이다.
+
+    track()이 적마다 틱당 한 번 세던 차선이 바뀐 경우만 고치므로 갱신도 적 하나당 O(1)이다.
+    같은 틱 안에서는 앞 적의 판단이 바로 뒤 적에게 보이므로 적 순서만 같으면 결과가 시드로 정해진다.
+    """
+
+    def __init__(self, profile: AIProfile, rng: random.Random, lane_count: int, field_height: int):
+        self.profile = profile
+        self.rng = rng
+        self.field_height = field_height
+        self.traffic = [0] * lane_count
+        self.blockers = 0
+
+    def reset_lanes(self, lane_count: int, enemies):
+        """차선 수가 바뀌었을 때(또는 라운드 시작 시) 인덱스를 처음부터 다시 센다."""
+        self.traffic = [0] * lane_count
+        self.blockers = 0
+        for enemy in enemies:
+            enemy.tracked_lane = -1
+            self.blockers += enemy.blocking
+            self.track(enemy)
+
+    def decide(self, enemy, player_lane: int, car_y: int, last_lane: int):
+        profile = self.profile
+        enemy.ai_timer = self.rng.randint(*profile.decision_frames)
+        if enemy.blocking:
+            enemy.blocking = False
+            self.blockers -= 1
+        close_to_player = abs(enemy.y - car_y) < profile.block_range
+        enemy.target_lane, enemy.blocking = choose_lane(
+            self.rng, profile, self.traffic, self.blockers, enemy.tracked_lane, enemy.lane, close_to_player, player_lane, last_lane
+        )
+        self.blockers += enemy.blocking
+
+    def track(self, enemy):
+        lane = enemy.target_lane if -self.profile.lookahead <= enemy.y <= self.field_height else -1
+        if lane != enemy.tracked_lane:
+            if enemy.tracked_lane >= 0:
+                self.traffic[enemy.tracked_lane] -= 1
+            if lane >= 0:
+                self.traffic[lane] += 1
+            enemy.tracked_lane = lane
+
+    def release(self, enemy):
+        """리스폰 직전 호출. 블로킹 역할을 내려놓는다(교통량은 다음 track에서 고쳐진다)."""
+        if enemy.blocking:
+            enemy.blocking = False
+            self.blockers -= 1
@@ -0,0 +1,25 @@
+"""슬롯 기반 시뮬레이션 엔티티. 딕셔너리 대신 고정 속성을 써서 조회/메모리 비용을 줄인다."""
+
+from core.collision import Collider
+
+
+class Enemy(Collider):
+    """적 차량. 자신이 곧 충돌 박스이므로 이동 후 별도 동기화 없이 CollisionGrid.refresh만 하면 된다."""
+
+    __slots__ = ("lane", "target_lane", "speed_mul", "ai_timer", "blocking", "tracked_lane")
+
+    def __init__(self, lane: int, x: float, y: float, size: tuple[int, int], speed_mul: float, ai_timer: int):
+        super().__init__(None, "enemy", x, y, *size)
+        self.lane = lane
+        self.target_lane = lane
+        self.speed_mul = speed_mul
+        self.ai_timer = ai_timer
+        self.blocking = False  # 플레이어 차선을 막는 역할 중인지 (EnemyAI가 관리)
+        self.tracked_lane = -1  # EnemyAI 교통량 인덱스에 세어진 차선
+
+    def respawn(self, lane: int, x: float, y: float):
+        """화면 아래로 빠진 슬롯을 새 적으로 재사용한다."""
+        self.lane = lane
+        self.target_lane = lane
+        self.x = x
+        self.y = y
@@ -0,0 +1,230 @@
+"""강화학습용 Gym 스타일 환경: 단일 라운드(RaceEnv)와 배치 엔진 위의 벡터 환경(VectorRaceEnv).
+
+gym/gymnasium에 의존하지 않고 같은 호출 규약만 따른다.
+
+    reset(seed=None) -> (obs, info)
+    step(action) -> (obs, reward, terminated, truncated, info)
+
+행동은 ACTIONS의 인덱스다. 좌/우는 모바일 스와이프와 같은 한 차선 이동이고 부스트와 겹칠 수 있다.
+보상은 틱마다 오른 점수이고, 충돌로 끝나면 crash_penalty를 뺀다. 두 환경 모두 고정 도로에서 돈다
+(배치 엔진이 절차적 트랙을 지원하지 않으므로 관측 크기와 규칙을 맞추기 위해서다).
+"""
+
+import random
+from typing import Optional, Sequence
+
+import numpy as np
+
+from config import BALANCE, DISPLAY, ITEMS, BalanceConfig, ItemConfig
+from core.batch import BatchSimulation
+from core.simulation import TICK_RATE, RaceSimulation, TickInput
+
+ACTIONS = (
+    TickInput(),
+    TickInput(swipe=-1),
+    TickInput(swipe=1),
+    TickInput(boost=True),
+    TickInput(boost=True, swipe=-1),
+    TickInput(boost=True, swipe=1),
+)
+ACTION_SWIPE = np.array([action.swipe for action in ACTIONS], dtype=np.int64)
+ACTION_BOOST = np.array([action.boost for action in ACTIONS], dtype=bool)
+
+DEFAULT_PIXEL_SIZE = (100, 150)
+
+
+def observation_size(balance: BalanceConfig = BALANCE) -> int:
+    """차(3) + 차선 x + 적마다 (x, 거리) + 실드(4) + 부스트(2)."""
+    return 3 + balance.lane_count + 2 * balance.enemy_count + 4 + 2
+
+
+def observe(sim: RaceSimulation) -> np.ndarray:
+    """관측 벡터(float32). 좌표는 화면 크기로, 속도/타이머는 최댓값으로 나눈다. 세로 위치는 차까지의 거리다."""
+    width, height = DISPLAY.width, DISPLAY.height
+    balance, car_y = sim.balance, sim.car_y
+    item = sim.shield_item
+    values = [sim.car_x / width, sim.car_velocity_x / balance.max_player_speed, sim.player_target_x / width]
+    values += [x / width for x in sim.lane_x]
+    for enemy in sim.enemies:
+        values += (enemy.x / width, (car_y - enemy.y) / height)
+    values += (
+        float(sim.shield_active),
+        float(item is not None),
+        item.x / width if item else 0.0,
+        (car_y - item.y) / height if item else 0.0,
+        sim.boost_timer / balance.boost_duration_frames,
+        sim.boost_cooldown / balance.boost_cooldown_frames,
+    )
+    return np.array(values, dtype=np.float32)
+
+
+def observe_batch(batch: BatchSimulation) -> np.ndarray:
+    """observe()의 벡터화 버전. 활성 행 순서의 (행 수, observation_size) 배열."""
+    width, height = DISPLAY.width, DISPLAY.height
+    balance, car_y = batch.balance, batch.car_y
+    enemy_count = batch.enemy_x.shape[1]
+    lane_count = len(batch.lane_x)
+    obs = np.empty((batch.active_count, observation_size(balance)), dtype=np.float32)
+    obs[:, 0] = batch.car_x / width
+    obs[:, 1] = batch.car_velocity_x / balance.max_player_speed
+    obs[:, 2] = batch.player_target_x / width
+    obs[:, 3 : 3 + lane_count] = batch.lane_x / width
+    enemies = 3 + lane_count
+    obs[:, enemies : enemies + 2 * enemy_count : 2] = batch.enemy_x / width
+    obs[:, enemies + 1 : enemies + 2 * enemy_count : 2] = (car_y - batch.enemy_y) / height
+    tail = enemies + 2 * enemy_count
+    has_item = batch.has_shield_item
+    obs[:, tail] = batch.shield_active
+    obs[:, tail + 1] = has_item
+    obs[:, tail + 2] = np.where(has_item, batch.shield_x / width, 0.0)
+    obs[:, tail + 3] = np.where(has_item, (car_y - batch.shield_y) / height, 0.0)
+    obs[:, tail + 4] = batch.boost_timer / balance.boost_duration_frames
+    obs[:, tail + 5] = batch.boost_cooldown / balance.boost_cooldown_frames
+    return obs
+
+
+def _pixel_renderer(size: tuple[int, int]):
+    from systems.offscreen import OffscreenRenderer  # pygame은 픽셀 관측에서만 필요하다.
+
+    return OffscreenRenderer(size)
+
+
+class RaceEnv:
+    """RaceSimulation 한 라운드를 감싼 환경. observation="pixels"면 (H, W, 3) uint8 화면을 관측으로 준다."""
+
+    action_count = len(ACTIONS)
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        vehicle_idx: int = 0,
+        max_ticks: int = TICK_RATE * 600,
+        crash_penalty: float = 10.0,
+        observation: str = "state",
+        pixel_size: tuple[int, int] = DEFAULT_PIXEL_SIZE,
+        balance: BalanceConfig = BALANCE,
+        items: ItemConfig = ITEMS,
+    ):
+        if observation not in ("state", "pixels"):
+            raise ValueError(f"알 수 없는 관측 종류: {observation}")
+        self.seed_rng = random.Random(seed)
+        self.max_ticks = max_ticks
+        self.crash_penalty = crash_penalty
+        self.renderer = _pixel_renderer(pixel_size) if observation == "pixels" else None
+        self.sim = RaceSimulation(self.seed_rng.getrandbits(32), vehicle_idx, balance=balance, items=items)
+        self.observation_shape = (pixel_size[1], pixel_size[0], 3) if self.renderer else (observation_size(balance),)
+
+    def observe(self) -> np.ndarray:
+        return self.renderer.draw_sim(self.sim) if self.renderer else observe(self.sim)
+
+    def info(self) -> dict:
+        return {"seed": self.sim.seed, "score": self.sim.score, "ticks": self.sim.frame_counter}
+
+    def reset(self, seed: Optional[int] = None):
+        if seed is not None:
+            self.seed_rng.seed(seed)
+        self.sim.reset(self.seed_rng.getrandbits(32))
+        return self.observe(), self.info()
+
+    def step(self, action: int):
+        sim = self.sim
+        score = sim.score
+        terminated = sim.step(ACTIONS[action])
+        reward = float(sim.score - score)
+        if terminated:
+            reward -= self.crash_penalty
+        truncated = not terminated and sim.frame_counter >= self.max_ticks
+        return self.observe(), reward, terminated, truncated, self.info()
+
+
+class VectorRaceEnv:
+    """num_envs개 라운드를 BatchSimulation 한 번의 step으로 진행하는 벡터 환경.
+
+    끝난(terminated/truncated) 환경은 바로 새 시드로 다시 시작하므로, 그 환경의 반환 관측은 새 라운드의
+    첫 관측이다. 끝난 라운드의 최종 점수는 info["final_score"]에 있다(끝나지 않은 환경은 -1).
+    """
+
+    action_count = len(ACTIONS)
+
+    def __init__(
+        self,
+        num_envs: int,
+        seed: Optional[int] = None,
+        vehicle_idx: int = 0,
+        max_ticks: int = TICK_RATE * 600,
+        crash_penalty: float = 10.0,
+        observation: str = "state",
+        pixel_size: tuple[int, int] = DEFAULT_PIXEL_SIZE,
+        balance: BalanceConfig = BALANCE,
+        items: ItemConfig = ITEMS,
+    ):
+        if observation not in ("state", "pixels"):
+            raise ValueError(f"알 수 없는 관측 종류: {observation}")
+        self.num_envs = num_envs
+        self.seed_rng = random.Random(seed)
+        self.vehicle_idx = vehicle_idx
+        self.max_ticks = max_ticks
+        self.crash_penalty = crash_penalty
+        self.balance = balance
+        self.items = items
+        self.renderer = _pixel_renderer(pixel_size) if observation == "pixels" else None
+        if self.renderer:
+            self.observation_shape = (pixel_size[1], pixel_size[0], 3)
+            self._pixels = np.zeros((num_envs, *self.observation_shape), dtype=np.uint8)
+        else:
+            self.observation_shape = (observation_size(balance),)
+        self.reset()
+
+    def _new_seeds(self, count: int) -> list[int]:
+        return [self.seed_rng.getrandbits(32) for _ in range(count)]
+
+    def reset(self, seed: Optional[int] = None):
+        if seed is not None:
+            self.seed_rng.seed(seed)
+        self.batch = BatchSimulation(
+            self._new_seeds(self.num_envs), self.vehicle_idx, balance=self.balance, items=self.items
+        )
+        self.scores = np.zeros(self.num_envs, dtype=np.int64)
+        return self.observe(), {"score": self.scores.copy()}
+
+    def row_envs(self) -> np.ndarray:
+        """활성 행마다 해당하는 환경 번호. 끝난 환경은 새 라운드에 자기 라운드 번호를 물려주므로 둘이 같다."""
+        return self.batch.round_ids
+
+    def observe(self) -> np.ndarray:
+        row_envs = self.row_envs()
+        if self.renderer is None:
+            obs = np.empty((self.num_envs, *self.observation_shape), dtype=np.float32)
+            obs[row_envs] = observe_batch(self.batch)
+            return obs
+        for row, env in enumerate(row_envs.tolist()):
+            self._pixels[env] = self.renderer.draw_batch_row(self.batch, row)
+        return self._pixels
+
+    def step(self, actions: Sequence[int]):
+        batch = self.batch
+        actions = np.asarray(actions, dtype=np.int64)[self.row_envs()]
+        finished = batch.step(boost=ACTION_BOOST[actions], swipe=ACTION_SWIPE[actions])
+
+        terminated = np.zeros(self.num_envs, dtype=bool)
+        truncated = np.zeros(self.num_envs, dtype=bool)
+        final_score = np.full(self.num_envs, -1, dtype=np.int64)
+        over_time = batch.frame_counter >= self.max_ticks
+        timed_out = batch.round_ids[over_time]
+        if over_time.any():
+            batch.retire(over_time, game_over=False)
+
+        previous = self.scores.copy()
+        self.scores[self.row_envs()] = batch.score
+        for round_ids, flags in ((finished, terminated), (timed_out, truncated)):
+            for env in round_ids.tolist():
+                flags[env] = True
+                final_score[env] = self.scores[env] = batch.results[env].score
+        rewards = (self.scores - previous).astype(np.float32)
+        rewards[terminated] -= self.crash_penalty
+
+        done_envs = np.flatnonzero(terminated | truncated)
+        if len(done_envs):
+            batch.add_rounds(self._new_seeds(len(done_envs)), self.vehicle_idx, round_ids=done_envs)
+            self.scores[done_envs] = 0
+        return self.observe(), rewards, terminated, truncated, {"score": self.scores.copy(), "final_score": final_score}
@@ -0,0 +1,34 @@
+"""시뮬레이션이 텔레메트리로 내보내는 이벤트 종류와 값 코드 (pygame 비의존).
+
+RaceSimulation.telemetry에 emit(kind, tick, a, b)를 가진 객체를 달면 아래 이벤트를 받는다.
+"""
+
+EVENT_ROUND_START = 1  # a=시드, b=차량 번호
+EVENT_ROUND_END = 2  # a=점수, b=충돌로 끝났으면 1
+EVENT_LANE_CHANGE = 3  # a=방향(-1/1), b=새 목표 x
+EVENT_BOOST = 4
+EVENT_NEAR_MISS = 5  # a=적과의 가로 간격(px)
+EVENT_SHIELD_PICKUP = 6
+EVENT_SHIELD_BLOCK = 7  # a=막은 원인(CAUSE_*)
+EVENT_MISSION = 8  # a=미션 종류(MISSION_TYPES 인덱스), b=달성 1/실패 0
+EVENT_DEATH = 9  # a=원인(CAUSE_*)
+
+EVENT_NAMES = {
+    EVENT_ROUND_START: "round_start",
+    EVENT_ROUND_END: "round_end",
+    EVENT_LANE_CHANGE: "lane_change",
+    EVENT_BOOST: "boost",
+    EVENT_NEAR_MISS: "near_miss",
+    EVENT_SHIELD_PICKUP: "shield_pickup",
+    EVENT_SHIELD_BLOCK: "shield_block",
+    EVENT_MISSION: "mission",
+    EVENT_DEATH: "death",
+}
+
+CAUSE_ENEMY = 1
+CAUSE_HAZARD = 2
+CAUSE_NAMES = {CAUSE_ENEMY: "enemy", CAUSE_HAZARD: "hazard"}
+
+MISSION_TYPES = ("survive", "no_boost")
+
+NEAR_MISS_GAP = 20  # 적이 차 옆을 지날 때 가로 간격이 이 px 이하면 아슬아슬한 회피로 센다.
@@ -1,422 +1,428 @@
-import random
+import os
 import sys
-from dataclasses import dataclass
+import time
+from typing import Optional
 
 import pygame
 
-from config import ASSETS, BALANCE, DISPLAY, GRAY, ITEMS, RED, SAVE, WHITE, YELLOW
+from config import ASSETS, AUDIO, DISPLAY, PROFILE, RED, SAVE, TELEMETRY, TRACK, WHITE
+from core.scenes import GameOverScene, SceneStack, StartMenuScene
+from core.simulation import LINE_SIZE, TICK_SECONDS, RaceSimulation, TickInput, TrackTheme
+from systems.audio import open_audio
+from systems.config_profile import DEFAULT_PROFILE, ConfigProfile, ProfileWatcher, load_profile
+from systems.frame_timer import FrameProfiler
+from systems.render_cache import BackgroundCache
+from systems.replay import ReplayReader, ReplayWriter
 from systems.resource_loader import ResourceLoader
 from systems.save_system import SaveSystem
-
-
-class SceneState:
-    START = "start"
-    PLAYING = "playing"
-    PAUSED = "paused"
-    GAME_OVER = "game_over"
-
-
-@dataclass(frozen=True)
-class VehicleStat:
-    name: str
-    acceleration: float
-    max_speed: float
-    handling: float
-    color: tuple[int, int, int]
-
-
-@dataclass(frozen=True)
-class TrackTheme:
-    name: str
-    bg_color: tuple[int, int, int]
-    road_color: tuple[int, int, int]
-    edge_color: tuple[int, int, int]
-    line_color: tuple[int, int, int]
+from systems.sprite_batch import LAYER_AURA, LAYER_CONTROLS, LAYER_HAZARD, LAYER_ITEM, SpriteBatch, SpriteCache
+from systems.telemetry import TelemetryLog
+from systems.text_cache import TextCache
+from systems.viewport import Viewport
 
 
 class CarRaceGame:
-    def __init__(self):
+    """RaceSimulation 위에서 입력 수집, 렌더링, 오디오만 담당하는 어댑터. 화면별 동작은 core.scenes의 씬이 맡는다."""
+
+    PROFILED_GAME_PHASES = ("handle_events", "update", "render", "draw_hud", "present")
+    PROFILED_SIM_PHASES = ("update_enemies", "handle_collisions")
+
+    def __init__(
+        self,
+        replay_path: Optional[str] = None,
+        playback_rate: float = 1.0,
+        trace_path: Optional[str] = None,
+        profile_path: Optional[str] = None,
+        window_size: Optional[tuple[int, int]] = None,
+        record_replays: bool = SAVE.record_replays,
+        telemetry: bool = TELEMETRY.enabled,
+        save_system: Optional[SaveSystem] = None,
+    ):
         pygame.init()
-        pygame.mixer.init()
+        self.audio = open_audio(AUDIO.channels, AUDIO.threaded)
 
-        self.screen = pygame.display.set_mode((DISPLAY.width, DISPLAY.height))
+        # 시뮬레이션/레이아웃은 논리 좌표로 두고, 그릴 때만 뷰포트로 창 픽셀에 옮긴다.
+        window_size = window_size or (DISPLAY.window_width, DISPLAY.window_height)
+        self.viewport = Viewport((DISPLAY.width, DISPLAY.height), window_size if all(window_size) else None)
+        self.screen = pygame.display.set_mode(self.viewport.physical_size)
+        self.screen.set_clip(self.viewport.area)  # 레터박스에는 아무것도 그리지 않는다.
         pygame.display.set_caption(DISPLAY.title)
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont(None, 28)
-        self.large_font = pygame.font.SysFont(None, 34)
+        self.font = pygame.font.SysFont(None, self.viewport.length(28))
+        self.large_font = pygame.font.SysFont(None, self.viewport.length(34))
+        self.small_font = pygame.font.SysFont(None, self.viewport.length(20))
+        self.text_cache = TextCache(DISPLAY.text_cache_size)
 
-        self.loader = ResourceLoader()
-        self.save_system = SaveSystem(SAVE.highscore_file)
+        self.loader = ResourceLoader(cache_dir=ASSETS.cache_dir)
+        self.save_system = save_system or SaveSystem(SAVE.highscore_file, SAVE.leaderboard_size)
         self.high_score = self.save_system.load_highscore()
-
-        self.car_img = self.loader.load_image(ASSETS.car_image, (50, 90), (30, 180, 255))
-        self.obs_img = self.loader.load_image(ASSETS.obstacle_image, (50, 80), (220, 100, 20))
-        self.crash_sound = self.loader.load_sound(ASSETS.crash_sfx, volume=0.8)
-        self.has_bgm = self.loader.load_bgm(ASSETS.bgm, volume=0.5)
-
-        self.vehicles = [
-            VehicleStat("Sprint", acceleration=0.36, max_speed=8.0, handling=0.16, color=(80, 200, 255)),
-            VehicleStat("Interceptor", acceleration=0.28, max_speed=9.8, handling=0.12, color=(255, 180, 60)),
-            VehicleStat("Drift", acceleration=0.24, max_speed=8.8, handling=0.2, color=(220, 90, 255)),
-        ]
-        self.selected_vehicle_idx = 0
-
-        self.track_themes = [
-            TrackTheme("도심", bg_color=(54, 64, 82), road_color=GRAY, edge_color=(35, 35, 35), line_color=YELLOW),
-            TrackTheme("사막", bg_color=(183, 145, 87), road_color=(105, 88, 75), edge_color=(130, 98, 58), line_color=(250, 230, 120)),
-            TrackTheme("야간 네온", bg_color=(16, 12, 34), road_color=(35, 35, 60), edge_color=(95, 35, 130), line_color=(40, 255, 220)),
-        ]
-        self.current_theme = self.track_themes[0]
-
-        self.state = SceneState.START
+        self.last_rank = None
+
+        self.has_bgm = False
+        if self.audio.enabled:
+            self.load_sounds()
+
+        self.backgrounds = BackgroundCache(self.viewport)
+        self.sprites = SpriteCache()
+        self.sprite_batch = SpriteBatch()
+        self.mobile_buttons = self.bake_mobile_buttons()
+        self.dirty_rendering = DISPLAY.dirty_rect_rendering
+        self.show_frame_time = DISPLAY.show_frame_time
+        self.profiler = FrameProfiler()
+        self.last_rendered_scene = None
+        self.last_rendered_theme = None
+        self.interpolate = DISPLAY.interpolate_rendering
+        self.render_alpha = 1.0
+        self.previous_positions = None
+
+        # 프로필은 시작할 때 한 번 검증한다(잘못된 파일이면 ConfigError로 바로 멈춘다).
+        profile_path = profile_path or PROFILE.path
+        self.profile = load_profile(profile_path) if profile_path else DEFAULT_PROFILE
+        self.profile_watcher = None
+        if profile_path and PROFILE.hot_reload and not replay_path:
+            self.profile_watcher = ProfileWatcher(profile_path, PROFILE.poll_seconds)
+        self.telemetry = None
+        if telemetry and not replay_path:
+            self.telemetry = TelemetryLog(
+                TELEMETRY.directory,
+                TELEMETRY.capacity,
+                TELEMETRY.flush_seconds,
+                TELEMETRY.rotate_bytes,
+                TELEMETRY.max_files,
+                TELEMETRY.cabinet,
+            )
+        self.sim = RaceSimulation(track=TRACK, prefetch_track=True, **self.profile.simulation_options())
+        self.sim.telemetry = self.telemetry
+        self.vehicles = self.sim.vehicles
+        self.track_themes = self.sim.track_themes
+        if trace_path:
+            self.profiler.open_trace(trace_path)
+        self.update_profiling()
+
+        self.scenes = SceneStack()
         self.running = True
+        self.recorder = None
         self.reset_round()
 
-    def lane_positions(self):
-        left_bound = 60
-        right_bound = DISPLAY.width - 110
-        if BALANCE.lane_count == 1:
-            return [DISPLAY.width // 2 - 25]
-        interval = (right_bound - left_bound) / (BALANCE.lane_count - 1)
-        return [int(left_bound + interval * idx) for idx in range(BALANCE.lane_count)]
-
-    def reset_round(self):
-        self.current_theme = random.choice(self.track_themes)
-        self.frame_counter = 0
-        self.lane_x = self.lane_positions()
-        self.player_target_x = self.lane_x[len(self.lane_x) // 2]
-        self.car_x = float(self.player_target_x)
-        self.car_velocity_x = 0.0
-        self.car_y = DISPLAY.height - 110
-
-        self.enemy_speed = BALANCE.initial_enemy_speed
-        self.enemies = []
-        self.spawn_initial_enemies()
-
-        self.score = 0
-        self.line_speed = BALANCE.initial_line_speed
-        self.lines = [pygame.Rect(DISPLAY.width // 2 - 5, i, 10, 50) for i in range(0, DISPLAY.height, 90)]
-
-        self.shield_active = False
-        self.shield_item = None
-        self.next_shield_spawn = ITEMS.shield_spawn_interval_frames
-
-        self.boost_timer = 0
-        self.boost_cooldown = 0
-        self.boost_used_in_round = False
-
-        self.mission = self.generate_mission()
-        self.touch_start = None
-        self.mobile_left_pressed = False
-        self.mobile_right_pressed = False
-        self.mobile_boost_pressed = False
-
-    def spawn_initial_enemies(self):
-        for idx in range(BALANCE.enemy_count):
-            lane = idx % len(self.lane_x)
-            self.enemies.append(
-                {
-                    "lane": lane,
-                    "target_lane": lane,
-                    "x": self.lane_x[lane],
-                    "y": -220 * idx - 80,
-                    "speed_mul": random.uniform(0.92, 1.15),
-                    "ai_timer": random.randint(25, 110),
-                }
-            )
+        self.replay_rounds = None
+        self.replay_inputs = None
+        self.playback_rate = playback_rate
+        self.playback_budget = 0.0
+        if replay_path:
+            self.replay_rounds = ReplayReader(replay_path, profile=self.profile).rounds()
+            if not self.load_next_replay_round():
+                self.running = False
+        elif record_replays:
+            self.recorder = self.open_session_recorder()
+        self.scenes.push(StartMenuScene(self))
+
+    def open_session_recorder(self) -> Optional[ReplayWriter]:
+        try:
+            os.makedirs(SAVE.replay_dir, exist_ok=True)
+            stem = os.path.join(SAVE.replay_dir, time.strftime("session-%Y%m%d-%H%M%S"))
+            path, suffix = f"{stem}.crr", 1
+            while os.path.exists(path):  # 같은 초에 프로필이 바뀌어 새 파일을 열 때 앞 세션을 덮어쓰지 않는다.
+                suffix += 1
+                path = f"{stem}-{suffix}.crr"
+            return ReplayWriter(path, self.profile)
+        except OSError:
+            return None
+
+    def load_next_replay_round(self) -> bool:
+        replay_round = next(self.replay_rounds, None)
+        if replay_round is None:
+            return False
+        self.reset_round(replay_round.seed)
+        self.selected_vehicle_idx = replay_round.vehicle_idx
+        self.replay_inputs = replay_round.inputs()
+        self.playback_budget = 0.0
+        return True
+
+    @property
+    def selected_vehicle_idx(self) -> int:
+        return self.sim.vehicle_idx
+
+    @selected_vehicle_idx.setter
+    def selected_vehicle_idx(self, idx: int):
+        self.sim.vehicle_idx = idx
+
+    @property
+    def current_theme(self) -> TrackTheme:
+        return self.sim.theme
+
+    def reset_round(self, seed=None):
+        if self.telemetry:  # 게임오버 없이 다시 시작하는 라운드
+            self.telemetry.end_round(self.sim.frame_counter, self.sim.score, False)
+        if self.profile_watcher:
+            profile = self.profile_watcher.take()
+            if profile is not None:
+                self.apply_profile(profile)
+        self.sim.reset(seed)
+        self.snapshot_positions()
+
+    def apply_profile(self, profile: ConfigProfile):
+        """라운드 사이에 새 프로필로 시뮬레이션을 갈아 끼운다. 고른 차량 번호는 가능하면 유지한다."""
+        vehicle_idx = min(self.sim.vehicle_idx, len(profile.vehicles) - 1)
+        instrumented = self.profiler.enabled
+        if instrumented:
+            self.profiler.uninstrument()
+        self.profile = profile
+        self.sim = RaceSimulation(vehicle_idx=vehicle_idx, track=TRACK, prefetch_track=True, **profile.simulation_options())
+        self.sim.telemetry = self.telemetry
+        self.vehicles = self.sim.vehicles
+        self.track_themes = self.sim.track_themes
+        if instrumented:
+            self.update_profiling()
+        if self.recorder:  # 리플레이 헤더의 설정 해시가 달라지므로 새 세션 파일에 이어 기록한다.
+            self.recorder.close()
+            self.recorder = self.open_session_recorder()
+
+    def load_sounds(self):
+        crash = self.loader.load_sound(ASSETS.crash_sfx, lazy=True)
+        boost = self.loader.load_sound(ASSETS.boost_sfx, lazy=True)
+        shield = self.loader.load_sound(ASSETS.shield_sfx, lazy=True)
+        self.audio.register("crash", crash, priority=10, volume=0.8)
+        self.audio.register("boost", boost, priority=5, min_interval=0.3, volume=0.6)
+        self.audio.register("shield", shield, priority=5, min_interval=0.2, volume=0.7)
+        self.loader.preload([crash, boost, shield])
+        self.has_bgm = self.loader.load_bgm(ASSETS.bgm, volume=0.5)
 
-    def generate_mission(self):
-        mission_type = random.choice(["survive", "no_boost"])
-        if mission_type == "survive":
-            return {
-                "type": "survive",
-                "label": "미션: 20초 생존",
-                "target_frames": DISPLAY.fps * 20,
-                "completed": False,
-                "failed": False,
-            }
-        return {
-            "type": "no_boost",
-            "label": "미션: 25초 노부스트",
-            "target_frames": DISPLAY.fps * 25,
-            "completed": False,
-            "failed": False,
-        }
+    def begin_round(self):
+        self.start_bgm()
+        if self.recorder:
+            self.recorder.begin_round(self.sim.seed, self.sim.vehicle_idx)
+        if self.telemetry:
+            self.telemetry.begin_round(self.sim.seed, self.sim.vehicle_idx)
 
     def start_bgm(self):
         if self.has_bgm:
-            pygame.mixer.music.play(-1)
+            self.audio.play_music(-1)
 
     def stop_bgm(self):
         if self.has_bgm:
-            pygame.mixer.music.stop()
+            self.audio.stop_music()
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
                 return
+            if event.type == pygame.KEYDOWN and self.handle_debug_key(event.key):
+                continue
+            self.scenes.top.handle_event(event)
+
+    def update_profiling(self):
+        """오버레이나 트레이스가 켜져 있을 때만 구간 계측 래퍼를 건다."""
+        wanted = self.show_frame_time or self.profiler.tracing
+        if wanted and not self.profiler.enabled:
+            self.profiler.instrument(self, self.PROFILED_GAME_PHASES)
+            self.profiler.instrument(self.sim, self.PROFILED_SIM_PHASES)
+        elif not wanted and self.profiler.enabled:
+            self.profiler.uninstrument()
+
+    def toggle_trace(self):
+        if self.profiler.tracing:
+            self.profiler.close_trace()
+        else:
+            os.makedirs(DISPLAY.profile_trace_dir, exist_ok=True)
+            self.profiler.open_trace(os.path.join(DISPLAY.profile_trace_dir, time.strftime("trace-%Y%m%d-%H%M%S.jsonl")))
+        self.update_profiling()
+
+    def handle_debug_key(self, key: int) -> bool:
+        """어느 씬에서나 받는 개발용 키. 처리했으면 True."""
+        if key == pygame.K_F2:
+            self.dirty_rendering = not self.dirty_rendering
+            self.last_rendered_scene = None
+        elif key == pygame.K_F3:
+            self.show_frame_time = not self.show_frame_time
+            self.update_profiling()
+        elif key == pygame.K_F4:
+            self.toggle_trace()
+        else:
+            return False
+        return True
+
+    def update(self):
+        """고정 틱 한 번. 맨 위 씬만 진행한다."""
+        self.scenes.top.update()
+
+    def step_simulation(self, tick_input: TickInput):
+        sim = self.sim
+        self.snapshot_positions()
+        had_shield = sim.shield_active
+        boost_cooldown = sim.boost_cooldown
+        if sim.step(tick_input):
+            self.on_crash()
+            return
+        if sim.shield_active and not had_shield:
+            self.audio.play("shield")
+        if sim.boost_cooldown > boost_cooldown:
+            self.audio.play("boost")
+
+    def snapshot_positions(self):
+        """틱 직전 위치를 남겨 두어 렌더링 때 이전/현재 틱 사이를 보간할 수 있게 한다."""
+        sim = self.sim
+        item = sim.shield_item
+        self.previous_positions = (
+            sim.car_x,
+            [(enemy.x, enemy.y) for enemy in sim.enemies],
+            list(sim.line_ys),
+            (item.x, item.y) if item else None,
+            {hazard.id: hazard.y for hazard in sim.hazards},
+        )
 
-            if event.type == pygame.KEYDOWN:
-                self.handle_keydown(event.key)
-            elif event.type == pygame.FINGERDOWN:
-                self.touch_start = (event.x * DISPLAY.width, event.y * DISPLAY.height)
-            elif event.type == pygame.FINGERUP:
-                self.handle_swipe((event.x * DISPLAY.width, event.y * DISPLAY.height))
-                self.touch_start = None
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                self.handle_mobile_button_press(event.pos, True)
-                self.touch_start = event.pos
-            elif event.type == pygame.MOUSEBUTTONUP:
-                self.handle_mobile_button_press(event.pos, False)
-                if self.touch_start:
-                    self.handle_swipe(event.pos)
-                self.touch_start = None
-
-    def handle_keydown(self, key: int):
-        if self.state == SceneState.START:
-            if key == pygame.K_SPACE:
-                self.state = SceneState.PLAYING
-                self.start_bgm()
-            elif key == pygame.K_1:
-                self.selected_vehicle_idx = 0
-            elif key == pygame.K_2:
-                self.selected_vehicle_idx = 1
-            elif key == pygame.K_3:
-                self.selected_vehicle_idx = 2
-            elif key == pygame.K_ESCAPE:
-                self.running = False
-
-        elif self.state == SceneState.PLAYING:
-            if key == pygame.K_p:
-                self.state = SceneState.PAUSED
-            elif key == pygame.K_LSHIFT:
-                self.activate_boost()
-            elif key == pygame.K_ESCAPE:
-                self.running = False
-
-        elif self.state == SceneState.PAUSED:
-            if key == pygame.K_p:
-                self.state = SceneState.PLAYING
-            elif key == pygame.K_ESCAPE:
-                self.running = False
+    def blend(self, previous: float, current: float) -> float:
+        return previous + (current - previous) * self.render_alpha
+
+    def view_car_x(self) -> float:
+        return self.blend(self.previous_positions[0], self.sim.car_x)
+
+    def view_enemies(self) -> list[tuple[float, float]]:
+        if self.render_alpha == 1.0:
+            return [(enemy.x, enemy.y) for enemy in self.sim.enemies]
+        positions = []
+        for enemy, (prev_x, prev_y) in zip(self.sim.enemies, self.previous_positions[1]):
+            if enemy.y < prev_y:  # 리스폰/실드로 위로 재배치된 적은 보간하지 않는다.
+                positions.append((enemy.x, enemy.y))
+            else:
+                positions.append((self.blend(prev_x, enemy.x), self.blend(prev_y, enemy.y)))
+        return positions
+
+    def view_line_ys(self) -> list[float]:
+        if self.render_alpha == 1.0:
+            return self.sim.line_ys
+        return [
+            y if y < prev_y else self.blend(prev_y, y) for y, prev_y in zip(self.sim.line_ys, self.previous_positions[2])
+        ]
 
-        elif self.state == SceneState.GAME_OVER:
-            if key == pygame.K_y:
-                self.reset_round()
-                self.state = SceneState.PLAYING
-                self.start_bgm()
-            elif key in (pygame.K_n, pygame.K_ESCAPE):
-                self.running = False
+    def view_shield_item(self) -> Optional[tuple[float, float]]:
+        item = self.sim.shield_item
+        if item is None:
+            return None
+        previous = self.previous_positions[3]
+        if previous is None or item.y < previous[1]:
+            return item.x, item.y
+        return item.x, self.blend(previous[1], item.y)
+
+    def view_hazards(self) -> list[tuple[float, float]]:
+        previous = self.previous_positions[4]
+        positions = []
+        for hazard in self.sim.hazards:
+            prev_y = previous.get(hazard.id)
+            if prev_y is None or hazard.y < prev_y or self.render_alpha == 1.0:
+                positions.append((hazard.x, hazard.y))
+            else:
+                positions.append((hazard.x, self.blend(prev_y, hazard.y)))
+        return positions
+
+    def on_crash(self):
+        self.audio.play("crash")
+        self.stop_bgm()
+        self.scenes.push(GameOverScene(self))
+        if self.recorder:
+            self.recorder.end_round(self.sim.frame_counter, self.sim.score)
+        if self.telemetry:
+            self.telemetry.end_round(self.sim.frame_counter, self.sim.score, True)
+        if self.replay_rounds is None:
+            self.last_rank = self.save_system.submit_score(self.sim.score, self.sim.vehicle.name, self.sim.theme.name)
+            self.high_score = self.save_system.highscore
 
-    def activate_boost(self):
-        if self.boost_cooldown == 0:
-            self.boost_timer = BALANCE.boost_duration_frames
-            self.boost_cooldown = BALANCE.boost_cooldown_frames
-            self.boost_used_in_round = True
-            if self.mission["type"] == "no_boost" and not self.mission["completed"]:
-                self.mission["failed"] = True
-
-    def handle_mobile_button_press(self, pos, is_pressed):
-        left_btn, right_btn, boost_btn = self.mobile_button_rects()
-        if left_btn.collidepoint(pos):
-            self.mobile_left_pressed = is_pressed
-        if right_btn.collidepoint(pos):
-            self.mobile_right_pressed = is_pressed
-        if boost_btn.collidepoint(pos):
-            self.mobile_boost_pressed = is_pressed
-            if is_pressed and self.state == SceneState.PLAYING:
-                self.activate_boost()
-
-    def handle_swipe(self, end_pos):
-        if not self.touch_start or self.state != SceneState.PLAYING:
-            return
-        dx = end_pos[0] - self.touch_start[0]
-        dy = abs(end_pos[1] - self.touch_start[1])
-        if abs(dx) < 35 or abs(dx) < dy:
-            return
-        if dx > 0:
-            self.player_target_x = min(self.player_target_x + 90, self.lane_x[-1])
-        else:
-            self.player_target_x = max(self.player_target_x - 90, self.lane_x[0])
+    def draw_base_scene(self):
+        self.screen.blit(self.backgrounds.background(self.sim.theme), (0, 0))
+        return self.draw_lines()
 
-    def update_playing(self):
-        self.frame_counter += 1
-        keys = pygame.key.get_pressed()
-        selected = self.vehicles[self.selected_vehicle_idx]
+    def draw_lines(self):
+        sprite = self.backgrounds.line_sprite(self.sim.theme)
+        line_x = DISPLAY.width // 2 - LINE_SIZE[0] // 2
+        positions = self.viewport.points([(line_x, line_y) for line_y in self.view_line_ys()])
+        return [self.screen.blit(sprite, pos) for pos in positions]
 
-        left_pressed = keys[pygame.K_LEFT] or self.mobile_left_pressed
-        right_pressed = keys[pygame.K_RIGHT] or self.mobile_right_pressed
+    def draw_text(self, text: str, color, pos, font=None) -> pygame.Rect:
+        """pos는 논리 좌표다."""
+        return self.screen.blit(self.text_cache.render(font or self.font, text, color), self.viewport.point(*pos))
 
-        accel = selected.acceleration
-        max_speed = min(selected.max_speed, BALANCE.max_player_speed)
-        if self.boost_timer > 0:
-            max_speed += BALANCE.boost_extra_speed
+    def draw_glyphs(self, text: str, color, pos, font=None) -> pygame.Rect:
+        return self.text_cache.blit_glyphs(self.screen, font or self.font, text, color, self.viewport.point(*pos))
 
-        if left_pressed:
-            self.car_velocity_x -= accel
-        elif right_pressed:
-            self.car_velocity_x += accel
-        else:
-            self.car_velocity_x *= 0.85
-
-        self.car_velocity_x = max(-max_speed, min(max_speed, self.car_velocity_x))
-        self.car_x += self.car_velocity_x
-
-        snap_factor = BALANCE.lane_change_speed + selected.handling
-        self.car_x += (self.player_target_x - self.car_x) * snap_factor
-        self.car_x = max(50, min(DISPLAY.width - 100, self.car_x))
-
-        if self.boost_timer > 0:
-            self.boost_timer -= 1
-        if self.boost_cooldown > 0:
-            self.boost_cooldown -= 1
-
-        self.update_enemies()
-        self.update_shield_item()
-        self.update_mission_state()
-        self.handle_collisions()
-        self.move_lines()
-
-        if self.frame_counter % BALANCE.score_tick_frames == 0:
-            self.score += 1
-
-    def update_enemies(self):
-        player_lane = min(range(len(self.lane_x)), key=lambda idx: abs(self.lane_x[idx] - self.car_x))
-
-        for enemy in self.enemies:
-            enemy["ai_timer"] -= 1
-            if enemy["ai_timer"] <= 0:
-                enemy["ai_timer"] = random.randint(30, 100)
-                close_to_player = abs(enemy["y"] - self.car_y) < 180
-                if close_to_player and random.random() < 0.65:
-                    enemy["target_lane"] = player_lane  # 블로킹
-                else:
-                    delta = random.choice([-1, 0, 1])
-                    enemy["target_lane"] = max(0, min(len(self.lane_x) - 1, enemy["lane"] + delta))
-
-            enemy["x"] += (self.lane_x[enemy["target_lane"]] - enemy["x"]) * 0.13
-            if abs(enemy["x"] - self.lane_x[enemy["target_lane"]]) < 3:
-                enemy["lane"] = enemy["target_lane"]
-
-            enemy["y"] += self.enemy_speed * enemy["speed_mul"]
-
-            if enemy["y"] > DISPLAY.height + 100:
-                enemy["y"] = random.randint(-360, -80)
-                enemy["lane"] = random.randint(0, len(self.lane_x) - 1)
-                enemy["target_lane"] = enemy["lane"]
-                enemy["x"] = self.lane_x[enemy["lane"]]
-                self.score += 2
-                self.enemy_speed += BALANCE.enemy_speed_increase
-                self.line_speed += BALANCE.line_speed_increase
-
-    def update_shield_item(self):
-        if self.shield_item:
-            self.shield_item.y += ITEMS.shield_fall_speed
-            if self.shield_item.y > DISPLAY.height:
-                self.shield_item = None
-
-        if not self.shield_active and not self.shield_item:
-            self.next_shield_spawn -= 1
-            if self.next_shield_spawn <= 0:
-                x = random.randint(60, DISPLAY.width - 90)
-                w, h = ITEMS.shield_size
-                self.shield_item = pygame.Rect(x, -h, w, h)
-                self.next_shield_spawn = ITEMS.shield_spawn_interval_frames
-
-    def update_mission_state(self):
-        if self.mission["completed"] or self.mission["failed"]:
-            return
+    def draw_counter(self, label: str, value: str, color, pos) -> pygame.Rect:
+        """고정 라벨은 LRU 캐시에서, 자주 바뀌는 값은 글리프 아틀라스로 그린다."""
+        label_rect = self.draw_text(label, color, pos)
+        value_rect = self.text_cache.blit_glyphs(self.screen, self.font, value, color, (label_rect.right, label_rect.top))
+        return label_rect.union(value_rect)
 
-        if self.frame_counter >= self.mission["target_frames"]:
-            self.mission["completed"] = True
-            self.score += 30
-
-    def handle_collisions(self):
-        car_rect = pygame.Rect(self.car_x, self.car_y, 50, 90)
-
-        if self.shield_item and car_rect.colliderect(self.shield_item):
-            self.shield_active = True
-            self.shield_item = None
-
-        for enemy in self.enemies:
-            enemy_rect = pygame.Rect(enemy["x"], enemy["y"], 50, 80)
-            if car_rect.colliderect(enemy_rect):
-                if self.shield_active:
-                    self.shield_active = False
-                    enemy["y"] = random.randint(-220, -80)
-                    return
-
-                if self.crash_sound:
-                    self.crash_sound.play()
-                self.stop_bgm()
-                self.state = SceneState.GAME_OVER
-                self.high_score = self.save_system.update_highscore(self.score)
-                return
+    def draw_hud(self):
+        sim = self.sim
+        mission = sim.mission
+        vehicle = sim.vehicle
+        mission_color = (120, 255, 150) if mission["completed"] else ((255, 120, 120) if mission["failed"] else WHITE)
+        target_seconds = mission["target_frames"] // DISPLAY.fps
+        boost_value = "READY" if sim.boost_cooldown == 0 else str(sim.boost_cooldown // DISPLAY.fps + 1)
+
+        rects = [
+            self.draw_counter("Score: ", str(sim.score), WHITE, (10, 8)),
+            self.draw_counter("Best: ", str(self.high_score), WHITE, (10, 32)),
+            self.draw_counter("Boost: ", f"{boost_value}s", WHITE, (10, 56)),
+            self.draw_text(f"차량: {vehicle.name}", vehicle.color, (10, 80)),
+            self.draw_text(f"트랙: {sim.theme.name}", WHITE, (10, 104)),
+            self.draw_text(mission["label"], mission_color, (10, 128)),
+            self.draw_glyphs(f"{min(sim.frame_counter // DISPLAY.fps, target_seconds)} / {target_seconds}s", mission_color, (10, 152)),
+        ]
 
-    def move_lines(self):
-        for line in self.lines:
-            line.y += self.line_speed
-            if line.y > DISPLAY.height:
-                line.y = -90
+        if sim.shield_active:
+            rects.append(self.draw_text("Shield: ON", (80, 220, 255), (DISPLAY.width - 145, 10)))
 
-    def draw_base_scene(self):
-        self.screen.fill(self.current_theme.bg_color)
-        pygame.draw.rect(self.screen, self.current_theme.edge_color, [0, 0, 50, DISPLAY.height])
-        pygame.draw.rect(self.screen, self.current_theme.edge_color, [DISPLAY.width - 50, 0, 50, DISPLAY.height])
-        pygame.draw.rect(self.screen, self.current_theme.road_color, [50, 0, DISPLAY.width - 100, DISPLAY.height])
-        for line in self.lines:
-            pygame.draw.rect(self.screen, self.current_theme.line_color, line)
+        if self.show_frame_time:
+            rects += self.draw_profile_overlay()
+        return rects
 
-    def draw_hud(self):
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        high_text = self.font.render(f"Best: {self.high_score}", True, WHITE)
-        boost_text = self.font.render(
-            f"Boost: {'READY' if self.boost_cooldown == 0 else self.boost_cooldown // DISPLAY.fps + 1}s",
-            True,
-            WHITE,
-        )
-        vehicle = self.vehicles[self.selected_vehicle_idx]
-        vehicle_text = self.font.render(f"차량: {vehicle.name}", True, vehicle.color)
-        mission_color = (120, 255, 150) if self.mission["completed"] else ((255, 120, 120) if self.mission["failed"] else WHITE)
-        mission_text = self.font.render(self.mission["label"], True, mission_color)
-        mission_prog = self.font.render(
-            f"{min(self.frame_counter // DISPLAY.fps, self.mission['target_frames'] // DISPLAY.fps)} / {self.mission['target_frames'] // DISPLAY.fps}s",
-            True,
-            mission_color,
-        )
-        theme_text = self.font.render(f"트랙: {self.current_theme.name}", True, WHITE)
-
-        self.screen.blit(score_text, (10, 8))
-        self.screen.blit(high_text, (10, 32))
-        self.screen.blit(boost_text, (10, 56))
-        self.screen.blit(vehicle_text, (10, 80))
-        self.screen.blit(theme_text, (10, 104))
-        self.screen.blit(mission_text, (10, 128))
-        self.screen.blit(mission_prog, (10, 152))
-
-        if self.shield_active:
-            shield_text = self.font.render("Shield: ON", True, (80, 220, 255))
-            self.screen.blit(shield_text, (DISPLAY.width - 145, 10))
-
-    def draw_items(self):
-        if self.shield_item:
-            pygame.draw.ellipse(self.screen, (80, 220, 255), self.shield_item)
-
-        if self.shield_active:
-            aura_rect = pygame.Rect(self.car_x - 5, self.car_y - 5, 60, 100)
-            pygame.draw.ellipse(self.screen, (80, 220, 255), aura_rect, 3)
-
-    def draw_mobile_controls(self):
-        left_btn, right_btn, boost_btn = self.mobile_button_rects()
-        pygame.draw.rect(self.screen, (80, 80, 80), left_btn, border_radius=8)
-        pygame.draw.rect(self.screen, (80, 80, 80), right_btn, border_radius=8)
-        pygame.draw.rect(self.screen, (90, 60, 120), boost_btn, border_radius=8)
-        self.screen.blit(self.font.render("◀", True, WHITE), (left_btn.x + 17, left_btn.y + 8))
-        self.screen.blit(self.font.render("▶", True, WHITE), (right_btn.x + 17, right_btn.y + 8))
-        self.screen.blit(self.font.render("BOOST", True, WHITE), (boost_btn.x + 7, boost_btn.y + 10))
+    def draw_profile_overlay(self):
+        profiler = self.profiler
+        lines = [
+            f"{profiler.average_ms:.2f} ms (max {profiler.max_ms:.1f})",
+            f"p50 {profiler.percentile_ms(0.5):.2f} p99 {profiler.percentile_ms(0.99):.2f}",
+            f"text {self.text_cache.hit_rate:.1%} {len(self.text_cache)}/{self.text_cache.max_entries}",
+        ]
+        for label in self.PROFILED_GAME_PHASES + self.PROFILED_SIM_PHASES:
+            lines.append(f"{label} {profiler.phase_average_ms(label):.3f}")
+        if profiler.tracing:
+            lines.append("trace REC")
+
+        x = DISPLAY.width - 190
+        return [self.draw_glyphs(line, WHITE, (x, 34 + idx * 18), self.small_font) for idx, line in enumerate(lines)]
+
+    def queue_items(self, batch: SpriteBatch):
+        sim = self.sim
+        viewport = self.viewport
+        if sim.hazards:
+            batch.extend(LAYER_HAZARD, self.backgrounds.hazard_sprite(sim.track.hazard_size), viewport.points(self.view_hazards()))
+
+        item_pos = self.view_shield_item()
+        if item_pos:
+            item = sim.shield_item
+            batch.add(LAYER_ITEM, self.sprites.ellipse(viewport.size(item.w, item.h), (80, 220, 255)), viewport.point(*item_pos))
+
+        if sim.shield_active:
+            aura = self.sprites.ellipse(viewport.size(60, 100), (80, 220, 255), viewport.length(3))
+            batch.add(LAYER_AURA, aura, viewport.point(self.view_car_x() - 5, sim.car_y - 5))
+
+    def queue_mobile_controls(self, batch: SpriteBatch):
+        for sprite, rect in self.mobile_buttons:
+            batch.add(LAYER_CONTROLS, sprite, rect.topleft)
+
+    def bake_mobile_buttons(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """모바일 버튼은 위치와 모양이 고정이라 라벨까지 창 해상도로 한 장씩 구워 둔다."""
+        labels = (("◀", (17, 8), (80, 80, 80)), ("▶", (17, 8), (80, 80, 80)), ("BOOST", (7, 10), (90, 60, 120)))
+        viewport = self.viewport
+        buttons = []
+        for rect, (text, offset, color) in zip(self.mobile_button_rects(), labels):
+            label = self.text_cache.render(self.font, text, WHITE)
+            physical = viewport.rect(*rect)
+            sprite = self.sprites.button(physical.size, color, label, viewport.size(*offset), viewport.length(8))
+            buttons.append((sprite, physical))
+        return buttons
 
     def mobile_button_rects(self):
+        """논리 좌표의 버튼 영역(입력 판정용)."""
         return (
             pygame.Rect(18, DISPLAY.height - 58, 48, 42),
             pygame.Rect(72, DISPLAY.height - 58, 48, 42),
@@ -424,47 +430,63 @@ class CarRaceGame:
         )
 
     def draw_overlay_text(self, message: str, sub_message: str):
-        text1 = self.large_font.render(message, True, RED if "Game Over" in message else WHITE)
-        text2 = self.font.render(sub_message, True, WHITE)
-        self.screen.blit(text1, (DISPLAY.width // 2 - text1.get_width() // 2, DISPLAY.height // 2 - 80))
-        self.screen.blit(text2, (DISPLAY.width // 2 - text2.get_width() // 2, DISPLAY.height // 2 - 42))
-
-    def draw_start_menu(self):
-        self.draw_overlay_text("SPACE: Start", "1/2/3 으로 차량 선택")
-        y = DISPLAY.height // 2
-        for idx, vehicle in enumerate(self.vehicles, start=1):
-            selected = "<" if idx - 1 == self.selected_vehicle_idx else " "
-            line = f"{selected} {idx}. {vehicle.name}  가속:{vehicle.acceleration:.2f} 최고속:{vehicle.max_speed:.1f} 핸들링:{vehicle.handling:.2f}"
-            txt = self.font.render(line, True, vehicle.color)
-            self.screen.blit(txt, (16, y + idx * 24))
+        text1 = self.text_cache.render(self.large_font, message, RED if "Game Over" in message else WHITE)
+        text2 = self.text_cache.render(self.font, sub_message, WHITE)
+        self.draw_centered(text1, DISPLAY.height // 2 - 80)
+        self.draw_centered(text2, DISPLAY.height // 2 - 42)
+
+    def draw_centered(self, surface: pygame.Surface, y: int) -> pygame.Rect:
+        """논리 y에 가로 가운데로 놓는다."""
+        return self.screen.blit(surface, (self.viewport.center_x(surface.get_width()), self.viewport.point(0, y)[1]))
 
     def render(self):
-        self.draw_base_scene()
-        self.draw_items()
-        for enemy in self.enemies:
-            self.screen.blit(self.obs_img, (enemy["x"], enemy["y"]))
-        self.screen.blit(self.car_img, (self.car_x, self.car_y))
-        self.draw_hud()
-        self.draw_mobile_controls()
-
-        if self.state == SceneState.START:
-            self.draw_start_menu()
-        elif self.state == SceneState.PAUSED:
-            self.draw_overlay_text("Paused", "Press P to Resume")
-        elif self.state == SceneState.GAME_OVER:
-            self.draw_overlay_text("Game Over!", "Play again? (Y/N)")
-
-        pygame.display.flip()
+        scene = self.scenes.top
+        scene.render()
+        self.last_rendered_scene = scene
+        self.last_rendered_theme = self.sim.theme
+
+    def present(self, rects=None):
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
 
     def run(self):
+        """고정 틱 누산기 루프. 시뮬레이션은 항상 TICK_SECONDS 단위로 진행하고, 렌더링은 남은 시간
+        비율만큼 보간해 그린다. 느린 프레임에서는 렌더 프레임을 건너뛰고 틱을 몰아서 진행하되,
+        max_catch_up_ticks를 넘는 지연은 버려서(그만큼만 느려짐) 따라잡기 폭주를 막는다.
+        """
+        max_lag = TICK_SECONDS * DISPLAY.max_catch_up_ticks
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
+            now = time.perf_counter()
+            accumulator += min(now - previous, max_lag)
+            previous = now
+
+            self.profiler.start()
             self.handle_events()
 
-            if self.state == SceneState.PLAYING:
-                self.update_playing()
+            while accumulator >= TICK_SECONDS and self.running:
+                accumulator -= TICK_SECONDS
+                self.update()
 
+            scene = self.scenes.top
+            self.render_alpha = accumulator / TICK_SECONDS if self.interpolate and scene.interpolated else 1.0
             self.render()
-            self.clock.tick(DISPLAY.fps)
-
+            self.profiler.stop()
+            self.clock.tick(scene.frame_rate)  # 메뉴/일시정지 씬은 낮은 FPS로 CPU를 아낀다.
+
+        self.scenes.clear()
+        if self.recorder:
+            self.recorder.close()
+        if self.profile_watcher:
+            self.profile_watcher.close()
+        if self.telemetry:
+            self.telemetry.end_round(self.sim.frame_counter, self.sim.score, False)
+            self.telemetry.close()
+        self.profiler.close_trace()
+        self.save_system.close()
+        self.audio.close()
         pygame.quit()
         sys.exit()
@@ -0,0 +1,384 @@
+"""씬 스택: 메뉴/차량 선택/플레이/일시정지/게임오버/리플레이 뷰어가 각자 입력·틱·렌더링과 에셋 수명을 맡는다."""
+
+from typing import Optional
+
+import pygame
+
+from config import ASSETS, DISPLAY, WHITE, YELLOW
+from core.simulation import CAR_SIZE, ENEMY_SIZE, TickInput
+from systems.sprite_batch import LAYER_CAR, LAYER_ENEMY
+
+
+class Scene:
+    """enter()에서 자기 에셋을 읽고 exit()에서 놓는다. 위에 다른 씬이 쌓여 있는 동안에는 에셋을 유지한다.
+
+    입력과 고정 틱 갱신은 맨 위 씬만 받는다. frame_rate는 이 씬이 맨 위일 때의 렌더 FPS 상한이다.
+    """
+
+    frame_rate = DISPLAY.idle_render_fps
+    interpolated = False
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            self.handle_keydown(event.key)
+
+    def handle_keydown(self, key: int):
+        pass
+
+    def update(self):
+        pass
+
+    def render(self):
+        raise NotImplementedError
+
+
+class SceneStack:
+    def __init__(self):
+        self.scenes: list[Scene] = []
+
+    @property
+    def top(self) -> Optional[Scene]:
+        return self.scenes[-1] if self.scenes else None
+
+    def push(self, scene: Scene) -> Scene:
+        self.scenes.append(scene)
+        scene.enter()
+        return scene
+
+    def pop(self) -> Scene:
+        scene = self.scenes.pop()
+        scene.exit()
+        return scene
+
+    def replace(self, scene: Scene) -> Scene:
+        """쌓인 씬을 모두 내리고(에셋 해제) scene 하나로 바꾼다."""
+        self.clear()
+        return self.push(scene)
+
+    def clear(self):
+        while self.scenes:
+            self.pop()
+
+    def below(self, scene: Scene) -> Optional[Scene]:
+        idx = self.scenes.index(scene)
+        return self.scenes[idx - 1] if idx else None
+
+
+class StartMenuScene(Scene):
+    """도로 배경만 그리는 가벼운 시작 화면. 차/적 스프라이트는 플레이를 시작할 때 읽는다."""
+
+    def handle_keydown(self, key: int):
+        game = self.game
+        if key == pygame.K_SPACE:
+            game.scenes.replace(ReplayScene(game) if game.replay_rounds is not None else PlayingScene(game))
+        elif key == pygame.K_ESCAPE:
+            game.running = False
+        elif game.replay_rounds is not None:
+            return
+        elif pygame.K_1 <= key < pygame.K_1 + len(game.vehicles):
+            game.selected_vehicle_idx = key - pygame.K_1
+        elif key == pygame.K_v:
+            game.scenes.push(VehicleSelectScene(game))
+
+    def render(self):
+        game = self.game
+        game.draw_base_scene()
+        if game.replay_rounds is not None:
+            game.draw_overlay_text("SPACE: 리플레이 재생", "ESC: 종료")
+        else:
+            game.draw_overlay_text("SPACE: Start", f"1~{len(game.vehicles)} 으로 차량 선택, V: 차량 보기")
+        y = DISPLAY.height // 2
+        for idx, vehicle in enumerate(game.vehicles, start=1):
+            selected = "<" if idx - 1 == game.selected_vehicle_idx else " "
+            line = f"{selected} {idx}. {vehicle.name}  가속:{vehicle.acceleration:.2f} 최고속:{vehicle.max_speed:.1f} 핸들링:{vehicle.handling:.2f}"
+            game.draw_text(line, vehicle.color, (16, y + idx * 24))
+        game.present()
+
+
+class VehicleSelectScene(Scene):
+    """차량별 색을 입힌 미리보기 스프라이트를 들어올 때 만들고 나갈 때 버린다."""
+
+    STAT_BARS = (("가속", "acceleration", 0.5), ("최고속", "max_speed", 12.0), ("핸들링", "handling", 0.2))
+
+    def enter(self):
+        game = self.game
+        base = game.loader.load_image(ASSETS.car_image, game.viewport.size(*CAR_SIZE), (30, 180, 255))
+        self.previews = []
+        for vehicle in game.vehicles:
+            preview = base.copy()
+            preview.fill(vehicle.color, special_flags=pygame.BLEND_RGB_MULT)
+            self.previews.append(preview)
+        self.original_idx = game.selected_vehicle_idx
+
+    def exit(self):
+        self.previews = None
+
+    def handle_keydown(self, key: int):
+        game = self.game
+        count = len(game.vehicles)
+        if key == pygame.K_LEFT:
+            game.selected_vehicle_idx = (game.selected_vehicle_idx - 1) % count
+        elif key == pygame.K_RIGHT:
+            game.selected_vehicle_idx = (game.selected_vehicle_idx + 1) % count
+        elif pygame.K_1 <= key < pygame.K_1 + count:
+            game.selected_vehicle_idx = key - pygame.K_1
+        elif key in (pygame.K_SPACE, pygame.K_RETURN):
+            game.scenes.pop()
+        elif key == pygame.K_ESCAPE:
+            game.selected_vehicle_idx = self.original_idx
+            game.scenes.pop()
+
+    def render(self):
+        game = self.game
+        screen = game.screen
+        viewport = game.viewport
+        game.draw_base_scene()
+        game.draw_overlay_text("차량 선택", "←/→ 선택, SPACE 확인, ESC 취소")
+
+        slot = DISPLAY.width // len(self.previews)
+        y = DISPLAY.height // 2
+        for idx, preview in enumerate(self.previews):
+            x = slot * idx + (slot - CAR_SIZE[0]) // 2
+            rect = screen.blit(preview, viewport.point(x, y))
+            if idx == game.selected_vehicle_idx:
+                margin = viewport.length(12)
+                pygame.draw.rect(screen, YELLOW, rect.inflate(margin, margin), viewport.length(2))
+
+        vehicle = game.sim.vehicle
+        game.draw_text(vehicle.name, vehicle.color, (40, y + 110))
+        for row, (label, attr, scale) in enumerate(self.STAT_BARS):
+            bar_y = y + 140 + row * 24
+            game.draw_text(label, WHITE, (40, bar_y), game.small_font)
+            fill = min(1.0, getattr(vehicle, attr) / scale)
+            pygame.draw.rect(screen, (70, 70, 70), viewport.rect(120, bar_y + 2, 220, 12))
+            if fill > 0:
+                pygame.draw.rect(screen, vehicle.color, viewport.rect(120, bar_y + 2, int(220 * fill), 12))
+        game.present()
+
+
+class PlayingScene(Scene):
+    frame_rate = DISPLAY.max_render_fps
+    interpolated = True
+
+    def enter(self):
+        # 스프라이트는 창 해상도 크기로 원본에서 바로 읽는다(ResourceLoader가 크기별로 캐시).
+        loader = self.game.loader
+        viewport = self.game.viewport
+        self.car_img = loader.load_image(ASSETS.car_image, viewport.size(*CAR_SIZE), (30, 180, 255))
+        self.obs_img = loader.load_image(ASSETS.obstacle_image, viewport.size(*ENEMY_SIZE), (220, 100, 20))
+        self.dirty_rects = []
+        self.reset_input()
+        self.game.begin_round()
+
+    def exit(self):
+        self.game.stop_bgm()
+        self.car_img = self.obs_img = None
+
+    def reset_input(self):
+        self.pending_boost = False
+        self.pending_swipe = 0
+        self.touch_start = None
+        self.mobile_left_pressed = False
+        self.mobile_right_pressed = False
+        self.mobile_boost_pressed = False
+
+    def restart(self):
+        """게임오버 후 같은 씬에서 새 라운드를 시작한다."""
+        self.game.reset_round()
+        self.reset_input()
+        self.game.begin_round()
+
+    def handle_event(self, event):
+        """터치/마우스 좌표는 논리 좌표로 되돌려 판정한다(스와이프 거리도 논리 픽셀 기준)."""
+        viewport = self.game.viewport
+        if event.type == pygame.KEYDOWN:
+            self.handle_keydown(event.key)
+        elif event.type == pygame.FINGERDOWN:
+            width, height = viewport.physical_size
+            self.touch_start = viewport.to_logical(event.x * width, event.y * height)
+        elif event.type == pygame.FINGERUP:
+            width, height = viewport.physical_size
+            self.handle_swipe(viewport.to_logical(event.x * width, event.y * height))
+            self.touch_start = None
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            pos = viewport.to_logical(*event.pos)
+            self.handle_mobile_button_press(pos, True)
+            self.touch_start = pos
+        elif event.type == pygame.MOUSEBUTTONUP:
+            pos = viewport.to_logical(*event.pos)
+            self.handle_mobile_button_press(pos, False)
+            if self.touch_start:
+                self.handle_swipe(pos)
+            self.touch_start = None
+
+    def handle_keydown(self, key: int):
+        game = self.game
+        if key == pygame.K_p:
+            game.scenes.push(PausedScene(game))
+        elif key == pygame.K_LSHIFT:
+            self.pending_boost = True
+        elif key == pygame.K_ESCAPE:
+            game.running = False
+
+    def handle_mobile_button_press(self, pos, is_pressed):
+        left_btn, right_btn, boost_btn = self.game.mobile_button_rects()
+        if left_btn.collidepoint(pos):
+            self.mobile_left_pressed = is_pressed
+        if right_btn.collidepoint(pos):
+            self.mobile_right_pressed = is_pressed
+        if boost_btn.collidepoint(pos):
+            self.mobile_boost_pressed = is_pressed
+            if is_pressed:
+                self.pending_boost = True
+
+    def handle_swipe(self, end_pos):
+        if not self.touch_start:
+            return
+        dx = end_pos[0] - self.touch_start[0]
+        dy = abs(end_pos[1] - self.touch_start[1])
+        if abs(dx) < 35 or abs(dx) < dy:
+            return
+        self.pending_swipe = 1 if dx > 0 else -1
+
+    def collect_input(self) -> TickInput:
+        keys = pygame.key.get_pressed()
+        tick_input = TickInput(
+            left=bool(keys[pygame.K_LEFT] or self.mobile_left_pressed),
+            right=bool(keys[pygame.K_RIGHT] or self.mobile_right_pressed),
+            boost=self.pending_boost,
+            swipe=self.pending_swipe,
+        )
+        self.pending_boost = False
+        self.pending_swipe = 0
+        return tick_input
+
+    def update(self):
+        game = self.game
+        tick_input = self.collect_input()
+        if game.recorder:
+            game.recorder.record(tick_input)
+        game.step_simulation(tick_input)
+
+    def draw_dynamic_layers(self):
+        """HUD를 뺀 움직이는 스프라이트는 레이어 순서로 모아 blits 한 번으로 그린다."""
+        game = self.game
+        batch = game.sprite_batch
+        viewport = game.viewport
+        game.queue_items(batch)
+        batch.extend(LAYER_ENEMY, self.obs_img, viewport.points(game.view_enemies()))
+        batch.add(LAYER_CAR, self.car_img, viewport.point(game.view_car_x(), game.sim.car_y))
+        game.queue_mobile_controls(batch)
+        return batch.flush(game.screen) + game.draw_hud()
+
+    def draw_frame(self):
+        """레이스 화면 전체를 그린다(표시는 하지 않음). 위에 쌓인 오버레이 씬도 이걸로 배경을 깐다."""
+        self.dirty_rects = self.game.draw_base_scene() + self.draw_dynamic_layers()
+
+    def render(self):
+        game = self.game
+        if (
+            game.dirty_rendering
+            and game.last_rendered_scene is self
+            and game.last_rendered_theme is game.sim.theme  # 구간 전환으로 테마가 바뀌면 배경 전체를 다시 그린다.
+        ):
+            self.render_dirty()
+        else:
+            self.render_full()
+
+    def render_dirty(self):
+        """지난 프레임에 그린 영역만 캐시된 배경으로 지우고 다시 그린 뒤 바뀐 사각형만 갱신한다."""
+        game = self.game
+        background = game.backgrounds.background(game.sim.theme)
+        previous = self.dirty_rects
+        for rect in previous:
+            game.screen.blit(background, rect, rect)
+
+        self.dirty_rects = game.draw_lines() + self.draw_dynamic_layers()
+        game.present(previous + self.dirty_rects)
+
+    def render_full(self):
+        self.draw_frame()
+        self.game.present()
+
+
+class ReplayScene(PlayingScene):
+    """기록된 입력으로 라운드를 다시 보여 주는 뷰어. 플레이어 입력은 일시정지/종료만 받는다."""
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key != pygame.K_LSHIFT:
+            self.handle_keydown(event.key)
+
+    def restart(self):
+        game = self.game
+        if not game.load_next_replay_round():
+            game.running = False
+            return
+        self.reset_input()
+        game.begin_round()
+
+    def update(self):
+        """고정 틱마다 playback_rate만큼 기록된 틱을 진행한다(0.5면 2틱 시간에 1틱, 4면 틱 시간마다 4틱)."""
+        game = self.game
+        game.playback_budget += game.playback_rate
+        while game.playback_budget >= 1 and game.scenes.top is self:
+            game.playback_budget -= 1
+            tick_input = next(game.replay_inputs, None)
+            if tick_input is None:  # 충돌 전에 기록이 끝난 라운드
+                game.stop_bgm()
+                game.scenes.push(GameOverScene(game))
+                return
+            game.step_simulation(tick_input)
+
+
+class OverlayScene(Scene):
+    """멈춘 레이스 화면 위에 안내 문구를 겹쳐 그리는 씬."""
+
+    def render(self):
+        self.game.scenes.below(self).draw_frame()
+        self.draw_overlay()
+        self.game.present()
+
+    def draw_overlay(self):
+        pass
+
+
+class PausedScene(OverlayScene):
+    def handle_keydown(self, key: int):
+        if key == pygame.K_p:
+            self.game.scenes.pop()
+        elif key == pygame.K_ESCAPE:
+            self.game.running = False
+
+    def draw_overlay(self):
+        self.game.draw_overlay_text("Paused", "Press P to Resume")
+
+
+class GameOverScene(OverlayScene):
+    def handle_keydown(self, key: int):
+        game = self.game
+        if key == pygame.K_y:
+            game.scenes.pop()
+            game.scenes.top.restart()
+        elif key == pygame.K_n and game.replay_rounds is None:
+            game.reset_round()
+            game.scenes.replace(StartMenuScene(game))  # 레이스 스프라이트를 놓고 메뉴로 돌아간다.
+        elif key in (pygame.K_n, pygame.K_ESCAPE):
+            game.running = False
+
+    def draw_overlay(self):
+        game = self.game
+        replaying = game.replay_rounds is not None
+        game.draw_overlay_text("Game Over!", "Y: next round / N: quit" if replaying else "Y: retry / N: menu / ESC: quit")
+        if replaying or game.last_rank is None:
+            return
+        text = game.text_cache.render(game.font, f"{game.sim.vehicle.name} / {game.sim.theme.name} {game.last_rank}위", YELLOW)
+        game.draw_centered(text, DISPLAY.height // 2 - 12)
@@ -0,0 +1,562 @@
+"""화면/오디오 없이 돌아가는 고정 타임스텝 레이스 시뮬레이션."""
+
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from config import AI, BALANCE, DISPLAY, GRAY, ITEMS, YELLOW, BalanceConfig, ItemConfig, TrackConfig
+from core.collision import Collider, CollisionGrid
+from core.enemy_ai import AI_PROFILES, AIProfile, EnemyAI, nearest_lane
+from core.events import (
+    CAUSE_ENEMY,
+    CAUSE_HAZARD,
+    EVENT_BOOST,
+    EVENT_DEATH,
+    EVENT_LANE_CHANGE,
+    EVENT_MISSION,
+    EVENT_NEAR_MISS,
+    EVENT_SHIELD_BLOCK,
+    EVENT_SHIELD_PICKUP,
+    MISSION_TYPES,
+    NEAR_MISS_GAP,
+)
+from core.entities import Enemy
+from core.track import TrackSegment, TrackStream
+
+TICK_RATE = DISPLAY.fps
+TICK_SECONDS = 1.0 / TICK_RATE
+
+CAR_SIZE = (50, 90)
+ENEMY_SIZE = (50, 80)
+LINE_SIZE = (10, 50)
+
+# 도로 레이아웃(논리 좌표). 렌더러는 이 값을 뷰포트로 물리 픽셀에 옮긴다.
+ROAD_EDGE_WIDTH = 50  # 양쪽 갓길 폭
+LANE_MARGIN = 10  # 바깥 차선의 차와 갓길 사이 여백
+CAR_MIN_X = ROAD_EDGE_WIDTH
+CAR_MAX_X = DISPLAY.width - ROAD_EDGE_WIDTH - CAR_SIZE[0]
+SWIPE_DISTANCE = 90  # 스와이프 한 번에 목표 x가 움직이는 거리(차선 간격과 다르다)
+ENEMY_LANE_SNAP = 0.13  # 적이 틱마다 목표 차선 쪽으로 좁히는 가로 거리 비율
+
+# 기준 자동 조종(dodge_policy). 시간 단위는 틱.
+AUTOPILOT_HORIZON = 240  # 이보다 먼 위협은 없는 것으로 본다.
+AUTOPILOT_STAY_BONUS = 5  # 비슷하면 차선을 바꾸지 않는다.
+AUTOPILOT_INNER_BONUS = 2  # 안쪽 차선은 양쪽으로 피할 수 있다.
+AUTOPILOT_TRANSIT_TICKS = 10  # 차선 하나를 건너는 시간. 이 안에 적이 닿는 차선은 건너지 않는다.
+AUTOPILOT_CUT_IN_TICKS = 6  # 끼어들기로 판단한 적이 차선 하나를 건너 차와 겹치기까지
+AUTOPILOT_TRIM = 3  # 차가 차선 중심에서 이보다(px) 벗어나면 좌/우로 맞춘다.
+ENEMY_LANE_DECAY = tuple((1 - ENEMY_LANE_SNAP) ** tick for tick in range(AUTOPILOT_HORIZON + 1))
+
+
+@dataclass(frozen=True)
+class VehicleStat:
+    name: str
+    acceleration: float
+    max_speed: float
+    handling: float
+    color: tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class TrackTheme:
+    name: str
+    bg_color: tuple[int, int, int]
+    road_color: tuple[int, int, int]
+    edge_color: tuple[int, int, int]
+    line_color: tuple[int, int, int]
+
+
+VEHICLES = (
+    VehicleStat("Sprint", acceleration=0.36, max_speed=8.0, handling=0.16, color=(80, 200, 255)),
+    VehicleStat("Interceptor", acceleration=0.28, max_speed=9.8, handling=0.12, color=(255, 180, 60)),
+    VehicleStat("Drift", acceleration=0.24, max_speed=8.8, handling=0.2, color=(220, 90, 255)),
+)
+
+TRACK_THEMES = (
+    TrackTheme("도심", bg_color=(54, 64, 82), road_color=GRAY, edge_color=(35, 35, 35), line_color=YELLOW),
+    TrackTheme("사막", bg_color=(183, 145, 87), road_color=(105, 88, 75), edge_color=(130, 98, 58), line_color=(250, 230, 120)),
+    TrackTheme("야간 네온", bg_color=(16, 12, 34), road_color=(35, 35, 60), edge_color=(95, 35, 130), line_color=(40, 255, 220)),
+)
+
+
+@dataclass(frozen=True)
+class TickInput:
+    """한 틱 동안의 플레이어 입력. swipe는 -1(왼쪽)/0/1(오른쪽)."""
+
+    left: bool = False
+    right: bool = False
+    boost: bool = False
+    swipe: int = 0
+
+
+IDLE_INPUT = TickInput()
+
+
+@dataclass(frozen=True)
+class RoundResult:
+    seed: int
+    vehicle_idx: int
+    ticks: int
+    score: int
+    mission_type: str
+    mission_completed: bool
+    mission_failed: bool
+    game_over: bool
+
+
+def lane_positions(lane_count: int = BALANCE.lane_count) -> list[int]:
+    left_bound = ROAD_EDGE_WIDTH + LANE_MARGIN
+    right_bound = DISPLAY.width - ROAD_EDGE_WIDTH - LANE_MARGIN - CAR_SIZE[0]
+    if lane_count == 1:
+        return [DISPLAY.width // 2 - CAR_SIZE[0] // 2]
+    interval = (right_bound - left_bound) / (lane_count - 1)
+    return [int(left_bound + interval * idx) for idx in range(lane_count)]
+
+
+class RaceSimulation:
+    """라운드 하나의 상태와 규칙. pygame에 의존하지 않으며 시드가 같으면 결과도 같다."""
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        vehicle_idx: int = 0,
+        vehicles=VEHICLES,
+        track_themes=TRACK_THEMES,
+        balance: BalanceConfig = BALANCE,
+        items: ItemConfig = ITEMS,
+        track: Optional[TrackConfig] = None,
+        prefetch_track: bool = False,
+        ai_profile: Optional[AIProfile] = None,
+    ):
+        self.vehicles = vehicles
+        self.track_themes = track_themes
+        self.balance = balance
+        self.items = items
+        self.track = track if track is not None and track.streaming else None
+        self.prefetch_track = prefetch_track
+        self.ai_profile = ai_profile or AI_PROFILES[AI.difficulty]
+        self.vehicle_idx = vehicle_idx
+        self.telemetry = None  # emit(kind, tick, a, b)를 가진 이벤트 창구(core.events). 없으면 이벤트를 만들지 않는다.
+        self.reset(seed)
+
+    @property
+    def vehicle(self) -> VehicleStat:
+        return self.vehicles[self.vehicle_idx]
+
+    def reset(self, seed: Optional[int] = None):
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+
+        self.theme = self.rng.choice(self.track_themes)
+        self.frame_counter = 0
+        self.game_over = False
+        self.lane_x = lane_positions(self.balance.lane_count)
+        self.player_target_x = self.lane_x[len(self.lane_x) // 2]
+        self.car_x = float(self.player_target_x)
+        self.car_velocity_x = 0.0
+        self.car_y = DISPLAY.height - 110
+
+        self.colliders = CollisionGrid()
+        self.enemy_speed = self.balance.initial_enemy_speed
+        self.enemies = []
+        self.spawn_initial_enemies()
+        self.ai = EnemyAI(self.ai_profile, self.rng, len(self.lane_x), DISPLAY.height)
+        self.ai.reset_lanes(len(self.lane_x), self.enemies)
+
+        self.score = 0
+        self.line_speed = self.balance.initial_line_speed
+        self.line_ys = list(range(0, DISPLAY.height, 90))
+
+        self.shield_active = False
+        self.shield_item = None
+        self.shield_collider = Collider(None, "shield", 0, 0, *self.items.shield_size)
+        self.next_shield_spawn = self.items.shield_spawn_interval_frames
+
+        self.boost_timer = 0
+        self.boost_cooldown = 0
+        self.boost_used_in_round = False
+
+        self.mission = self.generate_mission()
+
+        # 절차적 트랙(track 설정이 있을 때만). 트랙 RNG는 따로 쓰므로 위 난수열은 고정 도로와 같다.
+        self.distance = 0.0
+        self.hazards: list[Collider] = []
+        self.hazard_pool: list[Collider] = []
+        self.pending_hazards: deque[tuple[int, int]] = deque()
+        self.track_stream: Optional[TrackStream] = None
+        self.segment: Optional[TrackSegment] = None
+        if self.track is not None:
+            self.track_stream = TrackStream(
+                self.seed,
+                self.track,
+                len(self.track_themes),
+                self.track_themes.index(self.theme),
+                len(self.lane_x),
+                self.prefetch_track,
+            )
+            self.segment = self.track_stream.current
+
+    def spawn_initial_enemies(self):
+        for idx in range(self.balance.enemy_count):
+            lane = idx % len(self.lane_x)
+            speed_mul = self.rng.uniform(0.92, 1.15)
+            ai_timer = self.rng.randint(25, 110)
+            enemy = Enemy(lane, self.lane_x[lane], -220 * idx - 80, ENEMY_SIZE, speed_mul, ai_timer)
+            self.enemies.append(self.colliders.insert(enemy))
+
+    def generate_mission(self):
+        mission_type = self.rng.choice(["survive", "no_boost"])
+        if mission_type == "survive":
+            return {
+                "type": "survive",
+                "label": "미션: 20초 생존",
+                "target_frames": DISPLAY.fps * 20,
+                "completed": False,
+                "failed": False,
+            }
+        return {
+            "type": "no_boost",
+            "label": "미션: 25초 노부스트",
+            "target_frames": DISPLAY.fps * 25,
+            "completed": False,
+            "failed": False,
+        }
+
+    def activate_boost(self):
+        if self.boost_cooldown == 0:
+            self.boost_timer = self.balance.boost_duration_frames
+            self.boost_cooldown = self.balance.boost_cooldown_frames
+            self.boost_used_in_round = True
+            failed_now = self.mission["type"] == "no_boost" and not self.mission["completed"] and not self.mission["failed"]
+            if failed_now:
+                self.mission["failed"] = True
+            if self.telemetry:
+                self.telemetry.emit(EVENT_BOOST, self.frame_counter, 0, 0)
+                if failed_now:
+                    self.telemetry.emit(EVENT_MISSION, self.frame_counter, MISSION_TYPES.index("no_boost"), 0)
+
+    def shift_lane(self, direction: int):
+        previous = self.player_target_x
+        if direction > 0:
+            self.player_target_x = min(self.player_target_x + SWIPE_DISTANCE, self.lane_x[-1])
+        elif direction < 0:
+            self.player_target_x = max(self.player_target_x - SWIPE_DISTANCE, self.lane_x[0])
+        if self.telemetry and self.player_target_x != previous:
+            self.telemetry.emit(EVENT_LANE_CHANGE, self.frame_counter, direction, self.player_target_x)
+
+    def step(self, tick_input: TickInput = IDLE_INPUT) -> bool:
+        """한 틱을 진행한다. 이번 틱에 충돌로 라운드가 끝났으면 True."""
+        self.frame_counter += 1
+        self.steer(tick_input)
+
+        self.update_enemies()
+        self.update_shield_item()
+        if self.track_stream is not None:
+            self.update_track()
+        self.update_mission_state()
+        crashed = self.handle_collisions()
+        if self.telemetry and not crashed:
+            self.detect_near_misses()
+        self.move_lines()
+
+        if self.frame_counter % self.balance.score_tick_frames == 0:
+            self.score += 1
+        return crashed
+
+    def steer(self, tick_input: TickInput):
+        """입력으로 플레이어 차만 한 틱 움직인다. 네트워크 클라이언트의 자기 차 예측도 이걸 쓴다."""
+        if tick_input.boost:
+            self.activate_boost()
+        if tick_input.swipe:
+            self.shift_lane(tick_input.swipe)
+
+        selected = self.vehicle
+
+        accel = selected.acceleration
+        max_speed = min(selected.max_speed, self.balance.max_player_speed)
+        if self.boost_timer > 0:
+            max_speed += self.balance.boost_extra_speed
+
+        if tick_input.left:
+            self.car_velocity_x -= accel
+        elif tick_input.right:
+            self.car_velocity_x += accel
+        else:
+            self.car_velocity_x *= 0.85
+        if self.segment is not None:
+            self.car_velocity_x += self.segment.curve
+
+        self.car_velocity_x = max(-max_speed, min(max_speed, self.car_velocity_x))
+        self.car_x += self.car_velocity_x
+
+        snap_factor = self.balance.lane_change_speed + selected.handling
+        self.car_x += (self.player_target_x - self.car_x) * snap_factor
+        self.car_x = max(CAR_MIN_X, min(CAR_MAX_X, self.car_x))
+
+        if self.boost_timer > 0:
+            self.boost_timer -= 1
+        if self.boost_cooldown > 0:
+            self.boost_cooldown -= 1
+
+    def player_lane(self) -> int:
+        return nearest_lane(self.lane_x, self.car_x)
+
+    def update_enemies(self):
+        player_lane = self.player_lane()
+        rng = self.rng
+        ai = self.ai
+        track = ai.track if ai.profile.uses_index else None
+        lane_x = self.lane_x
+        last_lane = len(lane_x) - 1
+        car_y = self.car_y
+        enemy_speed = self.enemy_speed
+
+        for enemy in self.enemies:
+            enemy.ai_timer -= 1
+            if enemy.ai_timer <= 0:
+                ai.decide(enemy, player_lane, car_y, last_lane)
+
+            target_x = lane_x[enemy.target_lane]
+            enemy.x += (target_x - enemy.x) * ENEMY_LANE_SNAP
+            if abs(enemy.x - target_x) < 3:
+                enemy.lane = enemy.target_lane
+
+            enemy.y += enemy_speed * enemy.speed_mul
+
+            if enemy.y > DISPLAY.height + 100:
+                ai.release(enemy)
+                y = rng.randint(-360, -80)
+                lane = rng.randint(0, last_lane)
+                enemy.respawn(lane, lane_x[lane], y)
+                self.score += 2
+                enemy_speed += self.balance.enemy_speed_increase
+                self.line_speed += self.balance.line_speed_increase
+            if track:
+                track(enemy)
+        self.enemy_speed = enemy_speed
+
+    def update_shield_item(self):
+        item = self.shield_item
+        if item:
+            item.y = int(item.y + self.items.shield_fall_speed)
+            if item.y > DISPLAY.height:
+                self.colliders.remove(item)
+                self.shield_item = None
+
+        if not self.shield_active and not self.shield_item:
+            self.next_shield_spawn -= 1
+            if self.next_shield_spawn <= 0:
+                x = self.rng.randint(60, DISPLAY.width - 90)
+                item = self.shield_collider
+                item.x = x
+                item.y = -item.h
+                self.shield_item = self.colliders.insert(item)
+                self.next_shield_spawn = self.items.shield_spawn_interval_frames
+
+    def update_track(self):
+        """도로가 스크롤된 만큼 트랙을 진행한다. 장애물은 차선 표시처럼 도로와 함께 내려온다."""
+        line_speed = self.line_speed
+        for hazard in list(self.hazards):
+            hazard.y += line_speed
+            if hazard.y > DISPLAY.height:
+                self.remove_hazard(hazard)
+
+        self.distance += line_speed
+        segment = self.track_stream.segment_at(self.distance)
+        if segment is not self.segment:
+            self.enter_segment(segment)
+
+        pending = self.pending_hazards
+        while pending and pending[0][0] <= self.distance:
+            self.spawn_hazard(pending.popleft()[1])
+
+    def enter_segment(self, segment: TrackSegment):
+        self.segment = segment
+        self.theme = self.track_themes[segment.theme_idx]
+        self.pending_hazards.extend((segment.start + hazard.offset, hazard.lane) for hazard in segment.hazards)
+
+        if segment.lane_count != len(self.lane_x):
+            self.lane_x = lane_positions(segment.lane_count)
+            last_lane = len(self.lane_x) - 1
+            for enemy in self.enemies:
+                enemy.lane = min(enemy.lane, last_lane)
+                enemy.target_lane = min(enemy.target_lane, last_lane)
+            self.ai.reset_lanes(len(self.lane_x), self.enemies)
+            self.player_target_x = min(self.lane_x, key=lambda x: abs(x - self.player_target_x))
+
+    def spawn_hazard(self, lane: int):
+        width, height = self.track.hazard_size
+        lane_x = self.lane_x[min(lane, len(self.lane_x) - 1)]
+        hazard = self.hazard_pool.pop() if self.hazard_pool else Collider(None, "hazard", 0, 0, width, height)
+        hazard.x = lane_x + (ENEMY_SIZE[0] - width) // 2
+        hazard.y = -height
+        self.hazards.append(self.colliders.insert(hazard))
+
+    def remove_hazard(self, hazard: Collider):
+        self.colliders.remove(hazard)
+        self.hazards.remove(hazard)
+        self.hazard_pool.append(hazard)
+
+    def update_mission_state(self):
+        if self.mission["completed"] or self.mission["failed"]:
+            return
+
+        if self.frame_counter >= self.mission["target_frames"]:
+            self.mission["completed"] = True
+            self.score += 30
+            if self.telemetry:
+                self.telemetry.emit(EVENT_MISSION, self.frame_counter, MISSION_TYPES.index(self.mission["type"]), 1)
+
+    def detect_near_misses(self):
+        """텔레메트리용. 이번 틱에 윗변이 차 윗변을 지난 적 중 차와 가로 간격이 NEAR_MISS_GAP 이하인 것을 알린다."""
+        car_y = self.car_y
+        car_left = self.car_x
+        car_right = car_left + CAR_SIZE[0]
+        for enemy in self.enemies:
+            if enemy.y - self.enemy_speed * enemy.speed_mul < car_y <= enemy.y:
+                gap = max(enemy.x - car_right, car_left - (enemy.x + enemy.w))
+                if 0 < gap <= NEAR_MISS_GAP:
+                    self.telemetry.emit(EVENT_NEAR_MISS, self.frame_counter, int(gap), 0)
+
+    def handle_collisions(self) -> bool:
+        grid = self.colliders
+        grid.refresh()
+
+        hits = grid.query(int(self.car_x), int(self.car_y), *CAR_SIZE)
+        if not hits:
+            return False
+
+        telemetry = self.telemetry
+        for collider in hits:
+            if collider.kind == "shield":
+                self.shield_active = True
+                grid.remove(collider)
+                self.shield_item = None
+                if telemetry:
+                    telemetry.emit(EVENT_SHIELD_PICKUP, self.frame_counter, 0, 0)
+
+        for collider in hits:
+            if collider.kind != "enemy" and collider.kind != "hazard":
+                continue
+            cause = CAUSE_HAZARD if collider.kind == "hazard" else CAUSE_ENEMY
+            if self.shield_active:
+                self.shield_active = False
+                if collider.kind == "hazard":
+                    self.remove_hazard(collider)
+                else:
+                    collider.y = self.rng.randint(-220, -80)
+                if telemetry:
+                    telemetry.emit(EVENT_SHIELD_BLOCK, self.frame_counter, cause, 0)
+                return False
+
+            self.game_over = True
+            if telemetry:
+                telemetry.emit(EVENT_DEATH, self.frame_counter, cause, self.score)
+            return True
+        return False
+
+    def move_lines(self):
+        for idx, y in enumerate(self.line_ys):
+            y = int(y + self.line_speed)
+            self.line_ys[idx] = -90 if y > DISPLAY.height else y
+
+    def result(self) -> RoundResult:
+        return RoundResult(
+            seed=self.seed,
+            vehicle_idx=self.vehicle_idx,
+            ticks=self.frame_counter,
+            score=self.score,
+            mission_type=self.mission["type"],
+            mission_completed=self.mission["completed"],
+            mission_failed=self.mission["failed"],
+            game_over=self.game_over,
+        )
+
+
+Policy = Callable[[RaceSimulation], TickInput]
+
+
+def lane_threats(sim: RaceSimulation) -> list[int]:
+    """차선마다 적이 차 높이에 닿기까지 남은 틱(최대 AUTOPILOT_HORIZON).
+
+    적은 지금 목표 차선으로 계속 움직인다고 보고, 차 높이에 들어올 때와 빠져나갈 때의 x로 겹침을 판단한다.
+    다른 차선의 적이 나란히 달리는 동안 AI 판단을 하면 플레이어 차선으로 끼어들 수 있는데, 바깥 차선에서는
+    피할 곳이 없으므로 그 끼어들기도 위협으로 센다.
+    """
+    lane_x = sim.lane_x
+    last_lane = len(lane_x) - 1
+    car_y = sim.car_y
+    block_range = sim.ai.profile.block_range
+    threats = [AUTOPILOT_HORIZON] * len(lane_x)
+    for enemy in sim.enemies:
+        if enemy.y >= car_y + CAR_SIZE[1]:
+            continue
+        speed = sim.enemy_speed * enemy.speed_mul
+        arrive = min(AUTOPILOT_HORIZON, max(0, int((car_y - ENEMY_SIZE[1] - enemy.y) / speed)))
+        leave = min(AUTOPILOT_HORIZON, int((car_y + CAR_SIZE[1] - enemy.y) / speed))
+        target_x = lane_x[enemy.target_lane]
+        x_arrive = target_x + (enemy.x - target_x) * ENEMY_LANE_DECAY[arrive]
+        x_leave = target_x + (enemy.x - target_x) * ENEMY_LANE_DECAY[leave]
+        for lane, x in enumerate(lane_x):
+            if abs(x_arrive - x) < CAR_SIZE[0] or abs(x_leave - x) < CAR_SIZE[0] or (x_arrive - x) * (x_leave - x) < 0:
+                threats[lane] = min(threats[lane], arrive)
+
+        decide = enemy.ai_timer
+        if last_lane > 0 and decide < leave and abs(enemy.y + speed * decide - car_y) < block_range:
+            for lane in (0, last_lane):
+                lanes_away = abs(enemy.target_lane - lane)
+                if lanes_away:
+                    threats[lane] = min(threats[lane], max(arrive, decide + AUTOPILOT_CUT_IN_TICKS * lanes_away))
+    return threats
+
+
+def dodge_policy(sim: RaceSimulation) -> TickInput:
+    """위협이 가장 늦게 오는 차선의 중심으로 가는 기준 자동 조종(스윕/벤치마크용).
+
+    건너는 동안 적이 닿는 차선은 지나가지 않는다. 스와이프 거리와 차선 간격이 다르므로 스와이프로
+    목표를 가까이 옮긴 뒤 남은 어긋남은 좌/우로 맞춘다. core.batch.dodge_policy와 같은 결정을 내리므로
+    두 엔진의 결과를 그대로 비교할 수 있다.
+    """
+    lane_x = sim.lane_x
+    threats = lane_threats(sim)
+    current = sim.player_lane()
+    best_lane, best_score = current, -1
+    for lane in range(len(lane_x)):
+        step = 1 if lane > current else -1
+        path = range(current + step, lane + step, step)  # 지나갈 차선(도착 차선 포함)
+        if any(threats[idx] <= AUTOPILOT_TRANSIT_TICKS * abs(idx - current) for idx in path):
+            continue
+        score = threats[lane]
+        if lane == current:
+            score += AUTOPILOT_STAY_BONUS
+        if 0 < lane < len(lane_x) - 1:
+            score += AUTOPILOT_INNER_BONUS
+        if score > best_score:
+            best_lane, best_score = lane, score
+
+    goal = lane_x[best_lane]
+    target = sim.player_target_x
+    if abs(min(target + SWIPE_DISTANCE, lane_x[-1]) - goal) < abs(target - goal):
+        swipe = 1
+    elif abs(max(target - SWIPE_DISTANCE, lane_x[0]) - goal) < abs(target - goal):
+        swipe = -1
+    else:
+        swipe = 0
+    offset = goal - sim.car_x
+    saving_mission = sim.mission["type"] == "no_boost" and not sim.mission["completed"]
+    boost = best_lane != current and sim.boost_cooldown == 0 and not saving_mission
+    return TickInput(left=offset < -AUTOPILOT_TRIM, right=offset > AUTOPILOT_TRIM, boost=boost, swipe=swipe)
+
+
+def simulate_round(
+    seed: int,
+    vehicle_idx: int = 0,
+    policy: Optional[Policy] = None,
+    max_ticks: int = TICK_RATE * 600,
+) -> RoundResult:
+    """창 없이 라운드 하나를 끝까지(또는 max_ticks까지) 최대 속도로 돌린다."""
+    sim = RaceSimulation(seed, vehicle_idx)
+    while not sim.game_over and sim.frame_counter < max_ticks:
+        sim.step(policy(sim) if policy else IDLE_INPUT)
+    return sim.result()
@@ -0,0 +1,136 @@
+"""앞쪽 도로를 청크 단위로 생성해 흘려 주는 절차적 트랙 스트림 (pygame 비의존)."""
+
+import random
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Iterator, Optional
+
+from config import TrackConfig
+
+# 트랙 전용 RNG 시드에 섞는 값. 게임 규칙 RNG(rng)와 난수열을 나눠 쓰지 않게 한다.
+TRACK_SEED_SALT = 0x7A3C_51E9
+
+_prefetch_pool: Optional[ThreadPoolExecutor] = None
+
+
+def prefetch_pool() -> ThreadPoolExecutor:
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        _prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="track-prefetch")
+    return _prefetch_pool
+
+
+@dataclass(frozen=True)
+class Hazard:
+    offset: int  # 구간 시작부터의 거리(px)
+    lane: int
+
+
+@dataclass(frozen=True)
+class TrackSegment:
+    index: int
+    start: int  # 라운드 시작부터의 누적 스크롤 거리(px)
+    length: int
+    theme_idx: int
+    lane_count: int
+    curve: float  # 틱마다 차를 옆으로 미는 가속도(px/tick², 음수면 왼쪽)
+    hazards: tuple[Hazard, ...] = ()
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+
+def generate_layout(
+    rng: random.Random, config: TrackConfig, theme_count: int, start_theme: int, start_lanes: int
+) -> Iterator[TrackSegment]:
+    """구간 길이/테마/차선 수/커브를 끝없이 만든다. 첫 구간은 기존 고정 도로와 같다."""
+    segment = TrackSegment(0, 0, config.max_segment_length, start_theme, start_lanes, 0.0)
+    while True:
+        yield segment
+        index = segment.index + 1
+        theme_idx = segment.theme_idx
+        if index % config.theme_run_segments == 0 and theme_count > 1:
+            theme_idx = (theme_idx + rng.randrange(1, theme_count)) % theme_count
+        curve = rng.choice((-1, 0, 0, 1)) * rng.uniform(0.4, 1.0) * config.max_curve
+        segment = TrackSegment(
+            index,
+            segment.end,
+            rng.randint(config.min_segment_length, config.max_segment_length),
+            theme_idx,
+            rng.choice(config.lane_counts),
+            round(curve, 3),
+        )
+
+
+def place_hazards(segments: Iterator[TrackSegment], rng: random.Random, config: TrackConfig) -> Iterator[TrackSegment]:
+    for segment in segments:
+        if segment.index == 0:
+            yield segment
+            continue
+        hazards = [
+            Hazard(rng.randint(200, segment.length - 200), rng.randrange(segment.lane_count))
+            for _ in range(config.max_hazards_per_segment)
+            if rng.random() < config.hazard_chance
+        ]
+        yield replace(segment, hazards=tuple(sorted(hazards, key=lambda hazard: hazard.offset)))
+
+
+def chunked(segments: Iterator[TrackSegment], size: int) -> Iterator[tuple[TrackSegment, ...]]:
+    while True:
+        yield tuple(next(segments) for _ in range(size))
+
+
+def segment_chunks(
+    seed: int, config: TrackConfig, theme_count: int, start_theme: int, start_lanes: int
+) -> Iterator[tuple[TrackSegment, ...]]:
+    rng = random.Random(seed ^ TRACK_SEED_SALT)
+    layout = generate_layout(rng, config, theme_count, start_theme, start_lanes)
+    return chunked(place_hazards(layout, rng, config), config.chunk_segments)
+
+
+class TrackStream:
+    """현재 구간부터 최대 2청크만 메모리에 두고, 다음 청크는 백그라운드 스레드에서 미리 만든다.
+
+    청크는 같은 생성기에서 순서대로 꺼내므로 prefetch 여부와 관계없이 내용이 시드로 정해진다.
+    헤드리스 실행은 prefetch=False로 스레드 없이 그 자리에서 생성한다.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        config: TrackConfig,
+        theme_count: int,
+        start_theme: int,
+        start_lanes: int,
+        prefetch: bool = True,
+    ):
+        self.config = config
+        self.prefetch = prefetch
+        self._chunks = segment_chunks(seed, config, theme_count, start_theme, start_lanes)
+        self._pending: Optional[Future] = None
+        self.window: deque[TrackSegment] = deque(next(self._chunks))
+        self._schedule()
+
+    def _schedule(self):
+        if self.prefetch:
+            self._pending = prefetch_pool().submit(next, self._chunks)
+
+    def _extend(self):
+        chunk = self._pending.result() if self._pending is not None else next(self._chunks)
+        self.window.extend(chunk)
+        self._schedule()
+
+    @property
+    def current(self) -> TrackSegment:
+        return self.window[0]
+
+    def segment_at(self, distance: float) -> TrackSegment:
+        """distance를 포함하는 구간. 지나간 구간은 버리고, 창이 반 이하로 줄면 미리 만든 청크를 붙인다."""
+        window = self.window
+        while distance >= window[0].end:
+            window.popleft()
+            if len(window) <= self.config.chunk_segments // 2:
+                self._extend()
+        return window[0]
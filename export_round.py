@@ -0,0 +1,5 @@
+from systems.export import main
+
+
+if __name__ == "__main__":
+    main()
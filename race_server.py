@@ -0,0 +1,5 @@
+from systems.netplay import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""효과음/배경음 재생을 게임 스레드에서 떼어 내는 오디오 매니저 (채널 풀, 우선순위 보이스 스틸링)."""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import pygame
+
+from systems.resource_loader import LazySound
+
+
+class NullAudioBackend:
+    """mixer를 열 수 없을 때(헤드리스 서버 등) 모든 호출을 버리는 백엔드."""
+
+    channel_count = 0
+
+    def is_busy(self, channel: int) -> bool:
+        return False
+
+    def play(self, channel: int, sound, volume: float):
+        pass
+
+    def stop(self, channel: int):
+        pass
+
+    def play_music(self, loops: int):
+        pass
+
+    def stop_music(self):
+        pass
+
+
+class PygameAudioBackend:
+    def __init__(self, channel_count: int):
+        pygame.mixer.set_num_channels(channel_count)
+        self.channel_count = channel_count
+        self.channels = [pygame.mixer.Channel(idx) for idx in range(channel_count)]
+
+    def is_busy(self, channel: int) -> bool:
+        return self.channels[channel].get_busy()
+
+    def play(self, channel: int, sound, volume: float):
+        if isinstance(sound, LazySound):
+            sound = sound.load()
+        self.channels[channel].set_volume(volume)
+        self.channels[channel].play(sound)
+
+    def stop(self, channel: int):
+        self.channels[channel].stop()
+
+    def play_music(self, loops: int):
+        pygame.mixer.music.play(loops)
+
+    def stop_music(self):
+        pygame.mixer.music.stop()
+
+
+@dataclass
+class SoundEvent:
+    name: str
+    sound: object  # pygame.mixer.Sound 또는 LazySound
+    priority: int = 0
+    min_interval: float = 0.0  # 같은 이벤트를 다시 울리기까지 최소 간격(초)
+    volume: float = 1.0
+    last_played: float = field(default=-1e9, repr=False)
+
+
+class AudioManager:
+    """play()는 명령을 큐에 넣고 바로 돌아온다. 실제 mixer 호출과 효과음 디코딩은 워커 스레드가 한다.
+
+    채널 수는 고정이며, 빈 채널이 없으면 새 소리보다 우선순위가 낮거나 같은 보이스 중 가장
+    오래된 것을 끊고 그 자리에서 재생한다. 더 높은 보이스만 남아 있으면 새 소리를 버린다.
+    threaded=False면 같은 처리를 호출 스레드에서 바로 한다(테스트/디버깅용).
+    """
+
+    def __init__(self, backend, threaded: bool = True):
+        self.backend = backend
+        self.events: dict[str, SoundEvent] = {}
+        self.voices: list[Optional[tuple[int, float]]] = [None] * backend.channel_count  # (priority, 시작 시각)
+        self.dropped = 0
+        self.stolen = 0
+        self.rate_limited = 0
+        self._commands: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        if threaded and self.enabled:
+            self._worker = threading.Thread(target=self._run, name="audio", daemon=True)
+            self._worker.start()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend.channel_count > 0
+
+    def register(self, name: str, sound, priority: int = 0, min_interval: float = 0.0, volume: float = 1.0):
+        if sound is not None and self.enabled:
+            self.events[name] = SoundEvent(name, sound, priority, min_interval, volume)
+
+    def play(self, name: str) -> bool:
+        """이벤트를 재생 큐에 넣는다. 등록되지 않았거나 간격 제한에 걸리면 False."""
+        event = self.events.get(name)
+        if event is None:
+            return False
+        now = time.perf_counter()
+        if now - event.last_played < event.min_interval:
+            self.rate_limited += 1
+            return False
+        event.last_played = now
+        self._submit(self._play_event, event)
+        return True
+
+    def play_music(self, loops: int = -1):
+        if self.enabled:
+            self._submit(self.backend.play_music, loops)
+
+    def stop_music(self):
+        if self.enabled:
+            self._submit(self.backend.stop_music)
+
+    def _submit(self, func, *args):
+        if self._worker is not None:
+            self._commands.put((func, args))
+        else:
+            func(*args)
+
+    def _pick_channel(self, priority: int) -> Optional[int]:
+        victim = None
+        for channel, voice in enumerate(self.voices):
+            if voice is None or not self.backend.is_busy(channel):
+                return channel
+            if voice[0] <= priority and (victim is None or voice < self.voices[victim]):
+                victim = channel
+        return victim
+
+    def _play_event(self, event: SoundEvent):
+        channel = self._pick_channel(event.priority)
+        if channel is None:
+            self.dropped += 1
+            return
+        if self.voices[channel] is not None and self.backend.is_busy(channel):
+            self.backend.stop(channel)
+            self.stolen += 1
+        try:
+            self.backend.play(channel, event.sound, event.volume)
+        except pygame.error:
+            self.voices[channel] = None
+            return
+        self.voices[channel] = (event.priority, time.perf_counter())
+
+    def _run(self):
+        while True:
+            command = self._commands.get()
+            if command is None:
+                return
+            func, args = command
+            try:
+                func(*args)
+            except pygame.error:
+                pass  # 오디오 장치 오류로 게임이 멈추지 않게 한다.
+
+    def close(self, timeout: float = 1.0):
+        if self._worker is not None:
+            self._commands.put(None)
+            self._worker.join(timeout)
+            self._worker = None
+
+
+def open_audio(channel_count: int, threaded: bool = True) -> AudioManager:
+    """mixer를 열어 오디오 매니저를 만든다. 장치가 없으면 no-op 백엔드로 대신한다."""
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        backend = PygameAudioBackend(channel_count)
+    except pygame.error:
+        backend = NullAudioBackend()
+    return AudioManager(backend, threaded)
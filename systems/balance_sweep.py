@@ -0,0 +1,263 @@
+"""밸런스 파라미터 그리드를 헤드리스 라운드로 돌려 설정별 통계를 CSV로 남기는 스윕 러너."""
+
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import fields, replace
+
+from config import BALANCE, ITEMS
+from core.simulation import TICK_RATE, VEHICLES
+
+CONFIG_SECTIONS = {"balance": BALANCE, "items": ITEMS}
+
+SUMMARY_FIELDS = [
+    "config",
+    "rounds",
+    "survival_mean_s",
+    "survival_p50_s",
+    "survival_p90_s",
+    "score_mean",
+    "score_p10",
+    "score_p50",
+    "score_p90",
+    "score_max",
+    "mission_completion_rate",
+    "mission_failure_rate",
+    "timeout_rate",
+]
+
+
+def parse_grid_option(option: str) -> tuple[str, list]:
+    """'balance.enemy_speed_increase=0.08,0.12' 형식을 (키, 값 목록)으로 바꾼다."""
+    key, _, raw_values = option.partition("=")
+    section, _, name = key.partition(".")
+    if section not in CONFIG_SECTIONS or not raw_values:
+        raise ValueError(f"그리드 형식 오류: {option} (예: balance.enemy_speed_increase=0.08,0.12)")
+
+    default = CONFIG_SECTIONS[section]
+    if name not in {field.name for field in fields(default)}:
+        raise ValueError(f"{type(default).__name__}에 {name} 필드가 없습니다.")
+
+    value_type = type(getattr(default, name))
+    if value_type not in (int, float):
+        raise ValueError(f"{key}: 숫자 필드만 스윕할 수 있습니다.")
+    return key, [value_type(value) for value in raw_values.split(",")]
+
+
+def expand_grid(grid: dict[str, list], vehicles: list[int]) -> list[dict]:
+    keys = list(grid)
+    configs = []
+    for values in itertools.product(*(grid[key] for key in keys)):
+        for vehicle_idx in vehicles:
+            config = dict(zip(keys, values))
+            config["vehicle"] = vehicle_idx
+            configs.append(config)
+    return configs
+
+
+def config_key(config: dict, rounds: int, shard_size: int, seed: int, max_ticks: int) -> str:
+    """CSV와 체크포인트에서 설정을 가리키는 키. 샤드 구성이 다른 실행의 결과가 섞이지 않도록 실행 인자도 넣는다."""
+    run = {"rounds": rounds, "shard_size": shard_size, "seed": seed, "max_ticks": max_ticks}
+    return ";".join(f"{key}={value}" for key, value in {**config, **run}.items())
+
+
+def build_configs(config: dict):
+    overrides = {section: {} for section in CONFIG_SECTIONS}
+    for key, value in config.items():
+        if key != "vehicle":
+            section, _, name = key.partition(".")
+            overrides[section][name] = value
+    return replace(BALANCE, **overrides["balance"]), replace(ITEMS, **overrides["items"])
+
+
+def run_shard(task: dict) -> dict:
+    """워커 프로세스에서 샤드 하나(시드 구간)를 배치 엔진으로 돌린다."""
+    from core.batch import dodge_policy, simulate_batch
+
+    balance, items = build_configs(task["config"])
+    seeds = range(task["seed_start"], task["seed_start"] + task["rounds"])
+    results = simulate_batch(seeds, task["config"]["vehicle"], dodge_policy, task["max_ticks"], balance, items)
+    return {
+        "key": task["key"],
+        "shard": task["shard"],
+        "ticks": [result.ticks for result in results],
+        "scores": [result.score for result in results],
+        "mission_completed": sum(result.mission_completed for result in results),
+        "mission_failed": sum(result.mission_failed for result in results),
+        "timeouts": sum(not result.game_over for result in results),
+    }
+
+
+def percentile(sorted_values: list, fraction: float):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def summarize(key: str, shards: list[dict]) -> dict:
+    ticks = sorted(tick for shard in shards for tick in shard["ticks"])
+    scores = sorted(score for shard in shards for score in shard["scores"])
+    rounds = len(scores)
+    return {
+        "config": key,
+        "rounds": rounds,
+        "survival_mean_s": round(sum(ticks) / rounds / TICK_RATE, 3),
+        "survival_p50_s": round(percentile(ticks, 0.5) / TICK_RATE, 3),
+        "survival_p90_s": round(percentile(ticks, 0.9) / TICK_RATE, 3),
+        "score_mean": round(sum(scores) / rounds, 3),
+        "score_p10": percentile(scores, 0.1),
+        "score_p50": percentile(scores, 0.5),
+        "score_p90": percentile(scores, 0.9),
+        "score_max": scores[-1],
+        "mission_completion_rate": round(sum(shard["mission_completed"] for shard in shards) / rounds, 4),
+        "mission_failure_rate": round(sum(shard["mission_failed"] for shard in shards) / rounds, 4),
+        "timeout_rate": round(sum(shard["timeouts"] for shard in shards) / rounds, 4),
+    }
+
+
+def load_checkpoint(output: str, checkpoint: str):
+    """이미 요약된 설정과 끝난 샤드를 읽어 중단된 스윕을 이어서 돌릴 수 있게 한다."""
+    finished = set()
+    if os.path.exists(output):
+        with open(output, "r", encoding="utf-8", newline="") as file:
+            finished = {row["config"] for row in csv.DictReader(file)}
+
+    shards: dict[str, dict[int, dict]] = {}
+    if os.path.exists(checkpoint):
+        with open(checkpoint, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 중단 시점에 반쯤 쓰인 마지막 줄
+                if record["key"] not in finished:
+                    shards.setdefault(record["key"], {})[record["shard"]] = record
+    return finished, shards
+
+
+def run_sweep(
+    configs: list[dict],
+    rounds: int,
+    shard_size: int,
+    output: str,
+    workers: int,
+    max_ticks: int,
+    seed: int,
+):
+    checkpoint = output + ".partial.jsonl"
+    finished, done_shards = load_checkpoint(output, checkpoint)
+    shard_count = (rounds + shard_size - 1) // shard_size
+
+    keys = [config_key(config, rounds, shard_size, seed, max_ticks) for config in configs]
+    tasks = []
+    for config, key in zip(configs, keys):
+        if key in finished:
+            continue
+        for shard in range(shard_count):
+            if shard in done_shards.get(key, {}):
+                continue
+            tasks.append(
+                {
+                    "key": key,
+                    "config": config,
+                    "shard": shard,
+                    "seed_start": seed + shard * shard_size,
+                    "rounds": min(shard_size, rounds - shard * shard_size),
+                    "max_ticks": max_ticks,
+                }
+            )
+
+    pending_configs = [key for key in keys if key not in finished]
+    print(f"설정 {len(configs)}개 중 {len(pending_configs)}개 남음, 샤드 {len(tasks)}개, 워커 {workers}개", file=sys.stderr)
+
+    new_file = not os.path.exists(output)
+    with open(output, "a", encoding="utf-8", newline="") as out_file, open(checkpoint, "a", encoding="utf-8") as ckpt_file:
+        writer = csv.DictWriter(out_file, fieldnames=SUMMARY_FIELDS)
+        if new_file:
+            writer.writeheader()
+
+        def complete_ready(key: str):
+            if len(done_shards.get(key, {})) == shard_count:
+                writer.writerow(summarize(key, list(done_shards.pop(key).values())))
+                out_file.flush()
+
+        for key in pending_configs:
+            complete_ready(key)
+
+        started = time.perf_counter()
+        simulated_ticks = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = {pool.submit(run_shard, task) for task in tasks}
+            completed = 0
+            while pending:
+                ready, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in ready:
+                    record = future.result()
+                    ckpt_file.write(json.dumps(record) + "\n")
+                    ckpt_file.flush()
+                    done_shards.setdefault(record["key"], {})[record["shard"]] = record
+                    complete_ready(record["key"])
+
+                    completed += 1
+                    simulated_ticks += sum(record["ticks"])
+                    elapsed = time.perf_counter() - started
+                    eta = elapsed / completed * (len(tasks) - completed)
+                    print(
+                        f"\r[{completed}/{len(tasks)}] {completed / len(tasks):6.1%}  "
+                        f"{simulated_ticks / elapsed:,.0f} ticks/s  ETA {eta:,.0f}s",
+                        end="",
+                        file=sys.stderr,
+                    )
+        if tasks:
+            print(file=sys.stderr)
+
+    os.remove(checkpoint)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="헤드리스 밸런스 스윕")
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="SECTION.FIELD=V1,V2",
+        help="스윕할 필드와 값 (예: balance.enemy_speed_increase=0.08,0.12,0.16). 여러 번 지정 가능",
+    )
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[0], help="스윕할 차량 인덱스")
+    parser.add_argument("--rounds", type=int, default=2000, help="설정당 라운드 수")
+    parser.add_argument("--shard-size", type=int, default=500, help="워커 작업 하나가 맡는 라운드 수")
+    parser.add_argument("--max-seconds", type=float, default=600, help="라운드 최대 길이(초)")
+    parser.add_argument("--seed", type=int, default=0, help="시작 시드 (모든 설정이 같은 시드 집합을 공유)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default="balance_sweep.csv")
+    args = parser.parse_args(argv)
+
+    for option in ("rounds", "shard_size", "workers"):
+        if getattr(args, option) < 1:
+            parser.error(f"--{option.replace('_', '-')}: 1 이상이어야 합니다 ({getattr(args, option)})")
+    if not math.isfinite(args.max_seconds) or int(args.max_seconds * TICK_RATE) < 1:
+        parser.error(f"--max-seconds: 한 틱(1/{TICK_RATE}초) 이상의 유한한 값이어야 합니다 ({args.max_seconds})")
+    unknown = [idx for idx in args.vehicles if idx not in range(len(VEHICLES))]
+    if unknown:
+        parser.error(f"--vehicles: 0~{len(VEHICLES) - 1} 사이여야 합니다 ({', '.join(map(str, unknown))})")
+
+    try:
+        grid = dict(parse_grid_option(option) for option in args.grid)
+    except ValueError as error:
+        parser.error(str(error))
+
+    run_sweep(
+        expand_grid(grid, args.vehicles),
+        rounds=args.rounds,
+        shard_size=args.shard_size,
+        output=args.output,
+        workers=args.workers,
+        max_ticks=int(args.max_seconds * TICK_RATE),
+        seed=args.seed,
+    )
@@ -0,0 +1,300 @@
+"""밸런스/아이템/차량/테마/적 AI를 묶은 설정 프로필(TOML/JSON)의 로드·검증과, 라운드 사이 교체용 파일 감시.
+
+프로필 파일은 기본값(config.py, core.simulation)에서 바꿀 부분만 적는다::
+
+    [balance]
+    enemy_speed_increase = 0.10
+
+    [ai]
+    difficulty = "hard"
+
+    [[vehicles]]       # 적으면 차량 표 전체를 바꾼다(테마 [[themes]]도 같다)
+    name = "Sprint"
+    acceleration = 0.36
+    max_speed = 8.0
+    handling = 0.16
+    color = [80, 200, 255]
+
+로드할 때 한 번 검증해 잘못된 항목을 모두 모아 ConfigError로 알리고, 결과는 frozen 데이터클래스/튜플로 굳힌다.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, fields, replace
+from typing import Optional
+
+from config import AI, BALANCE, ITEMS, BalanceConfig, ItemConfig
+from core.enemy_ai import AI_PROFILES, AIProfile
+from core.simulation import TRACK_THEMES, VEHICLES, TrackTheme, VehicleStat
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+MAX_VEHICLES = 6  # 차량 선택 화면에 미리보기가 한 줄로 들어가는 수
+
+# 0이면 나눗셈/무한 루프가 생기는 필드. 나머지 숫자 필드는 0 이상이면 된다.
+POSITIVE_FIELDS = {
+    "max_player_speed",
+    "boost_duration_frames",
+    "boost_cooldown_frames",
+    "score_tick_frames",
+    "lane_count",
+    "shield_spawn_interval_frames",
+    "shield_size",
+}
+
+
+class ConfigError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ConfigProfile:
+    name: str = "default"
+    balance: BalanceConfig = BALANCE
+    items: ItemConfig = ITEMS
+    vehicles: tuple[VehicleStat, ...] = VEHICLES
+    track_themes: tuple[TrackTheme, ...] = TRACK_THEMES
+    ai_profile: AIProfile = AI_PROFILES[AI.difficulty]
+
+    def simulation_options(self) -> dict:
+        """RaceSimulation/BatchSimulation 생성자에 그대로 넘길 키워드 인자."""
+        return {
+            "vehicles": self.vehicles,
+            "track_themes": self.track_themes,
+            "balance": self.balance,
+            "items": self.items,
+            "ai_profile": self.ai_profile,
+        }
+
+
+DEFAULT_PROFILE = ConfigProfile()
+
+
+def _check_number(errors: list[str], key: str, value, expected: type, positive: bool) -> bool:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or (expected is int and not isinstance(value, int)):
+        errors.append(f"{key}: {'정수' if expected is int else '숫자'}여야 합니다 ({value!r})")
+        return False
+    if value < 0 or (positive and value == 0):
+        errors.append(f"{key}: {'0보다 커야' if positive else '0 이상이어야'} 합니다 ({value!r})")
+        return False
+    return True
+
+
+def _section(errors: list[str], section: str, table, default):
+    """table의 값으로 default 데이터클래스를 덮어쓴다. 타입은 기본값의 타입을 따른다."""
+    if not isinstance(table, dict):
+        errors.append(f"{section}: 테이블이어야 합니다")
+        return default
+    known = {field.name for field in fields(default)}
+    values = {}
+    for name, value in table.items():
+        key = f"{section}.{name}"
+        if name not in known:
+            errors.append(f"{key}: 알 수 없는 항목입니다")
+            continue
+        current = getattr(default, name)
+        positive = name in POSITIVE_FIELDS
+        if isinstance(current, bool):
+            if not isinstance(value, bool):
+                errors.append(f"{key}: true/false여야 합니다 ({value!r})")
+                continue
+        elif isinstance(current, (int, float)):
+            if not _check_number(errors, key, value, type(current), positive):
+                continue
+            value = type(current)(value)
+        elif isinstance(current, tuple):
+            if not isinstance(value, (list, tuple)) or len(value) != len(current):
+                errors.append(f"{key}: 길이 {len(current)}인 배열이어야 합니다 ({value!r})")
+                continue
+            if not all(_check_number(errors, f"{key}[{idx}]", item, type(current[idx]), positive) for idx, item in enumerate(value)):
+                continue
+            value = tuple(value)
+        elif isinstance(current, str) and not isinstance(value, str):
+            errors.append(f"{key}: 문자열이어야 합니다 ({value!r})")
+            continue
+        values[name] = value
+    return replace(default, **values)
+
+
+def _color(errors: list[str], key: str, value) -> tuple[int, int, int]:
+    if (
+        not isinstance(value, (list, tuple))
+        or len(value) != 3
+        or not all(isinstance(channel, int) and not isinstance(channel, bool) and 0 <= channel <= 255 for channel in value)
+    ):
+        errors.append(f"{key}: 0~255 정수 세 개([r, g, b])여야 합니다 ({value!r})")
+        return (0, 0, 0)
+    return tuple(value)
+
+
+def _table_list(errors: list[str], section: str, entries, build, limit: int) -> Optional[tuple]:
+    if not isinstance(entries, list) or not entries:
+        errors.append(f"{section}: 항목이 하나 이상인 배열이어야 합니다")
+        return None
+    if len(entries) > limit:
+        errors.append(f"{section}: 최대 {limit}개까지 지정할 수 있습니다")
+    built = []
+    names = set()
+    for idx, entry in enumerate(entries):
+        key = f"{section}[{idx}]"
+        if not isinstance(entry, dict):
+            errors.append(f"{key}: 테이블이어야 합니다")
+            continue
+        name = entry.get("name")
+        if not isinstance(name, str) or not name:
+            errors.append(f"{key}.name: 비어 있지 않은 문자열이어야 합니다")
+        elif name in names:
+            errors.append(f"{key}.name: 이름이 중복됩니다 ({name})")
+        names.add(name)
+        built.append(build(errors, key, entry))
+    return tuple(built)
+
+
+def _vehicle(errors: list[str], key: str, entry: dict) -> VehicleStat:
+    unknown = set(entry) - {"name", "acceleration", "max_speed", "handling", "color"}
+    if unknown:
+        errors.append(f"{key}: 알 수 없는 항목입니다 ({', '.join(sorted(unknown))})")
+    stats = {}
+    for name in ("acceleration", "max_speed", "handling"):
+        value = entry.get(name)
+        if value is None:
+            errors.append(f"{key}.{name}: 값이 없습니다")
+        elif _check_number(errors, f"{key}.{name}", value, float, True):
+            stats[name] = float(value)
+    if stats.get("handling", 0.0) >= 1:
+        errors.append(f"{key}.handling: 1보다 작아야 합니다 ({stats['handling']!r})")
+    return VehicleStat(
+        str(entry.get("name", "")),
+        acceleration=stats.get("acceleration", 0.0),
+        max_speed=stats.get("max_speed", 0.0),
+        handling=stats.get("handling", 0.0),
+        color=_color(errors, f"{key}.color", entry.get("color")),
+    )
+
+
+def _theme(errors: list[str], key: str, entry: dict) -> TrackTheme:
+    colors = ("bg_color", "road_color", "edge_color", "line_color")
+    unknown = set(entry) - {"name", *colors}
+    if unknown:
+        errors.append(f"{key}: 알 수 없는 항목입니다 ({', '.join(sorted(unknown))})")
+    return TrackTheme(str(entry.get("name", "")), *(_color(errors, f"{key}.{name}", entry.get(name)) for name in colors))
+
+
+def compile_profile(data: dict, name: str = "custom") -> ConfigProfile:
+    """파싱된 dict를 검증해 ConfigProfile로 굳힌다. 잘못된 항목이 있으면 전부 모아 ConfigError를 던진다."""
+    errors: list[str] = []
+    if not isinstance(data, dict):
+        raise ConfigError("프로필 최상위는 테이블(객체)이어야 합니다")
+    unknown = set(data) - {"name", "balance", "items", "vehicles", "themes", "ai"}
+    if unknown:
+        errors.append(f"알 수 없는 섹션입니다: {', '.join(sorted(unknown))}")
+
+    profile = DEFAULT_PROFILE
+    balance = _section(errors, "balance", data.get("balance", {}), profile.balance)
+    items = _section(errors, "items", data.get("items", {}), profile.items)
+    vehicles = profile.vehicles
+    if "vehicles" in data:
+        vehicles = _table_list(errors, "vehicles", data["vehicles"], _vehicle, MAX_VEHICLES) or vehicles
+    themes = profile.track_themes
+    if "themes" in data:
+        themes = _table_list(errors, "themes", data["themes"], _theme, 255) or themes
+
+    ai_profile = profile.ai_profile
+    ai = data.get("ai", {})
+    if not isinstance(ai, dict) or set(ai) - {"difficulty"}:
+        errors.append("ai: difficulty 항목만 지정할 수 있습니다")
+    elif "difficulty" in ai:
+        if ai["difficulty"] not in AI_PROFILES:
+            errors.append(f"ai.difficulty: {', '.join(AI_PROFILES)} 중 하나여야 합니다 ({ai['difficulty']!r})")
+        else:
+            ai_profile = AI_PROFILES[ai["difficulty"]]
+
+    if errors:
+        raise ConfigError("\n".join(errors))
+    return ConfigProfile(str(data.get("name", name)), balance, items, vehicles, themes, ai_profile)
+
+
+def load_profile(path: str) -> ConfigProfile:
+    """확장자(.toml/.json)에 맞게 읽어 검증한다. 파일 이름(확장자 제외)이 기본 프로필 이름이다."""
+    name, extension = os.path.splitext(os.path.basename(path))
+    try:
+        if extension == ".toml":
+            if tomllib is None:
+                raise ConfigError("TOML 프로필은 Python 3.11 이상에서 읽을 수 있습니다. JSON을 쓰세요.")
+            with open(path, "rb") as file:
+                data = tomllib.load(file)
+        elif extension == ".json":
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        else:
+            raise ConfigError(f"지원하지 않는 프로필 형식입니다: {path} (.toml/.json)")
+    except ValueError as error:  # JSONDecodeError, TOMLDecodeError
+        if isinstance(error, ConfigError):
+            raise
+        raise ConfigError(f"{path}: 파싱 실패: {error}") from error
+    try:
+        return compile_profile(data, name)
+    except ConfigError as error:
+        raise ConfigError(f"{path}:\n{error}") from None
+
+
+class ProfileWatcher:
+    """백그라운드 스레드가 프로필 파일의 (mtime, 크기)를 폴링해, 바뀌면 읽고 검증해 둔다.
+
+    적용은 take()를 부르는 쪽이 라운드 사이에 한다. 검증에 실패한 파일은 last_error에 남기고 무시하므로
+    편집 중 잠깐 깨진 파일이 게임을 멈추지 않는다.
+    """
+
+    def __init__(self, path: str, poll_seconds: float = 1.0):
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self.last_error: Optional[str] = None
+        self.reloads = 0
+        self._stamp = self._read_stamp()
+        self._pending: Optional[ConfigProfile] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-watcher", daemon=True)
+        self._thread.start()
+
+    def _read_stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _run(self):
+        while not self._stop.wait(self.poll_seconds):
+            self.poll()
+
+    def poll(self) -> bool:
+        """파일이 바뀌었으면 다시 읽는다. 새 프로필이 준비되면 True."""
+        stamp = self._read_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        try:
+            profile = load_profile(self.path)
+        except (OSError, ConfigError) as error:
+            self.last_error = str(error)
+            return False
+        with self._lock:
+            self._pending = profile
+        self.last_error = None
+        self.reloads += 1
+        return True
+
+    def take(self) -> Optional[ConfigProfile]:
+        """마지막으로 검증된 새 프로필(없으면 None). 한 번 가져가면 비워진다."""
+        with self._lock:
+            profile, self._pending = self._pending, None
+        return profile
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
@@ -0,0 +1,260 @@
+"""라운드를 창 없이 그려 동영상(ffmpeg) 또는 PNG 시퀀스와 썸네일로 내보낸다.
+
+    python export_round.py --replay replays/session-20250101-120000.crr --output exports/clip.mp4 --size 1080x1920
+    python export_round.py --seed 42 --rounds 3 --output exports/frames --fps 60
+
+메인 프로세스는 공유 메모리의 프레임 슬롯을 감싼 Surface에 바로 그리고(프레임 복사 없음) 슬롯 번호만 큐로 넘긴다.
+작업 프로세스는 같은 메모리를 memoryview로 읽어 ffmpeg 표준 입력에 그대로 쓰거나 PNG로 저장한 뒤 슬롯을 돌려준다.
+빈 슬롯이 없으면 렌더링이 기다리므로 메모리는 slots개 프레임으로 묶인다. 썸네일은 라운드가 끝난 순간(충돌) 프레임이다.
+"""
+
+import argparse
+import ctypes
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import pygame
+
+from config import EXPORT, TRACK
+from core.simulation import TICK_RATE, RaceSimulation, TickInput, dodge_policy
+from systems.config_profile import DEFAULT_PROFILE, ConfigProfile, load_profile
+from systems.offscreen import OffscreenRenderer
+from systems.replay import ReplayFormatError, ReplayReader
+from systems.viewport import parse_size
+
+PIXEL_FORMAT = "RGBX"  # ffmpeg rawvideo의 rgb0과 같은 바이트 순서
+VIDEO_EXTENSIONS = {".mp4", ".mkv", ".mov", ".webm", ".gif"}
+YUV420_EXTENSIONS = {".mp4", ".mkv", ".mov"}  # 일반 플레이어 호환용(가로/세로가 짝수여야 한다)
+
+
+class ExportError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ExportRound:
+    """내보낼 라운드 하나. inputs가 None이면 기준 자동 조종(dodge_policy)으로 달린다."""
+
+    seed: int
+    vehicle_idx: int
+    inputs: Optional[Iterator[TickInput]] = None
+
+
+@dataclass(frozen=True)
+class ExportStats:
+    frames: int
+    ticks: int
+    seconds: float
+
+    @property
+    def realtime_factor(self) -> float:
+        """내보낸 영상 길이 / 걸린 시간. 1보다 크면 실시간보다 빠르다."""
+        return self.ticks / TICK_RATE / self.seconds if self.seconds else 0.0
+
+
+def encoder_command(output: str, size: tuple[int, int], fps: int) -> list[str]:
+    """표준 입력으로 RGBX 원시 프레임을 받는 ffmpeg 명령."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise ExportError("동영상 내보내기에는 ffmpeg가 필요합니다. PATH에 없으면 디렉터리를 주어 PNG 시퀀스로 내보내세요.")
+    extension = os.path.splitext(output)[1].lower()
+    if extension in YUV420_EXTENSIONS and (size[0] % 2 or size[1] % 2):
+        raise ExportError(f"{extension} 출력은 가로/세로가 짝수여야 합니다: {size[0]}x{size[1]}")
+    command = [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgb0"]
+    command += ["-s", f"{size[0]}x{size[1]}", "-framerate", str(fps), "-i", "-"]
+    if extension in YUV420_EXTENSIONS:
+        command += ["-pix_fmt", "yuv420p"]
+    return command + [output]
+
+
+def _encode_worker(frames, slot_bytes: int, size: tuple[int, int], tasks, free, command: Optional[list[str]]):
+    """작업 프로세스. 태스크 (슬롯, 인코딩 여부, PNG 경로)를 받아 처리하고 슬롯을 free로 돌려준다. None이면 끝."""
+    buffer = memoryview(frames).cast("B")
+    encoder = subprocess.Popen(command, stdin=subprocess.PIPE) if command else None
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, encode, path = task
+            view = buffer[slot * slot_bytes : (slot + 1) * slot_bytes]
+            if encode and encoder:
+                encoder.stdin.write(view)
+            if path:
+                image = pygame.image.frombuffer(view, size, PIXEL_FORMAT)
+                pygame.image.save(image, path)
+                del image  # Surface가 버퍼를 잡고 있으면 view를 놓을 수 없다.
+            view.release()
+            free.put(slot)
+    finally:
+        if encoder:
+            encoder.stdin.close()
+            encoder.wait()
+    buffer.release()
+    if encoder and encoder.returncode:
+        sys.exit(encoder.returncode)
+
+
+class FrameExporter:
+    """프레임 슬롯(공유 메모리)과 작업 프로세스를 묶은 내보내기 파이프라인.
+
+    output이 동영상 확장자면 ffmpeg 작업자 하나가 순서대로 인코딩하고, 아니면 디렉터리로 보고 PNG를 쓴다.
+    PNG는 프레임끼리 독립이라 workers개가 나눠 저장한다.
+    """
+
+    def __init__(
+        self,
+        output: str,
+        size: Optional[tuple[int, int]] = None,
+        fps: int = EXPORT.fps,
+        slots: int = EXPORT.slots,
+        workers: int = EXPORT.png_workers,
+        command: Optional[list[str]] = None,
+    ):
+        self.renderer = OffscreenRenderer(size)
+        self.size = self.renderer.size
+        self.fps = fps
+        self.output = output
+        extension = os.path.splitext(output)[1].lower()
+        self.video = command is not None or extension in VIDEO_EXTENSIONS
+        if self.video:
+            command = command or encoder_command(output, self.size, fps)
+            os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+            self.thumbnail_stem = os.path.splitext(output)[0]
+            workers = 1  # 인코더에는 프레임 순서대로 들어가야 한다.
+        else:
+            os.makedirs(output, exist_ok=True)
+            self.thumbnail_stem = os.path.join(output, "thumbnail")
+
+        self.slot_bytes = self.size[0] * self.size[1] * 4
+        context = multiprocessing.get_context("spawn")  # pygame/SDL 상태를 물려받지 않게 새로 띄운다.
+        self._frames = context.RawArray(ctypes.c_ubyte, self.slot_bytes * slots)
+        self._buffer = memoryview(self._frames).cast("B")
+        self._surfaces = [
+            pygame.image.frombuffer(self._buffer[slot * self.slot_bytes : (slot + 1) * self.slot_bytes], self.size, PIXEL_FORMAT)
+            for slot in range(slots)
+        ]
+        self._tasks = context.Queue()
+        self._free = context.Queue()
+        for slot in range(slots):
+            self._free.put(slot)
+        self._workers = [
+            context.Process(
+                target=_encode_worker,
+                args=(self._frames, self.slot_bytes, self.size, self._tasks, self._free, command),
+                name=f"export-{idx}",
+                daemon=True,
+            )
+            for idx in range(max(1, min(workers, os.cpu_count() or 1)))
+        ]
+        os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # 작업자마다 인사말을 찍지 않게
+        for worker in self._workers:
+            worker.start()
+        self.frames = 0
+        self.ticks = 0
+
+    def _submit(self, sim: RaceSimulation, encode: bool, path: Optional[str]):
+        slot = self._free.get()  # 작업자가 밀리면 여기서 기다린다.
+        self.renderer.paint_sim(self._surfaces[slot], sim)
+        self._tasks.put((slot, encode, path))
+
+    def export_round(self, export_round: ExportRound, round_idx: int, profile: ConfigProfile = DEFAULT_PROFILE, max_ticks: int = TICK_RATE * 600):
+        """라운드 하나를 시뮬레이션하며 fps에 맞는 틱마다 프레임을 낸다. 마지막(충돌) 프레임은 썸네일로도 남긴다."""
+        sim = RaceSimulation(export_round.seed, export_round.vehicle_idx, track=TRACK, **profile.simulation_options())
+        inputs = export_round.inputs
+        frame_idx = 0
+        while True:
+            while frame_idx * TICK_RATE <= sim.frame_counter * self.fps:
+                path = None if self.video else os.path.join(self.output, f"round{round_idx:03d}-{frame_idx:05d}.png")
+                self._submit(sim, self.video, path)
+                frame_idx += 1
+            if sim.game_over or sim.frame_counter >= max_ticks:
+                break
+            if inputs is None:
+                tick_input = dodge_policy(sim)
+            else:
+                tick_input = next(inputs, None)
+                if tick_input is None:
+                    break
+            sim.step(tick_input)
+        self._submit(sim, False, f"{self.thumbnail_stem}-round{round_idx:03d}.png")
+        self.frames += frame_idx
+        self.ticks += sim.frame_counter
+
+    def close(self):
+        """남은 프레임을 다 쓰고 작업자를 끝낸다."""
+        for _ in self._workers:
+            self._tasks.put(None)
+        failed = False
+        for worker in self._workers:
+            worker.join()
+            failed |= worker.exitcode != 0
+        self._surfaces.clear()
+        self._buffer.release()
+        if failed:
+            raise ExportError("내보내기 작업자가 실패했습니다(인코더 오류 출력을 확인하세요).")
+
+
+def replay_export_rounds(path: str, profile: ConfigProfile = DEFAULT_PROFILE) -> Iterator[ExportRound]:
+    for replay_round in ReplayReader(path, profile=profile).rounds():
+        yield ExportRound(replay_round.seed, replay_round.vehicle_idx, replay_round.inputs())
+
+
+def export_rounds(
+    rounds: Iterator[ExportRound],
+    output: str,
+    size: Optional[tuple[int, int]] = None,
+    fps: int = EXPORT.fps,
+    profile: ConfigProfile = DEFAULT_PROFILE,
+    workers: int = EXPORT.png_workers,
+    command: Optional[list[str]] = None,
+) -> ExportStats:
+    started = time.perf_counter()
+    exporter = FrameExporter(output, size, fps, workers=workers, command=command)
+    try:
+        for round_idx, export_round in enumerate(rounds):
+            exporter.export_round(export_round, round_idx, profile)
+    finally:
+        exporter.close()
+    return ExportStats(exporter.frames, exporter.ticks, time.perf_counter() - started)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="라운드를 동영상/PNG 시퀀스로 내보내기")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--replay", metavar="PATH", help="기록된 리플레이(.crr)의 라운드를 그대로 내보냄")
+    source.add_argument("--seed", type=int, help="이 시드부터 자동 조종 라운드를 내보냄")
+    parser.add_argument("--rounds", type=int, default=1, help="--seed와 함께: 내보낼 라운드 수")
+    parser.add_argument("--vehicle", type=int, default=0, help="--seed와 함께: 차량 인덱스")
+    parser.add_argument("--profile", metavar="PATH", help="설정 프로필(리플레이를 기록한 프로필)")
+    parser.add_argument("--output", required=True, help="동영상 파일(.mp4/.webm/.gif 등, ffmpeg 필요) 또는 PNG 디렉터리")
+    parser.add_argument("--size", default="", help="출력 해상도 WxH (기본: 논리 해상도)")
+    parser.add_argument("--fps", type=int, default=EXPORT.fps)
+    parser.add_argument("--workers", type=int, default=EXPORT.png_workers, help="PNG 저장 작업 프로세스 수")
+    args = parser.parse_args(argv)
+
+    try:
+        size = parse_size(args.size) if args.size else None
+    except ValueError as error:
+        parser.error(str(error))
+    profile = load_profile(args.profile) if args.profile else DEFAULT_PROFILE
+    if args.replay:
+        rounds = replay_export_rounds(args.replay, profile)
+    else:
+        rounds = (ExportRound(args.seed + idx, args.vehicle) for idx in range(args.rounds))
+
+    try:
+        stats = export_rounds(rounds, args.output, size, args.fps, profile, args.workers)
+    except (ExportError, ReplayFormatError) as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"{args.output}: 프레임 {stats.frames}개 ({stats.ticks / TICK_RATE:.1f}초 분량), "
+        f"{stats.seconds:.2f}초 걸림 (실시간 대비 {stats.realtime_factor:.1f}배)"
+    )
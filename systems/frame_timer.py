@@ -0,0 +1,121 @@
+"""프레임 작업 시간(clock.tick 대기 제외)을 이동 구간으로 재는 카운터와 구간별 프로파일러."""
+
+import json
+import time
+from collections import deque
+from typing import Optional, TextIO
+
+
+class FrameTimeCounter:
+    def __init__(self, window: int = 120):
+        self.samples = deque(maxlen=window)
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+
+    def stop(self) -> float:
+        elapsed_ms = (time.perf_counter() - self._started) * 1000.0
+        self.samples.append(elapsed_ms)
+        return elapsed_ms
+
+    @property
+    def average_ms(self) -> float:
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        return max(self.samples, default=0.0)
+
+    def percentile_ms(self, fraction: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FrameProfiler(FrameTimeCounter):
+    """프레임 전체 시간에 더해 계측한 메서드별 시간을 프레임 단위로 모은다.
+
+    instrument는 대상 객체의 메서드를 인스턴스 속성으로 감싸 시간을 재고, uninstrument는 그
+    속성을 지워 원래 메서드로 되돌린다. 끄면 감싼 흔적이 남지 않아 계측 비용이 0이다.
+    한 프레임에 여러 번 불린 구간은 합산한다.
+    """
+
+    def __init__(self, window: int = 120):
+        super().__init__(window)
+        self.window = window
+        self.phase_samples: dict[str, deque] = {}
+        self.frame_index = 0
+        self._frame_phases: dict[str, float] = {}
+        self._instrumented: list[tuple[object, str]] = []
+        self._trace: Optional[TextIO] = None
+        self.trace_path: Optional[str] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._instrumented)
+
+    def instrument(self, owner: object, names, prefix: str = ""):
+        for name in names:
+            if name in vars(owner):
+                continue
+            method = getattr(owner, name)
+            setattr(owner, name, self._timed(prefix + name, method))
+            self._instrumented.append((owner, name))
+
+    def uninstrument(self):
+        for owner, name in self._instrumented:
+            delattr(owner, name)
+        self._instrumented.clear()
+        self.phase_samples.clear()
+
+    def _timed(self, label: str, method):
+        phases = self._frame_phases
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            started = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                phases[label] = phases.get(label, 0.0) + clock() - started
+
+        return timed
+
+    def start(self):
+        super().start()
+        self._frame_phases.clear()
+
+    def stop(self) -> float:
+        elapsed_ms = super().stop()
+        self.frame_index += 1
+        for label, seconds in self._frame_phases.items():
+            samples = self.phase_samples.get(label)
+            if samples is None:
+                samples = self.phase_samples[label] = deque(maxlen=self.window)
+            samples.append(seconds * 1000.0)
+        if self._trace is not None:
+            record = {"frame": self.frame_index, "total_ms": round(elapsed_ms, 4)}
+            record.update((label, round(seconds * 1000.0, 4)) for label, seconds in self._frame_phases.items())
+            self._trace.write(json.dumps(record) + "\n")
+        return elapsed_ms
+
+    def phase_average_ms(self, label: str) -> float:
+        samples = self.phase_samples.get(label)
+        return sum(samples) / len(samples) if samples else 0.0
+
+    @property
+    def tracing(self) -> bool:
+        return self._trace is not None
+
+    def open_trace(self, path: str):
+        """프레임마다 전체/구간 시간을 JSON 한 줄씩 path에 기록한다."""
+        self.close_trace()
+        self._trace = open(path, "w", encoding="utf-8")
+        self.trace_path = path
+
+    def close_trace(self):
+        if self._trace is not None:
+            self._trace.close()
+            self._trace = None
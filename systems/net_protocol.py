@@ -0,0 +1,118 @@
+"""고스트 레이스 네트워크 프로토콜: 메시지 프레이밍과 스냅샷 델타 압축 (asyncio/pygame 비의존).
+
+    프레임    length u16 | type u8 | payload (length는 type부터 센 길이)
+    HELLO     vehicle u8                                                   클라이언트 → 서버
+    WELCOME   player_id u8 | players u8 | seed u64 | input_delay u8 | vehicles... u8
+    INPUT     tick u32 | flags u8 | ack u32                                 ack: 마지막으로 받은 스냅샷 틱
+    SNAPSHOT  tick u32 | baseline u32 | 자기 상태 델타 | 고스트 델타            서버 → 클라이언트
+
+스냅샷은 정수 필드 목록이다. 델타는 바뀐 필드의 비트마스크 뒤에 바뀐 필드마다 (현재 - 기준)을
+zigzag varint로 붙인다. 기준은 클라이언트가 ack한 스냅샷이고, 없으면(NO_BASELINE) 0과의 차이,
+즉 전체 스냅샷이 된다. 입력 플래그는 리플레이 형식(encode_input)과 같다.
+"""
+
+import struct
+from typing import Optional, Sequence
+
+from core.simulation import RaceSimulation
+
+MSG_HELLO = 1
+MSG_WELCOME = 2
+MSG_INPUT = 3
+MSG_SNAPSHOT = 4
+
+FRAME = struct.Struct("<HB")
+HELLO = struct.Struct("<B")
+WELCOME = struct.Struct("<BBQB")
+INPUT = struct.Struct("<IBI")
+SNAPSHOT = struct.Struct("<II")
+
+NO_BASELINE = 0xFFFFFFFF
+MAX_PLAYERS = 255  # WELCOME의 players와 차량 목록이 u8이다.
+FIXED_POINT = 256  # 차 x/속도는 1/256px 고정소수점으로 보낸다.
+
+STATE_GAME_OVER = 1
+STATE_SHIELD = 2
+STATE_BOOST = 4
+STATE_ITEM = 8
+
+# 자기 상태 앞부분. 예측(RaceSimulation.steer)이 읽는 차 상태가 모두 들어 있다. 뒤에 적 (x, y)가 이어진다.
+OWN_FIELDS = ("car_x", "velocity", "target_x", "boost_timer", "boost_cooldown", "score", "state", "item_x", "item_y")
+GHOST_FIELDS = ("car_x", "score", "state")  # 플레이어마다
+
+
+def frame(msg_type: int, payload: bytes) -> bytes:
+    return FRAME.pack(len(payload) + 1, msg_type) + payload
+
+
+def state_flags(sim: RaceSimulation) -> int:
+    flags = STATE_GAME_OVER if sim.game_over else 0
+    if sim.shield_active:
+        flags |= STATE_SHIELD
+    if sim.boost_timer > 0:
+        flags |= STATE_BOOST
+    if sim.shield_item is not None:
+        flags |= STATE_ITEM
+    return flags
+
+
+def own_state(sim: RaceSimulation) -> list[int]:
+    item = sim.shield_item
+    values = [
+        round(sim.car_x * FIXED_POINT),
+        round(sim.car_velocity_x * FIXED_POINT),
+        sim.player_target_x,
+        sim.boost_timer,
+        sim.boost_cooldown,
+        sim.score,
+        state_flags(sim),
+        item.x if item else 0,
+        item.y if item else 0,
+    ]
+    for enemy in sim.enemies:
+        values += (int(enemy.x), int(enemy.y))
+    return values
+
+
+def ghost_state(sims: Sequence[RaceSimulation]) -> list[int]:
+    values = []
+    for sim in sims:
+        values += (int(sim.car_x), sim.score, state_flags(sim))
+    return values
+
+
+def encode_delta(values: Sequence[int], baseline: Optional[Sequence[int]]) -> bytes:
+    mask = bytearray((len(values) + 7) // 8)
+    body = bytearray()
+    for idx, value in enumerate(values):
+        diff = value - baseline[idx] if baseline is not None else value
+        if not diff:
+            continue
+        mask[idx >> 3] |= 1 << (idx & 7)
+        zigzag = diff << 1 if diff > 0 else (-diff << 1) - 1
+        while zigzag >= 0x80:
+            body.append(zigzag & 0x7F | 0x80)
+            zigzag >>= 7
+        body.append(zigzag)
+    return bytes(mask + body)
+
+
+def decode_delta(data: bytes, offset: int, count: int, baseline: Optional[Sequence[int]]) -> tuple[list[int], int]:
+    """count개 필드를 복원하고 다음 읽을 위치를 함께 돌려준다."""
+    mask_end = offset + (count + 7) // 8
+    mask = data[offset:mask_end]
+    offset = mask_end
+    values = list(baseline) if baseline is not None else [0] * count
+    for idx in range(count):
+        if not mask[idx >> 3] & (1 << (idx & 7)):
+            continue
+        zigzag = shift = 0
+        while True:
+            byte = data[offset]
+            offset += 1
+            zigzag |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        values[idx] += zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+    return values, offset
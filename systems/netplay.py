@@ -0,0 +1,344 @@
+"""같은 시드 라운드를 여러 캐비닛이 함께 달리는 asyncio 권위 서버와 예측 클라이언트.
+
+서버가 플레이어마다 RaceSimulation을 돌리고(시드가 같으므로 같은 라운드, 적 AI는 각자의 차에 반응),
+고정 틱마다 입력을 적용한 뒤 각 클라이언트에 자기 상태와 전원의 고스트 상태를 델타 스냅샷으로 보낸다.
+클라이언트는 자기 차를 입력 즉시 예측해 두고, 스냅샷을 받으면 그 틱 이후 입력을 다시 적용해 맞춘다.
+넷플레이는 고정 도로에서 진행한다(예측이 트랙 커브/차선 변화까지 따라가지 않도록).
+"""
+
+import argparse
+import asyncio
+import random
+import struct
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from core.simulation import IDLE_INPUT, TICK_RATE, TICK_SECONDS, VEHICLES, RaceSimulation, TickInput
+from systems import net_protocol as proto
+from systems.replay import decode_input, encode_input
+
+SNAPSHOT_HISTORY = 64  # ack가 이보다 오래되면 전체 스냅샷을 보낸다.
+MAX_SEND_BUFFER = 64 * 1024  # 소켓 송신 버퍼가 이보다 밀리면 그 클라이언트의 이번 스냅샷은 건너뛴다.
+INPUT_WINDOW = TICK_RATE  # 서버 틱보다 이만큼 넘게 앞선 입력은 버린다(입력 버퍼 상한).
+
+
+class ProtocolError(ConnectionError):
+    """상대가 규약에 맞지 않는 프레임을 보냈다. 연결 오류처럼 끊는다."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    length, msg_type = proto.FRAME.unpack(await reader.readexactly(proto.FRAME.size))
+    if length < 1:  # 길이에는 메시지 종류 바이트가 포함된다.
+        raise ProtocolError(f"프레임 길이 오류: {length}")
+    return msg_type, await reader.readexactly(length - 1)
+
+
+def trim_history(history: dict):
+    """틱 순서로 넣은 스냅샷 기록에서 SNAPSHOT_HISTORY개를 넘는 가장 오래된 것을 버린다."""
+    while len(history) > SNAPSHOT_HISTORY:
+        del history[next(iter(history))]
+
+
+class RemotePlayer:
+    def __init__(self, player_id: int, vehicle_idx: int, writer: asyncio.StreamWriter):
+        self.player_id = player_id
+        self.vehicle_idx = vehicle_idx
+        self.writer = writer
+        self.sim: Optional[RaceSimulation] = None
+        self.inputs: dict[int, TickInput] = {}
+        self.held = IDLE_INPUT
+        self.ack = proto.NO_BASELINE
+        self.history: dict[int, list[int]] = {}
+        self.connected = True
+        self.late_inputs = 0
+        self.bytes_sent = 0
+
+    def take_input(self, tick: int) -> TickInput:
+        """이 틱 입력. 제때 오지 않았으면 누르고 있던 좌/우만 이어 간다(부스트/스와이프는 한 번만 적용)."""
+        tick_input = self.inputs.pop(tick, None)
+        if tick_input is None:
+            self.late_inputs += 1
+            return TickInput(left=self.held.left, right=self.held.right)
+        self.held = tick_input
+        return tick_input
+
+
+class RaceServer:
+    """players명이 모이면 라운드를 시작하고 모두 끝나면(또는 max_ticks) 연결을 닫는다.
+
+    클라이언트보다 input_delay틱 늦게 시작해 입력이 도착할 여유를 둔다.
+    """
+
+    def __init__(
+        self,
+        players: int,
+        seed: Optional[int] = None,
+        input_delay: int = 3,
+        snapshot_interval: int = 1,
+        max_ticks: int = TICK_RATE * 600,
+        delta: bool = True,
+    ):
+        if not 1 <= players <= proto.MAX_PLAYERS:
+            raise ValueError(f"players는 1~{proto.MAX_PLAYERS}명이어야 합니다 ({players})")
+        self.player_count = players
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.input_delay = input_delay
+        self.snapshot_interval = snapshot_interval
+        self.max_ticks = max_ticks
+        self.delta = delta  # False면 항상 전체 스냅샷(대역폭 비교용)
+        self.players: list[RemotePlayer] = []
+        self.tick = 0
+        self.tick_times: list[float] = []  # 틱마다 시뮬레이션+인코딩+송신에 든 시간(초)
+        self.ghost_history: dict[int, list[int]] = {}
+        self._ghost_cache: dict[int, bytes] = {}
+        self._full = asyncio.Event()
+        self.finished = asyncio.Event()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        self._server = await asyncio.start_server(self.handle_client, host, port)
+        asyncio.get_running_loop().create_task(self.run_round())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            msg_type, payload = await read_frame(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        if msg_type != proto.MSG_HELLO or len(payload) != proto.HELLO.size or self._full.is_set():
+            writer.close()
+            return
+        (vehicle_idx,) = proto.HELLO.unpack(payload)
+        if vehicle_idx >= len(VEHICLES):
+            writer.close()
+            return
+        player = RemotePlayer(len(self.players), vehicle_idx, writer)
+        self.players.append(player)
+        if len(self.players) == self.player_count:
+            self._full.set()
+
+        try:
+            while True:
+                msg_type, payload = await read_frame(reader)
+                if msg_type == proto.MSG_INPUT:
+                    tick, flags, ack = proto.INPUT.unpack(payload)
+                    if self.tick < tick <= self.tick + INPUT_WINDOW:  # 지나간 틱과 너무 먼 틱의 입력은 버린다.
+                        player.inputs[tick] = decode_input(flags)
+                    player.ack = ack  # TCP라 ack는 순서대로 온다.
+        except (asyncio.IncompleteReadError, ConnectionError, struct.error):
+            player.connected = False
+            writer.close()
+
+    def welcome(self, player: RemotePlayer) -> bytes:
+        vehicles = bytes(other.vehicle_idx for other in self.players)
+        payload = proto.WELCOME.pack(player.player_id, len(self.players), self.seed, self.input_delay) + vehicles
+        return proto.frame(proto.MSG_WELCOME, payload)
+
+    async def run_round(self):
+        await self._full.wait()
+        for player in self.players:
+            player.sim = RaceSimulation(self.seed, player.vehicle_idx)
+            player.writer.write(self.welcome(player))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time() + self.input_delay * TICK_SECONDS
+        while self.tick < self.max_ticks and any(p.connected and not p.sim.game_over for p in self.players):
+            await asyncio.sleep(max(0.0, start + self.tick * TICK_SECONDS - loop.time()))
+            started = time.perf_counter()
+            self.step()
+            self.tick_times.append(time.perf_counter() - started)
+
+        if self.tick % self.snapshot_interval:
+            self.broadcast()  # 마지막 상태는 간격과 관계없이 보낸다.
+        for player in self.players:
+            player.writer.close()
+        self._server.close()
+        self.finished.set()
+
+    def step(self):
+        self.tick += 1
+        for player in self.players:
+            if player.connected and not player.sim.game_over:
+                player.sim.step(player.take_input(self.tick))
+            else:
+                player.inputs.clear()
+        if self.tick % self.snapshot_interval == 0:
+            self.broadcast()
+
+    def broadcast(self):
+        tick = self.tick
+        self.ghost_history[tick] = proto.ghost_state([player.sim for player in self.players])
+        self._ghost_cache = {}
+        for player in self.players:
+            if player.connected:
+                self.send_snapshot(player, tick)
+        trim_history(self.ghost_history)
+
+    def ghost_delta(self, baseline: int) -> bytes:
+        """고스트 구간은 모든 클라이언트가 같으므로 기준 틱별로 한 번만 인코딩한다."""
+        delta = self._ghost_cache.get(baseline)
+        if delta is None:
+            delta = proto.encode_delta(self.ghost_history[self.tick], self.ghost_history.get(baseline))
+            self._ghost_cache[baseline] = delta
+        return delta
+
+    def send_snapshot(self, player: RemotePlayer, tick: int):
+        if player.writer.transport.get_write_buffer_size() > MAX_SEND_BUFFER:
+            return
+        own = proto.own_state(player.sim)
+        player.history[tick] = own
+        trim_history(player.history)
+        baseline = proto.NO_BASELINE
+        if self.delta and player.ack in player.history and player.ack in self.ghost_history:
+            baseline = player.ack
+        payload = (
+            proto.SNAPSHOT.pack(tick, baseline)
+            + proto.encode_delta(own, player.history.get(baseline))
+            + self.ghost_delta(baseline)
+        )
+        message = proto.frame(proto.MSG_SNAPSHOT, payload)
+        player.bytes_sent += len(message)
+        player.writer.write(message)
+
+
+class CarPredictor:
+    """자기 차만 예측한다. 서버 상태에 아직 반영되지 않은 입력을 보관했다가 스냅샷이 오면 다시 적용한다."""
+
+    CORRECTION_PX = 0.5
+
+    def __init__(self, seed: int, vehicle_idx: int):
+        self.sim = RaceSimulation(seed, vehicle_idx)  # steer()용 차 상태만 쓴다.
+        self.pending: deque[tuple[int, TickInput]] = deque()
+        self.corrections = 0
+
+    @property
+    def car_x(self) -> float:
+        return self.sim.car_x
+
+    def predict(self, tick: int, tick_input: TickInput):
+        self.pending.append((tick, tick_input))
+        self.sim.steer(tick_input)
+
+    def reconcile(self, tick: int, own: list[int]):
+        pending = self.pending
+        game_over = own[6] & proto.STATE_GAME_OVER
+        if game_over:
+            pending.clear()  # 서버에서 라운드가 끝났으면 그 뒤 입력은 적용되지 않는다.
+        while pending and pending[0][0] <= tick:
+            pending.popleft()
+        sim = self.sim
+        predicted_x = sim.car_x
+        sim.car_x = own[0] / proto.FIXED_POINT
+        sim.car_velocity_x = own[1] / proto.FIXED_POINT
+        sim.player_target_x, sim.boost_timer, sim.boost_cooldown = own[2], own[3], own[4]
+        for _, tick_input in pending:
+            sim.steer(tick_input)
+        if not game_over and abs(sim.car_x - predicted_x) > self.CORRECTION_PX:
+            self.corrections += 1
+
+
+ClientPolicy = Callable[["RaceClient"], TickInput]
+
+
+class RaceClient:
+    def __init__(self, vehicle_idx: int = 0):
+        self.vehicle_idx = vehicle_idx
+        self.own: Optional[list[int]] = None
+        self.ghosts: Optional[list[int]] = None
+        self.snapshot_tick = proto.NO_BASELINE
+        self._own_history: dict[int, list[int]] = {}
+        self._ghost_history: dict[int, list[int]] = {}
+        self._sent_at: dict[int, float] = {}
+        self.latencies: list[float] = []  # 입력을 보내고 그 틱 스냅샷을 받기까지(초)
+        self.bytes_received = 0
+        self.snapshots = 0
+
+    async def connect(self, host: str, port: int):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.writer.write(proto.frame(proto.MSG_HELLO, proto.HELLO.pack(self.vehicle_idx)))
+        msg_type, payload = await read_frame(self.reader)
+        if msg_type != proto.MSG_WELCOME:
+            raise ConnectionError("WELCOME 대신 다른 메시지를 받았습니다")
+        self.player_id, players, self.seed, self.input_delay = proto.WELCOME.unpack_from(payload)
+        self.vehicles = list(payload[proto.WELCOME.size : proto.WELCOME.size + players])
+        self.own_count = len(proto.OWN_FIELDS) + 2 * len(RaceSimulation(self.seed).enemies)
+        self.ghost_count = len(proto.GHOST_FIELDS) * players
+        self.predictor = CarPredictor(self.seed, self.vehicle_idx)
+
+    @property
+    def game_over(self) -> bool:
+        return self.own is not None and bool(self.own[6] & proto.STATE_GAME_OVER)
+
+    def on_snapshot(self, payload: bytes):
+        tick, baseline = proto.SNAPSHOT.unpack_from(payload)
+        own_base = self._own_history.get(baseline)
+        own, offset = proto.decode_delta(payload, proto.SNAPSHOT.size, self.own_count, own_base)
+        ghosts, _ = proto.decode_delta(payload, offset, self.ghost_count, self._ghost_history.get(baseline))
+        self._own_history[tick] = own
+        self._ghost_history[tick] = ghosts
+        trim_history(self._own_history)
+        trim_history(self._ghost_history)
+        self.own, self.ghosts, self.snapshot_tick = own, ghosts, tick
+        self.snapshots += 1
+        sent_at = self._sent_at.pop(tick, None)
+        if sent_at is not None:
+            self.latencies.append(time.perf_counter() - sent_at)
+        for old in [t for t in self._sent_at if t < tick]:
+            del self._sent_at[old]
+        self.predictor.reconcile(tick, own)
+
+    async def receive(self):
+        try:
+            while True:
+                msg_type, payload = await read_frame(self.reader)
+                self.bytes_received += proto.FRAME.size + len(payload)
+                if msg_type == proto.MSG_SNAPSHOT:
+                    self.on_snapshot(payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    async def play(self, policy: ClientPolicy):
+        """서버가 연결을 닫을 때까지 틱마다 policy로 입력을 만들어 예측하고 보낸다."""
+        loop = asyncio.get_running_loop()
+        receiver = loop.create_task(self.receive())
+        start = loop.time()
+        tick = 0
+        while not receiver.done():
+            tick += 1
+            if not self.game_over:
+                tick_input = policy(self)
+                self.predictor.predict(tick, tick_input)
+                self._sent_at[tick] = time.perf_counter()
+                payload = proto.INPUT.pack(tick, encode_input(tick_input), self.snapshot_tick)
+                self.writer.write(proto.frame(proto.MSG_INPUT, payload))
+            await asyncio.sleep(max(0.0, start + tick * TICK_SECONDS - loop.time()))
+        self.writer.close()
+
+
+async def serve(args):
+    server = RaceServer(args.players, args.seed, args.input_delay, args.snapshot_interval)
+    port = await server.start(args.host, args.port)
+    print(f"{args.host}:{port} 에서 {args.players}명 대기 중 (seed={server.seed})")
+    await server.finished.wait()
+    for player in server.players:
+        print(f"player {player.player_id}: score={player.sim.score} sent={player.bytes_sent}B late_inputs={player.late_inputs}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="고스트 레이스 서버")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--seed", type=int, default=None, help="라운드 시드 (기본: 무작위)")
+    parser.add_argument("--input-delay", type=int, default=3, help="입력 도착을 기다리는 틱 수")
+    parser.add_argument("--snapshot-interval", type=int, default=1, help="스냅샷을 보내는 틱 간격")
+    args = parser.parse_args(argv)
+    if not 1 <= args.players <= proto.MAX_PLAYERS:
+        parser.error(f"--players: 1~{proto.MAX_PLAYERS} 사이여야 합니다 ({args.players})")
+    if not 0 <= args.input_delay <= 255:
+        parser.error(f"--input-delay: 0~255 사이여야 합니다 ({args.input_delay})")
+    if args.snapshot_interval < 1:
+        parser.error(f"--snapshot-interval: 1 이상이어야 합니다 ({args.snapshot_interval})")
+    asyncio.run(serve(args))
@@ -0,0 +1,122 @@
+"""창 없이 재사용 Surface에 시뮬레이션 상태를 그려 NumPy 배열로 돌려주는 오프스크린 렌더러."""
+
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from config import DISPLAY, ITEMS, TRACK
+from core.simulation import CAR_SIZE, ENEMY_SIZE, LINE_SIZE, ROAD_EDGE_WIDTH, TrackTheme
+
+EDGE_WIDTH = ROAD_EDGE_WIDTH
+ENEMY_COLOR = (200, 30, 30)
+SHIELD_COLOR = (80, 200, 255)
+HAZARD_COLOR = (255, 140, 0)
+
+
+class OffscreenRenderer:
+    """디스플레이 모드나 convert() 없이 도형만으로 그린다. 이미지 에셋을 읽지 않으므로 헤드리스에서도 동작한다.
+
+    size를 주면 논리 해상도로 그린 뒤 같은 출력 Surface에 축소해 (H, W, 3) uint8 배열로 반환한다.
+    """
+
+    def __init__(self, size: Optional[tuple[int, int]] = None):
+        self.logical_size = (DISPLAY.width, DISPLAY.height)
+        self.size = size or self.logical_size
+        self.canvas = pygame.Surface(self.logical_size)
+        self.output = self.canvas if self.size == self.logical_size else pygame.Surface(self.size)
+        self._backgrounds: dict[TrackTheme, pygame.Surface] = {}
+
+    def background(self, theme: TrackTheme) -> pygame.Surface:
+        surface = self._backgrounds.get(theme)
+        if surface is None:
+            width, height = self.logical_size
+            surface = pygame.Surface(self.logical_size)
+            surface.fill(theme.edge_color)
+            pygame.draw.rect(surface, theme.road_color, [EDGE_WIDTH, 0, width - EDGE_WIDTH * 2, height])
+            self._backgrounds[theme] = surface
+        return surface
+
+    def canvas_for(self, target: pygame.Surface) -> pygame.Surface:
+        """논리 해상도 그림판. target이 논리 해상도면 target에 바로 그리고, 아니면 target과 픽셀 형식이 같은 캔버스를 쓴다
+        (transform.scale은 형식을 변환하지 않고 픽셀을 그대로 옮긴다)."""
+        if target.get_size() == self.logical_size:
+            return target
+        if self.canvas.get_bitsize() != target.get_bitsize() or self.canvas.get_masks() != target.get_masks():
+            self.canvas = pygame.Surface(self.logical_size, 0, target)
+        return self.canvas
+
+    def paint(
+        self,
+        target: pygame.Surface,
+        theme: TrackTheme,
+        line_ys,
+        car_x: float,
+        car_y: int,
+        car_color,
+        enemies,
+        shield_item=None,
+        shield_active: bool = False,
+        hazards=(),
+    ):
+        """target에 그린다. enemies/hazards는 (x, y) 좌표 목록, shield_item은 (x, y) 또는 None."""
+        canvas = self.canvas_for(target)
+        canvas.blit(self.background(theme), (0, 0))
+        line_x = self.logical_size[0] // 2 - LINE_SIZE[0] // 2
+        for y in line_ys:
+            canvas.fill(theme.line_color, (line_x, y, *LINE_SIZE))
+        for x, y in hazards:
+            canvas.fill(HAZARD_COLOR, (x, y, *TRACK.hazard_size))
+        if shield_item is not None:
+            canvas.fill(SHIELD_COLOR, (*shield_item, *ITEMS.shield_size))
+        for x, y in enemies:
+            canvas.fill(ENEMY_COLOR, (x, y, *ENEMY_SIZE))
+        car_rect = pygame.Rect(int(car_x), car_y, *CAR_SIZE)
+        canvas.fill(car_color, car_rect)
+        if shield_active:
+            pygame.draw.rect(canvas, SHIELD_COLOR, car_rect.inflate(10, 10), 3)
+
+        if target is not canvas:
+            pygame.transform.scale(canvas, target.get_size(), target)
+
+    def draw(self, *state) -> np.ndarray:
+        """paint와 같은 인자로 출력 Surface에 그려 (H, W, 3) uint8 배열로 돌려준다."""
+        self.paint(self.output, *state)
+        return pygame.surfarray.array3d(self.output).transpose(1, 0, 2)
+
+    def draw_sim(self, sim) -> np.ndarray:
+        """RaceSimulation 한 라운드를 그린다."""
+        return self.draw(*sim_state(sim))
+
+    def paint_sim(self, target: pygame.Surface, sim):
+        self.paint(target, *sim_state(sim))
+
+    def draw_batch_row(self, batch, row: int) -> np.ndarray:
+        """BatchSimulation의 활성 행 하나를 그린다."""
+        round_id = int(batch.round_ids[row])
+        return self.draw(
+            batch.track_themes[batch.theme_idx[row]],
+            batch.line_ys[row].tolist(),
+            batch.car_x[row],
+            batch.car_y,
+            batch.vehicles[batch.vehicle_idx[round_id]].color,
+            list(zip(batch.enemy_x[row].astype(int).tolist(), batch.enemy_y[row].astype(int).tolist())),
+            (int(batch.shield_x[row]), int(batch.shield_y[row])) if batch.has_shield_item[row] else None,
+            bool(batch.shield_active[row]),
+        )
+
+
+def sim_state(sim) -> tuple:
+    """RaceSimulation에서 paint 인자(target 뒤)를 뽑는다."""
+    item = sim.shield_item
+    return (
+        sim.theme,
+        sim.line_ys,
+        sim.car_x,
+        sim.car_y,
+        sim.vehicle.color,
+        [(enemy.x, enemy.y) for enemy in sim.enemies],
+        (item.x, item.y) if item else None,
+        sim.shield_active,
+        [(hazard.x, hazard.y) for hazard in sim.hazards],
+    )
@@ -0,0 +1,54 @@
+"""트랙 테마별 정적 배경/차선 스프라이트를 창 해상도로 한 번만 그려 두는 렌더 캐시."""
+
+import pygame
+
+from core.simulation import LINE_SIZE, ROAD_EDGE_WIDTH, TrackTheme
+from systems.viewport import Viewport
+
+
+class BackgroundCache:
+    """배경은 논리 레이아웃을 뷰포트로 옮겨 물리 해상도에서 직접 그린다(확대한 비트맵이 아니다)."""
+
+    def __init__(self, viewport: Viewport, edge_width: int = ROAD_EDGE_WIDTH):
+        self.viewport = viewport
+        self.size = viewport.physical_size
+        self.edge_width = edge_width
+        self._backgrounds: dict[TrackTheme, pygame.Surface] = {}
+        self._line_sprites: dict[TrackTheme, pygame.Surface] = {}
+        self._hazard_sprites: dict[tuple[int, int], pygame.Surface] = {}
+
+    def background(self, theme: TrackTheme) -> pygame.Surface:
+        surface = self._backgrounds.get(theme)
+        if surface is None:
+            viewport = self.viewport
+            width, height = viewport.logical_size
+            surface = pygame.Surface(self.size).convert()
+            surface.fill(theme.bg_color)
+            pygame.draw.rect(surface, theme.edge_color, viewport.rect(0, 0, self.edge_width, height))
+            pygame.draw.rect(surface, theme.edge_color, viewport.rect(width - self.edge_width, 0, self.edge_width, height))
+            pygame.draw.rect(surface, theme.road_color, viewport.rect(self.edge_width, 0, width - self.edge_width * 2, height))
+            self._backgrounds[theme] = surface
+        return surface
+
+    def line_sprite(self, theme: TrackTheme) -> pygame.Surface:
+        sprite = self._line_sprites.get(theme)
+        if sprite is None:
+            sprite = pygame.Surface(self.viewport.size(*LINE_SIZE)).convert()
+            sprite.fill(theme.line_color)
+            self._line_sprites[theme] = sprite
+        return sprite
+
+    def hazard_sprite(self, size: tuple[int, int]) -> pygame.Surface:
+        """트랙 장애물(공사 바리케이드) 스프라이트. 주황/검정 사선 줄무늬. size는 논리 크기다."""
+        sprite = self._hazard_sprites.get(size)
+        if sprite is None:
+            length = self.viewport.length
+            width, height = self.viewport.size(*size)
+            stripe, step, border = length(8), length(16), length(2)
+            sprite = pygame.Surface((width, height)).convert()
+            sprite.fill((255, 140, 0))
+            for x in range(-height, width, step):
+                pygame.draw.polygon(sprite, (25, 25, 25), [(x, height), (x + stripe, height), (x + stripe + height, 0), (x + height, 0)])
+            pygame.draw.rect(sprite, (25, 25, 25), sprite.get_rect(), border)
+            self._hazard_sprites[size] = sprite
+        return sprite
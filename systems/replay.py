@@ -0,0 +1,240 @@
+"""틱 입력 + 시드를 압축 바이너리로 기록/재생하는 리플레이 시스템.
+
+파일 구조 (리틀 엔디언)::
+
+    헤더   b"CRRP" | version u8 | config fingerprint u32
+    ROUND  0x01 | seed u64 | vehicle u8
+    RUN    0x02 | flags u8 | count varint     같은 입력이 count 틱 연속
+    END    0x03 | ticks u32 | score u32       라운드 종료(검증용)
+
+레코드를 순서대로 흘려 쓰고 읽으므로 긴 세션도 메모리 사용량이 일정하다.
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional
+
+from config import DISPLAY, TRACK
+from core.simulation import TRACK_THEMES, VEHICLES, RaceSimulation, RoundResult, TickInput
+from systems.config_profile import DEFAULT_PROFILE, ConfigProfile
+
+MAGIC = b"CRRP"
+VERSION = 1
+
+TAG_ROUND = 0x01
+TAG_RUN = 0x02
+TAG_END = 0x03
+
+FLAG_LEFT = 1
+FLAG_RIGHT = 2
+FLAG_BOOST = 4
+FLAG_SWIPE_RIGHT = 8
+FLAG_SWIPE_LEFT = 16
+
+HEADER = struct.Struct("<4sBI")
+ROUND = struct.Struct("<QB")
+END = struct.Struct("<II")
+
+
+class ReplayFormatError(ValueError):
+    pass
+
+
+def config_fingerprint(profile: ConfigProfile = DEFAULT_PROFILE) -> int:
+    """리플레이가 같은 규칙으로 재현되는지 확인하기 위한 밸런스 설정 해시."""
+    rules = (profile.balance, profile.items, TRACK, profile.ai_profile, DISPLAY.fps)
+    if (profile.vehicles, profile.track_themes) != (VEHICLES, TRACK_THEMES):
+        rules += (profile.vehicles, profile.track_themes)  # 기본 표는 넣지 않아 이전 리플레이와 해시가 같다.
+    return zlib.crc32(repr(rules).encode("utf-8"))
+
+
+def encode_input(tick_input: TickInput) -> int:
+    flags = 0
+    if tick_input.left:
+        flags |= FLAG_LEFT
+    if tick_input.right:
+        flags |= FLAG_RIGHT
+    if tick_input.boost:
+        flags |= FLAG_BOOST
+    if tick_input.swipe > 0:
+        flags |= FLAG_SWIPE_RIGHT
+    elif tick_input.swipe < 0:
+        flags |= FLAG_SWIPE_LEFT
+    return flags
+
+
+def decode_input(flags: int) -> TickInput:
+    swipe = 1 if flags & FLAG_SWIPE_RIGHT else (-1 if flags & FLAG_SWIPE_LEFT else 0)
+    return TickInput(
+        left=bool(flags & FLAG_LEFT),
+        right=bool(flags & FLAG_RIGHT),
+        boost=bool(flags & FLAG_BOOST),
+        swipe=swipe,
+    )
+
+
+def _write_varint(file: BinaryIO, value: int):
+    while value >= 0x80:
+        file.write(bytes((value & 0x7F | 0x80,)))
+        value >>= 7
+    file.write(bytes((value,)))
+
+
+def _read_varint(file: BinaryIO) -> int:
+    value = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            raise EOFError
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+class ReplayWriter:
+    """틱 입력을 런 길이로 묶어 파일에 바로 흘려 쓴다. 라운드가 끝날 때마다 flush한다."""
+
+    def __init__(self, path: str, profile: ConfigProfile = DEFAULT_PROFILE):
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, config_fingerprint(profile)))
+        self._flags: Optional[int] = None
+        self._count = 0
+
+    def begin_round(self, seed: int, vehicle_idx: int):
+        self._flush_run()
+        self.file.write(bytes((TAG_ROUND,)) + ROUND.pack(seed, vehicle_idx))
+
+    def record(self, tick_input: TickInput):
+        flags = encode_input(tick_input)
+        if flags != self._flags:
+            self._flush_run()
+            self._flags = flags
+        self._count += 1
+
+    def end_round(self, ticks: int, score: int):
+        self._flush_run()
+        self.file.write(bytes((TAG_END,)) + END.pack(ticks, score))
+        self.file.flush()
+
+    def _flush_run(self):
+        if self._count:
+            self.file.write(bytes((TAG_RUN, self._flags)))
+            _write_varint(self.file, self._count)
+        self._flags = None
+        self._count = 0
+
+    def close(self):
+        if not self.file.closed:
+            self._flush_run()
+            self.file.close()
+
+
+class _RecordStream:
+    """레코드 이터레이터에 한 개짜리 되돌리기(push back)를 더한 것."""
+
+    def __init__(self, records: Iterator[tuple]):
+        self._records = records
+        self._pushed: Optional[tuple] = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple:
+        if self._pushed is not None:
+            record, self._pushed = self._pushed, None
+            return record
+        return next(self._records)
+
+    def push_back(self, record: tuple):
+        self._pushed = record
+
+
+class ReplayRound:
+    def __init__(self, seed: int, vehicle_idx: int, records: _RecordStream):
+        self.seed = seed
+        self.vehicle_idx = vehicle_idx
+        self.expected_ticks: Optional[int] = None
+        self.expected_score: Optional[int] = None
+        self._records = records
+
+    def inputs(self) -> Iterator[TickInput]:
+        """이 라운드의 틱 입력을 순서대로 흘려 준다. END(또는 파일 끝)에서 멈춘다."""
+        for record in self._records:
+            if record[0] == TAG_RUN:
+                tick_input = decode_input(record[1])
+                for _ in range(record[2]):
+                    yield tick_input
+            elif record[0] == TAG_END:
+                self.expected_ticks, self.expected_score = record[1], record[2]
+                return
+            else:
+                self._records.push_back(record)  # END 없이 다음 라운드가 시작됨
+                return
+
+
+class ReplayReader:
+    def __init__(self, path: str, check_config: bool = True, profile: ConfigProfile = DEFAULT_PROFILE):
+        self.path = path
+        self.check_config = check_config
+        self.profile = profile
+
+    def _records(self, file: BinaryIO) -> Iterator[tuple]:
+        while True:
+            tag = file.read(1)
+            if not tag:
+                return
+            try:
+                if tag[0] == TAG_RUN:
+                    flags = file.read(1)
+                    if not flags:
+                        return
+                    yield TAG_RUN, flags[0], _read_varint(file)
+                elif tag[0] == TAG_ROUND:
+                    yield (TAG_ROUND, *ROUND.unpack(file.read(ROUND.size)))
+                elif tag[0] == TAG_END:
+                    yield (TAG_END, *END.unpack(file.read(END.size)))
+                else:
+                    raise ReplayFormatError(f"알 수 없는 레코드 태그: {tag[0]:#x}")
+            except (EOFError, struct.error):
+                return  # 기록 도중 종료된 파일의 잘린 마지막 레코드
+
+    def rounds(self) -> Iterator[ReplayRound]:
+        with open(self.path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ReplayFormatError("리플레이 헤더가 없습니다.")
+            magic, version, fingerprint = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ReplayFormatError(f"지원하지 않는 리플레이 파일입니다: {self.path}")
+            if self.check_config and fingerprint != config_fingerprint(self.profile):
+                raise ReplayFormatError(f"리플레이를 기록한 밸런스 설정이 현재 프로필({self.profile.name})과 다릅니다.")
+
+            records = _RecordStream(self._records(file))
+            for record in records:
+                if record[0] == TAG_ROUND:
+                    yield ReplayRound(record[1], record[2], records)
+
+
+@dataclass(frozen=True)
+class ReplayCheck:
+    result: RoundResult
+    expected_ticks: Optional[int]
+    expected_score: Optional[int]
+
+    @property
+    def matches(self) -> bool:
+        if self.expected_ticks is None:
+            return True
+        return (self.result.ticks, self.result.score) == (self.expected_ticks, self.expected_score)
+
+
+def replay_headless(path: str, profile: ConfigProfile = DEFAULT_PROFILE) -> Iterator[ReplayCheck]:
+    """창 없이 최대 속도로 재시뮬레이션하고 기록된 종료 틱/점수와 비교한다."""
+    for replay_round in ReplayReader(path, profile=profile).rounds():
+        sim = RaceSimulation(replay_round.seed, replay_round.vehicle_idx, track=TRACK, **profile.simulation_options())
+        for tick_input in replay_round.inputs():
+            sim.step(tick_input)
+        yield ReplayCheck(sim.result(), replay_round.expected_ticks, replay_round.expected_score)
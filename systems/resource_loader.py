@@ -1,35 +1,136 @@
-"""에셋 경로/로드를 일원화하는 리소스 로더."""
+"""에셋 경로/로드를 일원화하는 리소스 로더 (스케일 결과 디스크 캐시, 지연 로딩 효과음)."""
 
+import hashlib
 import os
+import struct
+import threading
+from typing import Iterable, Optional
+
 import pygame
 
+from systems.sprite_batch import display_format
+
+# 캐시 파일 헤더: 원본 mtime(ns), 너비, 높이. 그 뒤에 RGBA 픽셀이 이어진다.
+CACHE_HEADER = struct.Struct("<qII")
+
+
+class LazySound:
+    """처음 재생(또는 preload)할 때 디코딩하는 효과음. pygame.mixer.Sound처럼 play()로 쓴다."""
+
+    def __init__(self, path: str, volume: float = 1.0):
+        self.path = path
+        self.volume = volume
+        self._sound: Optional[pygame.mixer.Sound] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._sound is not None
+
+    def load(self) -> pygame.mixer.Sound:
+        with self._lock:
+            if self._sound is None:
+                sound = pygame.mixer.Sound(self.path)
+                sound.set_volume(self.volume)
+                self._sound = sound
+            return self._sound
+
+    def play(self):
+        return self.load().play()
+
 
 class ResourceLoader:
-    def __init__(self, base_path: str = "."):
+    def __init__(self, base_path: str = ".", cache_dir: Optional[str] = None):
         self.base_path = base_path
+        self.cache_dir = cache_dir
+        self._preload_thread: Optional[threading.Thread] = None
 
     def _resolve(self, path: str) -> str:
         return os.path.join(self.base_path, path)
 
+    def _cache_path(self, full_path: str, size: tuple[int, int]) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = f"{os.path.abspath(full_path)}|{size[0]}x{size[1]}".encode("utf-8")
+        return os.path.join(self.cache_dir, hashlib.sha1(key).hexdigest() + ".rgba")
+
+    def _read_cached(self, cache_path: str, mtime_ns: int, size: tuple[int, int]) -> Optional[pygame.Surface]:
+        try:
+            with open(cache_path, "rb") as file:
+                header = file.read(CACHE_HEADER.size)
+                pixels = file.read()
+        except OSError:
+            return None
+        if len(header) < CACHE_HEADER.size or CACHE_HEADER.unpack(header) != (mtime_ns, *size):
+            return None  # 원본이 바뀌었거나 잘린 캐시 파일
+        if len(pixels) != size[0] * size[1] * 4:
+            return None
+        return pygame.image.frombuffer(pixels, size, "RGBA").convert_alpha()
+
+    def _write_cached(self, cache_path: str, mtime_ns: int, surface: pygame.Surface):
+        temp_path = f"{cache_path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, "wb") as file:
+                file.write(CACHE_HEADER.pack(mtime_ns, *surface.get_size()))
+                file.write(pygame.image.tobytes(surface, "RGBA"))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass  # 캐시는 최적화일 뿐이므로 쓰기 실패는 무시한다.
+
     def load_image(self, path: str, size: tuple[int, int], fallback_color: tuple[int, int, int]) -> pygame.Surface:
+        """스케일/변환된 서피스를 (경로, 크기, mtime) 기준 디스크 캐시에서 읽고, 없으면 만들어 저장한다."""
         full_path = self._resolve(path)
         if os.path.exists(full_path):
+            cache_path = self._cache_path(full_path, size)
+            mtime_ns = os.stat(full_path).st_mtime_ns
+            if cache_path:
+                cached = self._read_cached(cache_path, mtime_ns, size)
+                if cached is not None:
+                    return cached
+
             image = pygame.image.load(full_path).convert_alpha()
-            return pygame.transform.smoothscale(image, size)
+            surface = pygame.transform.smoothscale(image, size)
+            if cache_path:
+                self._write_cached(cache_path, mtime_ns, surface)
+            return surface
 
         surface = pygame.Surface(size, pygame.SRCALPHA)
         surface.fill(fallback_color)
-        return surface
+        return display_format(surface)
 
-    def load_sound(self, path: str, volume: float = 1.0):
+    def load_sound(self, path: str, volume: float = 1.0, lazy: bool = False):
         full_path = self._resolve(path)
         if not os.path.exists(full_path):
             return None
 
+        if lazy:
+            return LazySound(full_path, volume)
+
         sound = pygame.mixer.Sound(full_path)
         sound.set_volume(volume)
         return sound
 
+    def preload(self, sounds: Iterable[Optional[LazySound]]):
+        """지연 효과음을 백그라운드 스레드에서 미리 디코딩한다. 먼저 재생되면 그 자리에서 불러온다."""
+        pending = [sound for sound in sounds if isinstance(sound, LazySound) and not sound.loaded]
+        if not pending:
+            return
+
+        def run():
+            for sound in pending:
+                try:
+                    sound.load()
+                except pygame.error:
+                    pass  # 재생 시점에 다시 시도한다.
+
+        self._preload_thread = threading.Thread(target=run, name="asset-preload", daemon=True)
+        self._preload_thread.start()
+
+    def wait_preload(self, timeout: Optional[float] = None):
+        if self._preload_thread is not None:
+            self._preload_thread.join(timeout)
+
     def load_bgm(self, path: str, volume: float = 0.5) -> bool:
         full_path = self._resolve(path)
         if not os.path.exists(full_path):
@@ -1,33 +1,155 @@
-"""최고 점수 저장/불러오기 시스템."""
+"""최고 점수/리더보드 저장 시스템.
 
+점수는 메모리에서 바로 갱신하고, 파일 쓰기는 백그라운드 스레드가 임시 파일 + rename으로
+원자적으로 처리하므로 게임오버 순간 게임 스레드가 디스크를 기다리지 않는다.
+"""
+
+import bisect
 import json
 import os
+import threading
+import time
+from typing import Optional
+
+
+class Leaderboard:
+    """점수 내림차순 상위 N개. 음수 점수 배열을 인덱스로 두어 순위를 이분 탐색으로 찾는다."""
+
+    def __init__(self, size: int, entries: Optional[list] = None):
+        self.size = size
+        self.entries: list[list[int]] = []
+        self._neg_scores: list[int] = []
+        for score, timestamp in sorted(entries or [], key=lambda entry: -entry[0])[:size]:
+            self.entries.append([int(score), int(timestamp)])
+            self._neg_scores.append(-int(score))
+
+    def rank_of(self, score: int) -> int:
+        """score가 들어갈 1부터 시작하는 순위(동점이면 기존 기록 뒤)."""
+        return bisect.bisect_right(self._neg_scores, -score) + 1
+
+    def submit(self, score: int, timestamp: int) -> Optional[int]:
+        rank = self.rank_of(score)
+        if rank > self.size:
+            return None
+        self._neg_scores.insert(rank - 1, -score)
+        self.entries.insert(rank - 1, [score, timestamp])
+        del self._neg_scores[self.size :]
+        del self.entries[self.size :]
+        return rank
 
 
 class SaveSystem:
-    def __init__(self, highscore_file: str):
+    def __init__(self, highscore_file: str, leaderboard_size: int = 10, max_boards: int = 64):
         self.highscore_file = highscore_file
+        self.leaderboard_size = leaderboard_size
+        self.max_boards = max_boards
 
-    def load_highscore(self) -> int:
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._dirty = False
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+
+        self.highscore = 0
+        self.boards: dict[str, Leaderboard] = {}
+        self._load()
+
+    @staticmethod
+    def board_key(vehicle: str, theme: str) -> str:
+        return f"{vehicle}|{theme}"
+
+    def _load(self):
         if not os.path.exists(self.highscore_file):
-            return 0
+            return
 
         try:
             with open(self.highscore_file, "r", encoding="utf-8") as file:
                 data = json.load(file)
-                return int(data.get("highscore", 0))
-        except (OSError, ValueError, json.JSONDecodeError):
-            return 0
+            self.highscore = int(data.get("highscore", 0))
+            for key, entries in data.get("leaderboards", {}).items():
+                self.boards[key] = Leaderboard(self.leaderboard_size, entries)
+        except (OSError, ValueError, TypeError, AttributeError, json.JSONDecodeError):
+            self.highscore = 0
+            self.boards = {}
+
+    def load_highscore(self) -> int:
+        return self.highscore
 
     def update_highscore(self, score: int) -> int:
-        highscore = self.load_highscore()
-        if score <= highscore:
-            return highscore
+        with self._lock:
+            if score > self.highscore:
+                self.highscore = score
+                self._request_save()
+            return self.highscore
+
+    def submit_score(self, score: int, vehicle: str, theme: str) -> Optional[int]:
+        """점수를 기록하고 해당 차량/트랙 리더보드 순위를 돌려준다(상위 N 밖이면 None)."""
+        key = self.board_key(vehicle, theme)
+        with self._lock:
+            board = self.boards.pop(key, None) or Leaderboard(self.leaderboard_size)
+            self.boards[key] = board  # 최근에 갱신한 보드를 뒤로 보내 LRU로 개수를 제한
+            if len(self.boards) > self.max_boards:
+                del self.boards[next(iter(self.boards))]
+
+            rank = board.submit(score, int(time.time()))
+            self.highscore = max(self.highscore, score)
+            if rank is not None or score == self.highscore:
+                self._request_save()
+            return rank
+
+    def leaderboard(self, vehicle: str, theme: str) -> list[list[int]]:
+        with self._lock:
+            board = self.boards.get(self.board_key(vehicle, theme))
+            return [list(entry) for entry in board.entries] if board else []
+
+    def rank_of(self, score: int, vehicle: str, theme: str) -> int:
+        with self._lock:
+            board = self.boards.get(self.board_key(vehicle, theme))
+            return board.rank_of(score) if board else 1
+
+    def _request_save(self):
+        self._dirty = True
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="save-writer", daemon=True)
+            self._writer.start()
+        self._wake.notify()
+
+    def _snapshot(self) -> str:
+        return json.dumps(
+            {
+                "highscore": self.highscore,
+                "leaderboards": {key: board.entries for key, board in self.boards.items()},
+            },
+            ensure_ascii=False,
+        )
+
+    def _writer_loop(self):
+        while True:
+            with self._lock:
+                while not self._dirty and not self._closed:
+                    self._wake.wait()
+                if not self._dirty:
+                    return
+                payload = self._snapshot()
+                self._dirty = False
+            self._write_atomic(payload)
 
+    def _write_atomic(self, payload: str):
+        temp_file = f"{self.highscore_file}.tmp"
         try:
-            with open(self.highscore_file, "w", encoding="utf-8") as file:
-                json.dump({"highscore": score}, file)
+            with open(temp_file, "w", encoding="utf-8") as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_file, self.highscore_file)
         except OSError:
-            return highscore
+            pass
 
-        return score
+    def close(self, timeout: float = 2.0):
+        """남은 저장을 마치고 쓰기 스레드를 정리한다."""
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+            writer = self._writer
+        if writer is not None:
+            writer.join(timeout)
@@ -0,0 +1,75 @@
+"""레이어별로 모은 스프라이트를 Surface.blits 한 번으로 그리는 배치와, 매 프레임 draw 호출 대신 쓰는 미리 구운 스프라이트."""
+
+from itertools import chain
+from typing import Iterable
+
+import pygame
+
+# 아래 레이어부터 그린다. 같은 레이어 안에서는 넣은 순서대로다.
+LAYER_HAZARD = 0
+LAYER_ITEM = 1
+LAYER_AURA = 2
+LAYER_ENEMY = 3
+LAYER_CAR = 4
+LAYER_CONTROLS = 5
+LAYER_COUNT = 6
+
+
+def display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """디스플레이 픽셀 형식으로 바꾼다. 형식이 같아야 blit이 픽셀마다 변환하지 않는다(디스플레이가 없으면 그대로)."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+class SpriteBatch:
+    """프레임 동안 (서피스, 위치)를 레이어 버킷에 모았다가 flush에서 레이어 순서로 한 번에 그린다."""
+
+    def __init__(self, layer_count: int = LAYER_COUNT):
+        self._layers: list[list] = [[] for _ in range(layer_count)]
+
+    def add(self, layer: int, surface: pygame.Surface, pos):
+        self._layers[layer].append((surface, pos))
+
+    def extend(self, layer: int, surface: pygame.Surface, positions: Iterable):
+        self._layers[layer].extend((surface, pos) for pos in positions)
+
+    def flush(self, target: pygame.Surface) -> list[pygame.Rect]:
+        """모은 스프라이트를 그리고 비운다. 그린 사각형을 돌려준다(더티 렉트용)."""
+        sequence = list(chain.from_iterable(self._layers))
+        for layer in self._layers:
+            layer.clear()
+        return target.blits(sequence) if sequence else []
+
+
+class SpriteCache:
+    """모양/색/크기별로 한 번만 그려 디스플레이 형식으로 바꿔 둔 스프라이트."""
+
+    def __init__(self):
+        self._sprites: dict[tuple, pygame.Surface] = {}
+
+    def ellipse(self, size: tuple[int, int], color, width: int = 0) -> pygame.Surface:
+        key = ("ellipse", size, color, width)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, color, sprite.get_rect(), width)
+            sprite = self._sprites[key] = display_format(sprite)
+        return sprite
+
+    def button(self, size: tuple[int, int], color, label: pygame.Surface, label_offset: tuple[int, int], radius: int = 8) -> pygame.Surface:
+        """둥근 모서리 버튼에 라벨을 얹어 구운 것. 라벨 서피스가 같으면 같은 스프라이트다."""
+        key = ("button", size, color, label, label_offset, radius)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(sprite, color, sprite.get_rect(), border_radius=radius)
+            sprite.blit(label, label_offset)
+            sprite = self._sprites[key] = display_format(sprite)
+        return sprite
+
+    def clear(self):
+        self._sprites.clear()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
@@ -0,0 +1,359 @@
+"""라운드 이벤트 텔레메트리: 고정 크기 링 버퍼, 백그라운드 압축 로그 기록기, 오프라인 집계기.
+
+게임 스레드는 emit()으로 미리 잡아 둔 배열 칸에 정수 다섯 개를 쓰고 head만 올린다(잠금/객체 생성 없음).
+기록 스레드가 flush_seconds마다 쌓인 구간을 열 단위 바이트로 떼어 gzip 파일에 배치로 붙인다.
+버퍼가 차면(디스크가 느리면) 새 이벤트는 버리고 dropped만 센다. 게임 스레드는 기다리지 않는다.
+
+파일 구조 (gzip 안, 리틀 엔디언)::
+
+    헤더   b"CRTL" | version u8 | session u64 | cabinet 길이 u8 | cabinet utf-8
+    배치   count u32 | dropped u32 | kind u8*count | round u32*count | tick u32*count | a i64*count | b i64*count
+
+dropped는 이 배치 직전까지 버려진 이벤트 수다. 파일은 rotate_bytes마다 바뀌고 max_files개만 남는다.
+
+    python telemetry_report.py telemetry/*.tlm.gz [--json]
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from typing import Iterable, Iterator, Optional
+
+from core.events import (
+    CAUSE_NAMES,
+    EVENT_BOOST,
+    EVENT_DEATH,
+    EVENT_LANE_CHANGE,
+    EVENT_MISSION,
+    EVENT_NEAR_MISS,
+    EVENT_ROUND_END,
+    EVENT_ROUND_START,
+    EVENT_SHIELD_BLOCK,
+    EVENT_SHIELD_PICKUP,
+    MISSION_TYPES,
+)
+
+MAGIC = b"CRTL"
+VERSION = 1
+HEADER = struct.Struct("<4sBQB")
+BATCH = struct.Struct("<II")
+
+BIG_ENDIAN = sys.byteorder == "big"  # 파일은 항상 리틀 엔디언으로 쓴다.
+COLUMNS = (("B", "kinds"), ("I", "rounds"), ("I", "ticks"), ("q", "a"), ("q", "b"))
+
+
+class EventRing:
+    """단일 생산자(게임 스레드)/단일 소비자(기록 스레드) 링 버퍼. 열마다 미리 잡은 array를 쓴다.
+
+    생산자는 칸을 다 쓴 뒤 head를, 소비자는 읽은 뒤 tail을 올리므로 잠금이 필요 없다.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity는 2의 거듭제곱이어야 합니다.")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.kinds = array("B", bytes(capacity))
+        self.rounds = array("I", bytes(4 * capacity))
+        self.ticks = array("I", bytes(4 * capacity))
+        self.a = array("q", bytes(8 * capacity))
+        self.b = array("q", bytes(8 * capacity))
+        self.head = 0
+        self.tail = 0
+        self.round = 0
+        self.dropped = 0
+
+    def emit(self, kind: int, tick: int, a: int = 0, b: int = 0):
+        head = self.head
+        if head - self.tail >= self.capacity:
+            self.dropped += 1
+            return
+        idx = head & self.mask
+        self.kinds[idx] = kind
+        self.rounds[idx] = self.round
+        self.ticks[idx] = tick
+        self.a[idx] = a
+        self.b[idx] = b
+        self.head = head + 1
+
+    def drain(self) -> tuple[int, bytes]:
+        """쌓인 이벤트를 열 순서로 이은 바이트로 떼어 내고 (개수, 바이트)를 돌려준다."""
+        tail, head = self.tail, self.head
+        count = head - tail
+        if not count:
+            return 0, b""
+        start = tail & self.mask
+        end = start + count
+        chunks = []
+        for _, name in COLUMNS:
+            column = getattr(self, name)
+            part = column[start:end] if end <= self.capacity else column[start:] + column[: end - self.capacity]
+            if BIG_ENDIAN:
+                part.byteswap()
+            chunks.append(part.tobytes())
+        self.tail = head
+        return count, b"".join(chunks)
+
+
+class TelemetryLog:
+    """게임이 쓰는 텔레메트리 창구. emit은 링 버퍼로 바로 가고 파일 쓰기는 기록 스레드가 한다."""
+
+    def __init__(
+        self,
+        directory: str,
+        capacity: int = 8192,
+        flush_seconds: float = 1.0,
+        rotate_bytes: int = 1 << 20,
+        max_files: int = 50,
+        cabinet: str = "",
+    ):
+        self.directory = directory
+        self.flush_seconds = flush_seconds
+        self.rotate_bytes = rotate_bytes
+        self.max_files = max_files
+        self.cabinet = (cabinet or socket.gethostname())[:255]
+        self.session = time.time_ns() // 1000
+        self.ring = EventRing(capacity)
+        self.emit = self.ring.emit
+        self.round_open = False
+
+        self._file: Optional[gzip.GzipFile] = None
+        self._path: Optional[str] = None
+        self._sequence = 0
+        self._file_bytes = 0
+        self._reported_drops = 0
+        self.batches = 0
+        self.bytes_written = 0
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._writer.start()
+
+    def begin_round(self, seed: int, vehicle_idx: int):
+        """새 라운드 번호를 연다. 앞 라운드를 end_round 없이 버렸다면 집계에서 미완료 라운드로 남는다."""
+        self.ring.round += 1
+        self.emit(EVENT_ROUND_START, 0, seed, vehicle_idx)
+        self.round_open = True
+
+    def end_round(self, ticks: int, score: int, crashed: bool):
+        """라운드가 열려 있을 때만 종료 이벤트를 남긴다(게임오버 뒤 다시 시작해도 한 번만)."""
+        if self.round_open:
+            self.emit(EVENT_ROUND_END, ticks, score, int(crashed))
+            self.round_open = False
+
+    def _run(self):
+        while not self._stop.wait(self.flush_seconds):
+            self.write_batch()
+        self.write_batch()
+        self._close_file()
+
+    def write_batch(self) -> int:
+        """기록 스레드에서 호출. 쌓인 이벤트를 한 배치로 쓰고 쓴 개수를 돌려준다."""
+        ring = self.ring
+        count, payload = ring.drain()
+        dropped = ring.dropped - self._reported_drops
+        if not count and not dropped:
+            return 0
+        self._reported_drops += dropped
+        try:
+            if self._file is None:
+                self._open_file()
+            data = BATCH.pack(count, dropped) + payload
+            self._file.write(data)
+            self._file.flush()
+        except OSError:
+            self._close_file()  # 디스크 오류는 이 배치만 잃고 다음 배치에서 새 파일로 다시 시도한다.
+            return 0
+        self.batches += 1
+        self.bytes_written += len(data)
+        self._file_bytes += len(data)
+        if self._file_bytes >= self.rotate_bytes:
+            self._close_file()
+        return count
+
+    def _open_file(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._sequence += 1
+        name = f"events-{self.session}-{self._sequence:04d}.tlm.gz"
+        self._path = os.path.join(self.directory, name)
+        self._file = gzip.GzipFile(self._path + ".part", "wb", compresslevel=6)
+        cabinet = self.cabinet.encode("utf-8")[:255]
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.session, len(cabinet)) + cabinet)
+        self._file_bytes = 0
+
+    def _close_file(self):
+        """다 쓴 파일은 .part를 떼어 집계 대상으로 내놓고, 오래된 파일은 max_files개만 남긴다."""
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+            os.replace(self._path + ".part", self._path)
+        except OSError:
+            pass
+        self._file = None
+        files = sorted(glob.glob(os.path.join(self.directory, "events-*.tlm.gz")))
+        for old in files[: max(0, len(files) - self.max_files)]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def close(self):
+        self._stop.set()
+        self._writer.join()
+
+
+def read_events(path: str) -> Iterator[tuple[int, int, int, int, int, int]]:
+    """로그 파일 하나를 배치 단위로 읽어 (session, kind, round, tick, a, b)를 흘려 준다.
+
+    기록 도중 끊긴 파일(.part 포함)은 읽을 수 있는 데까지만 돌려준다. 버려진 이벤트 수는 dropped 이벤트(kind 0, a=개수)로 알린다.
+    """
+    with gzip.open(path, "rb") as file:
+        try:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return
+            magic, version, session, cabinet_length = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"텔레메트리 로그가 아닙니다: {path}")
+            file.read(cabinet_length)
+            while True:
+                head = file.read(BATCH.size)
+                if len(head) < BATCH.size:
+                    return
+                count, dropped = BATCH.unpack(head)
+                if dropped:
+                    yield session, 0, 0, 0, dropped, 0
+                columns = []
+                for typecode, _ in COLUMNS:
+                    column = array(typecode)
+                    data = file.read(column.itemsize * count)
+                    if len(data) < column.itemsize * count:
+                        return
+                    column.frombytes(data)
+                    if BIG_ENDIAN:
+                        column.byteswap()
+                    columns.append(column)
+                for kind, round_id, tick, a, b in zip(*columns):
+                    yield session, kind, round_id, tick, a, b
+        except (EOFError, zlib.error, gzip.BadGzipFile):
+            return
+
+
+def percentile(sorted_values: list, fraction: float):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class TelemetrySummary:
+    """이벤트를 흘려 넣으면 끝난 라운드만 통계에 더한다. 열린 라운드 수만큼만 메모리를 쓴다."""
+
+    COUNTED = {
+        EVENT_LANE_CHANGE: "lane_changes",
+        EVENT_BOOST: "boosts",
+        EVENT_NEAR_MISS: "near_misses",
+        EVENT_SHIELD_PICKUP: "shield_pickups",
+        EVENT_SHIELD_BLOCK: "shield_blocks",
+    }
+
+    def __init__(self):
+        self.open_rounds: dict[tuple[int, int], dict] = {}
+        self.rounds = 0
+        self.totals = dict.fromkeys(self.COUNTED.values(), 0)
+        self.deaths = dict.fromkeys(CAUSE_NAMES.values(), 0)
+        self.missions = {name: {"completed": 0, "failed": 0} for name in MISSION_TYPES}
+        self.vehicles: dict[int, int] = {}
+        self.ticks: list[int] = []
+        self.scores: list[int] = []
+        self.crashed = 0
+        self.dropped = 0
+        self.events = 0
+
+    def add(self, session: int, kind: int, round_id: int, tick: int, a: int, b: int):
+        self.events += 1
+        if kind == 0:
+            self.dropped += a
+            return
+        key = (session, round_id)
+        if kind == EVENT_ROUND_START:
+            self.open_rounds[key] = dict.fromkeys(self.COUNTED.values(), 0)
+            self.vehicles[b] = self.vehicles.get(b, 0) + 1
+            return
+        stats = self.open_rounds.get(key)
+        if stats is None:
+            return  # 시작이 앞 파일과 함께 지워진 라운드
+        counter = self.COUNTED.get(kind)
+        if counter:
+            stats[counter] += 1
+        elif kind == EVENT_MISSION and 0 <= a < len(MISSION_TYPES):
+            self.missions[MISSION_TYPES[a]]["completed" if b else "failed"] += 1
+        elif kind == EVENT_DEATH:
+            name = CAUSE_NAMES.get(a)
+            if name:
+                self.deaths[name] += 1
+        elif kind == EVENT_ROUND_END:
+            del self.open_rounds[key]
+            self.rounds += 1
+            self.crashed += b
+            self.ticks.append(tick)
+            self.scores.append(a)
+            for name, value in stats.items():
+                self.totals[name] += value
+
+    def result(self) -> dict:
+        rounds = self.rounds or 1
+        ticks = sorted(self.ticks)
+        scores = sorted(self.scores)
+        return {
+            "rounds": self.rounds,
+            "unfinished_rounds": len(self.open_rounds),
+            "events": self.events,
+            "dropped_events": self.dropped,
+            "crash_rate": round(self.crashed / rounds, 4),
+            "survival_ticks": {"mean": round(sum(ticks) / rounds, 1), "p50": percentile(ticks, 0.5), "p90": percentile(ticks, 0.9)},
+            "score": {"mean": round(sum(scores) / rounds, 2), "p50": percentile(scores, 0.5), "p90": percentile(scores, 0.9)},
+            "per_round": {name: round(value / rounds, 3) for name, value in self.totals.items()},
+            "deaths": self.deaths,
+            "missions": self.missions,
+            "vehicles": {str(idx): count for idx, count in sorted(self.vehicles.items())},
+        }
+
+
+def summarize(paths: Iterable[str]) -> dict:
+    summary = TelemetrySummary()
+    for path in paths:
+        for event in read_events(path):
+            summary.add(*event)
+    return summary.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="텔레메트리 로그 집계")
+    parser.add_argument("paths", nargs="*", help="로그 파일 (기본: telemetry/*.tlm.gz)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or sorted(glob.glob(os.path.join("telemetry", "*.tlm.gz")))
+    if not paths:
+        print("집계할 로그가 없습니다.", file=sys.stderr)
+        return
+    result = summarize(paths)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+    print(f"파일 {len(paths)}개, 라운드 {result['rounds']}개 (미완료 {result['unfinished_rounds']}), 버려진 이벤트 {result['dropped_events']}")
+    print(f"생존 틱 평균 {result['survival_ticks']['mean']} p50 {result['survival_ticks']['p50']} p90 {result['survival_ticks']['p90']}")
+    print(f"점수 평균 {result['score']['mean']} p50 {result['score']['p50']} p90 {result['score']['p90']}, 충돌 종료 {result['crash_rate']:.1%}")
+    print("라운드당 " + ", ".join(f"{name} {value}" for name, value in result["per_round"].items()))
+    print("사망 원인 " + ", ".join(f"{name} {count}" for name, count in result["deaths"].items()))
+    for name, counts in result["missions"].items():
+        print(f"미션 {name}: 달성 {counts['completed']} 실패 {counts['failed']}")
@@ -0,0 +1,82 @@
+"""HUD 텍스트 렌더 결과를 재사용하는 LRU 캐시와 숫자용 글리프 아틀라스."""
+
+from collections import OrderedDict
+
+import pygame
+
+from systems.sprite_batch import display_format
+
+DIGIT_GLYPHS = "0123456789"
+
+
+class TextCache:
+    """(font, text, color, antialias) 단위로 font.render 결과를 보관한다.
+
+    점수처럼 매 프레임 바뀌는 짧은 문자열은 blit_glyphs로 글자 단위 아틀라스에서 이어 붙여
+    LRU를 오염시키지 않는다. hits/misses/evictions로 캐시 크기를 조정할 수 있다.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._atlases: dict = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, color, antialias)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = display_format(font.render(text, antialias, color))
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def glyph_atlas(self, font: pygame.font.Font, color, antialias: bool = True) -> dict[str, pygame.Surface]:
+        key = (font, color, antialias)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = {char: display_format(font.render(char, antialias, color)) for char in DIGIT_GLYPHS}
+            self._atlases[key] = atlas
+        return atlas
+
+    def blit_glyphs(self, target: pygame.Surface, font: pygame.font.Font, text: str, color, pos, antialias: bool = True) -> pygame.Rect:
+        """text를 글자별 캐시 글리프로 이어 그린다. 처음 보는 글자는 아틀라스에 추가된다."""
+        atlas = self.glyph_atlas(font, color, antialias)
+        x, y = pos
+        batch = []
+        for char in text:
+            glyph = atlas.get(char)
+            if glyph is None:
+                glyph = atlas[char] = display_format(font.render(char, antialias, color))
+            batch.append((glyph, (x, y)))
+            x += glyph.get_width()
+        target.blits(batch, doreturn=False)
+        height = batch[0][0].get_height() if batch else 0
+        return target.get_rect().clip(pygame.Rect(pos[0], y, x - pos[0], height))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "atlas_glyphs": sum(len(atlas) for atlas in self._atlases.values()),
+        }
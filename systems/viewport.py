@@ -0,0 +1,68 @@
+"""논리 좌표(시뮬레이션/레이아웃, DISPLAY.width x height)를 창의 물리 픽셀로 옮기는 뷰포트."""
+
+from typing import Iterable, Optional
+
+import pygame
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """'1080x1920' 형식을 (가로, 세로)로 바꾼다."""
+    width, _, height = text.lower().partition("x")
+    try:
+        size = int(width), int(height)
+    except ValueError:
+        raise ValueError(f"해상도 형식 오류: {text} (예: 720x1280)") from None
+    if min(size) <= 0:
+        raise ValueError(f"해상도는 0보다 커야 합니다: {text}")
+    return size
+
+
+class Viewport:
+    """종횡비를 지키는 균일 배율 + 남는 쪽 레터박스.
+
+    물리 해상도가 논리 해상도와 같으면 identity이고 좌표를 그대로 돌려준다(기본 400x600에서 변환 비용 없음).
+    위치는 내림, 크기는 반올림하므로 같은 논리 좌표는 프레임마다 같은 픽셀에 놓인다.
+    """
+
+    def __init__(self, logical_size: tuple[int, int], physical_size: Optional[tuple[int, int]] = None):
+        self.logical_size = logical_size
+        self.physical_size = physical_size or logical_size
+        self.scale = min(self.physical_size[0] / logical_size[0], self.physical_size[1] / logical_size[1])
+        self.offset_x = (self.physical_size[0] - round(logical_size[0] * self.scale)) // 2
+        self.offset_y = (self.physical_size[1] - round(logical_size[1] * self.scale)) // 2
+        self.identity = self.physical_size == logical_size
+
+    @property
+    def area(self) -> pygame.Rect:
+        """레터박스를 뺀, 논리 화면이 차지하는 물리 사각형."""
+        return pygame.Rect(self.offset_x, self.offset_y, *self.size(*self.logical_size))
+
+    def point(self, x: float, y: float) -> tuple:
+        if self.identity:
+            return x, y
+        return self.offset_x + int(x * self.scale), self.offset_y + int(y * self.scale)
+
+    def points(self, positions: Iterable[tuple[float, float]]) -> list:
+        if self.identity:
+            return positions if isinstance(positions, list) else list(positions)
+        scale, offset_x, offset_y = self.scale, self.offset_x, self.offset_y
+        return [(offset_x + int(x * scale), offset_y + int(y * scale)) for x, y in positions]
+
+    def length(self, value: float) -> int:
+        return value if self.identity else max(1, round(value * self.scale))
+
+    def size(self, width: float, height: float) -> tuple[int, int]:
+        return (width, height) if self.identity else (self.length(width), self.length(height))
+
+    def rect(self, x: float, y: float, width: float, height: float) -> pygame.Rect:
+        return pygame.Rect(self.point(x, y), self.size(width, height))
+
+    def to_logical(self, x: float, y: float) -> tuple[float, float]:
+        """마우스/터치 좌표(물리)를 논리 좌표로 되돌린다."""
+        if self.identity:
+            return x, y
+        return (x - self.offset_x) / self.scale, (y - self.offset_y) / self.scale
+
+    def center_x(self, physical_width: int) -> int:
+        """물리 폭이 physical_width인 것을 논리 화면 가운데에 놓을 물리 x."""
+        return self.offset_x + self.area.width // 2 - physical_width // 2
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from config import BalanceConfig, ItemConfig
+from core.batch import BatchSimulation, dodge_policy as batch_dodge_policy, simulate_batch
+from core.enemy_ai import AI_PROFILES
+from core.simulation import RaceSimulation, TickInput, dodge_policy, simulate_round
+
+
+def test_batch_matches_scalar_with_shared_policy():
+    """같은 시드/차량이면 배치 엔진과 스칼라 엔진의 라운드 결과가 정확히 같다."""
+    seeds = list(range(40))
+    for vehicle_idx in range(3):
+        expected = [simulate_round(seed, vehicle_idx, dodge_policy, 4000) for seed in seeds]
+        assert simulate_batch(seeds, vehicle_idx, batch_dodge_policy, 4000) == expected
+
+
+@pytest.mark.parametrize("difficulty", sorted(AI_PROFILES))
+def test_batch_matches_scalar_per_ai_profile(difficulty):
+    """차선 수/적 수/아이템 주기를 바꾸고 틱별 입력 패턴을 줘도 결과가 같다."""
+    balance = BalanceConfig(enemy_count=6, lane_count=4)
+    items = ItemConfig(shield_spawn_interval_frames=15)
+    ai_profile = AI_PROFILES[difficulty]
+    seeds = list(range(30))
+    vehicles = [seed % 3 for seed in seeds]
+
+    def scripted(frame: int, seed: int) -> TickInput:
+        return TickInput(boost=(frame + seed) % 400 == 3, swipe=((frame + seed) // 45) % 3 - 1 if frame % 45 == 0 else 0)
+
+    expected = []
+    for seed, vehicle_idx in zip(seeds, vehicles):
+        sim = RaceSimulation(seed, vehicle_idx, balance=balance, items=items, ai_profile=ai_profile)
+        while not sim.game_over and sim.frame_counter < 3000:
+            sim.step(scripted(sim.frame_counter, seed))
+        expected.append(sim.result())
+
+    def policy(batch):
+        inputs = [scripted(int(frame), seeds[round_id]) for frame, round_id in zip(batch.frame_counter, batch.round_ids)]
+        return {
+            "left": np.zeros(len(inputs), dtype=bool),
+            "right": np.zeros(len(inputs), dtype=bool),
+            "boost": np.array([tick_input.boost for tick_input in inputs]),
+            "swipe": np.array([tick_input.swipe for tick_input in inputs]),
+        }
+
+    batch = BatchSimulation(seeds, vehicles, balance=balance, items=items, ai_profile=ai_profile)
+    assert batch.run(policy, 3000) == expected
@@ -0,0 +1,41 @@
+import random
+
+from core.collision import CollisionGrid
+
+
+def scatter(grid: CollisionGrid, count: int, seed: int):
+    rng = random.Random(seed)
+    return [grid.add("enemy" if idx % 3 else "shield", rng.uniform(0, 300), rng.uniform(-200, 600), 40, 60) for idx in range(count)]
+
+
+def test_linear_and_banded_queries_agree():
+    """선형 검사와 띠 검사는 같은 콜라이더를 같은 id 순서로 돌려준다."""
+    linear, banded = CollisionGrid(linear_limit=1000), CollisionGrid(linear_limit=0)
+    pairs = list(zip(scatter(linear, 80, 3), scatter(banded, 80, 3)))
+    rng = random.Random(4)
+    for _ in range(50):
+        for left, right in pairs:
+            left.y = right.y = left.y + rng.uniform(-5, 20)
+        linear.refresh()
+        banded.refresh()
+        assert not linear.banded and banded.banded
+        for box in ((100, 300, 50, 80), (0, -50, 300, 100), (0, 0, 1, 1)):
+            for kind in (None, "shield"):
+                expected = [collider.id for collider in linear.query(*box, kind)]
+                assert [collider.id for collider in banded.query(*box, kind)] == expected
+
+
+def test_grid_switches_mode_on_refresh():
+    """개수가 기준을 넘거나 다시 줄면 refresh에서 모드를 바꾸고, 지운 콜라이더는 어느 모드에서도 나오지 않는다."""
+    grid = CollisionGrid(linear_limit=4)
+    colliders = [grid.add("enemy", 0, idx * 10, 10, 10) for idx in range(6)]
+    assert not grid.banded
+    grid.refresh()
+    assert grid.banded
+    grid.remove(colliders[0])
+    grid.remove(colliders[1])
+    grid.refresh()
+    assert not grid.banded and not grid.bands
+    grid.remove(colliders[2])
+    grid.insert(colliders[0])
+    assert [collider.id for collider in grid.query(0, 0, 10, 40)] == [0, 3]
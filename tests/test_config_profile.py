@@ -0,0 +1,67 @@
+import json
+import os
+
+import pytest
+
+from config import BALANCE
+from core.enemy_ai import AI_PROFILES
+from systems.config_profile import DEFAULT_PROFILE, ConfigError, compile_profile, load_profile
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config_profiles")
+
+
+def test_bundled_profile_overrides_only_listed_fields():
+    profile = load_profile(os.path.join(PROFILE_DIR, "arcade_hard.toml"))
+    assert profile.name == "arcade_hard"
+    assert profile.balance.enemy_speed_increase == 0.16
+    assert profile.balance.enemy_count == BALANCE.enemy_count
+    assert [vehicle.name for vehicle in profile.vehicles] == ["Sprint", "Interceptor"]
+    assert profile.ai_profile == AI_PROFILES["hard"]
+    assert profile.track_themes == DEFAULT_PROFILE.track_themes
+
+
+def test_empty_profile_is_default():
+    assert compile_profile({}, "default") == DEFAULT_PROFILE
+
+
+def test_all_errors_are_reported_together():
+    """잘못된 항목을 하나씩이 아니라 한 번에 모두 알린다."""
+    data = {
+        "colors": {},
+        "balance": {"lane_count": 0, "enemy_count": 2.5, "wobble": 1},
+        "items": {"shield_size": -1},
+        "ai": {"difficulty": "insane"},
+        "vehicles": [
+            {"name": "A", "acceleration": 0.3, "max_speed": 8, "handling": 1.2, "color": [0, 0, 0]},
+            {"name": "A", "acceleration": True, "max_speed": 8, "handling": 0.1, "color": [300, 0, 0]},
+        ],
+    }
+    with pytest.raises(ConfigError) as error:
+        compile_profile(data)
+    message = str(error.value)
+    for fragment in (
+        "colors",
+        "balance.lane_count",
+        "balance.enemy_count",
+        "balance.wobble",
+        "items.shield_size",
+        "ai.difficulty",
+        "vehicles[0].handling",
+        "vehicles[1].name",
+        "vehicles[1].acceleration",
+        "vehicles[1].color",
+    ):
+        assert fragment in message
+
+
+def test_load_profile_rejects_bad_files(tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text("{not json", encoding="utf-8")
+    with pytest.raises(ConfigError, match="파싱 실패"):
+        load_profile(str(broken))
+    with pytest.raises(ConfigError, match="지원하지 않는"):
+        load_profile(str(tmp_path / "profile.yaml"))
+
+    valid = tmp_path / "easy.json"
+    valid.write_text(json.dumps({"ai": {"difficulty": "easy"}}), encoding="utf-8")
+    assert load_profile(str(valid)).name == "easy"
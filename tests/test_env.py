@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from core.batch import BatchSimulation
+from core.env import VectorRaceEnv
+
+
+def test_vector_env_reuses_round_slots():
+    """에피소드가 수백 번 끝나도 배치의 라운드별 기록과 활성 배열 크기는 환경 수 그대로다."""
+    env = VectorRaceEnv(4, seed=1, max_ticks=30)
+    env.reset()
+    rng = np.random.default_rng(0)
+    episodes = 0
+    for _ in range(900):
+        _, _, terminated, truncated, info = env.step(rng.integers(0, env.action_count, env.num_envs))
+        episodes += int(terminated.sum() + truncated.sum())
+        assert (info["final_score"][terminated | truncated] >= 0).all()
+
+        batch = env.batch
+        assert len(batch.seeds) == len(batch.vehicle_idx) == len(batch.results) == env.num_envs
+        assert len(batch.rngs) == batch.active_count == env.num_envs
+        assert all(len(getattr(batch, name)) == env.num_envs for name in BatchSimulation.ROUND_FIELDS)
+        assert sorted(env.row_envs().tolist()) == list(range(env.num_envs))
+    assert episodes >= 100
+
+
+def test_add_rounds_rejects_active_round_ids():
+    batch = BatchSimulation([1, 2])
+    with pytest.raises(ValueError):
+        batch.add_rounds([3], round_ids=[0])
@@ -0,0 +1,41 @@
+import random
+
+from core.simulation import RaceSimulation, dodge_policy
+from systems import net_protocol as proto
+
+
+def test_delta_round_trip():
+    """델타는 기준 유무, 음수/큰 차이와 상관없이 값을 그대로 복원하고 읽은 위치를 정확히 돌려준다."""
+    rng = random.Random(0)
+    for count in (1, 7, 8, 9, 40):
+        baseline = [rng.randint(-(1 << 40), 1 << 40) for _ in range(count)]
+        values = [value if rng.random() < 0.5 else value + rng.randint(-70000, 70000) for value in baseline]
+        for base in (baseline, None):
+            data = b"\x99" + proto.encode_delta(values, base) + b"tail"
+            decoded, offset = proto.decode_delta(data, 1, count, base)
+            assert decoded == values
+            assert data[offset:] == b"tail"
+
+
+def test_unchanged_fields_cost_only_the_mask():
+    values = [5, -3, 0, 1 << 20]
+    assert proto.encode_delta(values, values) == b"\x00"
+    assert proto.encode_delta([0] * 9, None) == b"\x00\x00"
+
+
+def test_varint_boundaries():
+    """zigzag varint는 7비트 경계 앞뒤에서 바이트 수가 한 칸씩 늘어난다."""
+    for diff, size in ((63, 1), (64, 2), (-64, 1), (-65, 2), (8191, 2), (8192, 3)):
+        data = proto.encode_delta([diff], [0])
+        assert len(data) == 1 + size
+        assert proto.decode_delta(data, 0, 1, [0]) == ([diff], len(data))
+
+
+def test_snapshot_of_live_round_round_trips():
+    sim = RaceSimulation(3, 1)
+    previous = None
+    while not sim.game_over and sim.frame_counter < 600:
+        sim.step(dodge_policy(sim))
+        state = proto.own_state(sim)
+        assert proto.decode_delta(proto.encode_delta(state, previous), 0, len(state), previous)[0] == state
+        previous = state
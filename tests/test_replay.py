@@ -0,0 +1,37 @@
+import itertools
+
+from core.simulation import RaceSimulation, TickInput, dodge_policy
+from systems.replay import ReplayReader, ReplayWriter, decode_input, encode_input, replay_headless
+
+
+def test_input_flags_round_trip():
+    """리플레이 플래그 바이트는 틱 입력을 그대로 복원한다."""
+    for left, right, boost, swipe in itertools.product((False, True), (False, True), (False, True), (-1, 0, 1)):
+        tick_input = TickInput(left, right, boost, swipe)
+        assert decode_input(encode_input(tick_input)) == tick_input
+
+
+def test_recorded_rounds_replay_exactly(tmp_path):
+    """기록한 라운드를 읽으면 입력이 틱 단위로 같고, 헤드리스 재시뮬레이션이 종료 틱/점수와 맞는다."""
+    path = str(tmp_path / "session.crr")
+    writer = ReplayWriter(path)
+    recorded = []
+    for seed in range(4):
+        sim = RaceSimulation(seed, seed % 3)
+        writer.begin_round(seed, seed % 3)
+        inputs = []
+        while not sim.game_over and sim.frame_counter < 3000:
+            tick_input = dodge_policy(sim)
+            writer.record(tick_input)
+            inputs.append(tick_input)
+            sim.step(tick_input)
+        writer.end_round(sim.frame_counter, sim.score)
+        recorded.append((seed, seed % 3, inputs))
+    writer.close()
+
+    rounds = ReplayReader(path).rounds()
+    for (seed, vehicle_idx, inputs), replay_round in itertools.zip_longest(recorded, rounds):
+        assert (replay_round.seed, replay_round.vehicle_idx) == (seed, vehicle_idx)
+        assert list(replay_round.inputs()) == inputs
+    checks = list(replay_headless(path))
+    assert len(checks) == 4 and all(check.matches for check in checks)
@@ -0,0 +1,37 @@
+import json
+
+from systems.save_system import Leaderboard, SaveSystem
+
+
+def test_rank_places_ties_after_existing_entries():
+    board = Leaderboard(5, [[10, 1], [30, 2], [20, 3]])
+    assert board.entries == [[30, 2], [20, 3], [10, 1]]
+    assert board.rank_of(40) == 1
+    assert board.rank_of(20) == 3
+    assert board.rank_of(0) == 4
+
+
+def test_submit_keeps_top_entries_only():
+    board = Leaderboard(3)
+    assert [board.submit(score, idx) for idx, score in enumerate((5, 9, 7))] == [1, 1, 2]
+    assert board.submit(1, 3) is None
+    assert board.submit(7, 4) == 3
+    assert board.entries == [[9, 1], [7, 2], [7, 4]]
+    assert board.rank_of(8) == 2
+
+
+def test_save_system_persists_boards(tmp_path):
+    path = str(tmp_path / "highscore.json")
+    saves = SaveSystem(path, leaderboard_size=2)
+    assert saves.submit_score(50, "Sprint", "City") == 1
+    assert saves.submit_score(70, "Sprint", "City") == 1
+    assert saves.submit_score(10, "Sprint", "City") is None
+    assert saves.rank_of(60, "Sprint", "City") == 2
+    saves.close()
+
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file)["highscore"] == 70
+    reloaded = SaveSystem(path, leaderboard_size=2)
+    assert [score for score, _ in reloaded.leaderboard("Sprint", "City")] == [70, 50]
+    assert reloaded.load_highscore() == 70
+    reloaded.close()